@@ -0,0 +1,116 @@
+"""
+Pressure Coefficient Plan Benchmark
+===================================
+
+This script compares the time per time step of the pressure coefficient
+slices computed by the numpy engine on a static mesh. Without a plan, the
+sections are cut, ordered, and sorted at every time step. With the plan of
+create_cp_plan(), which is built once, the pressure of every time step is
+gathered at the sorted points with a single sparse matrix product.
+
+Run with ParaView Python, for example:
+
+    pvpython benchmark_cp_plan.py --n_chord 400 --n_span 1000 --n_slices 20 --n_time_steps 50
+"""
+
+# External imports
+import time
+import argparse
+import numpy as np
+
+# Internal imports
+import postprocessing.paraview.cutting as pv_cutting
+import postprocessing.paraview.slices as pv_slices
+
+
+def create_wing(n_chord, n_span):
+    """
+    Create a NACA 0012 wing surface of quadrilateral faces along the z axis,
+    with a blunt trailing edge and a pressure at each point.
+
+    Parameters
+    ----------
+    n_chord : int
+        Number of points around each section.
+    n_span : int
+        Number of points along the span.
+
+    Returns
+    -------
+    dict
+        Surface with the "points", face "connectivity" and "offsets" arrays,
+        and the "cell_arrays" and "point_arrays" dictionaries.
+    """
+    beta = np.linspace(0.0, np.pi, n_chord // 2 + 1)
+    x_c = 0.5 * (1.0 - np.cos(beta))
+    y_t = 0.6 * (0.2969 * np.sqrt(x_c) - 0.126 * x_c - 0.3516 * x_c**2 + 0.2843 * x_c**3 - 0.1015 * x_c**4)
+    coords = np.concatenate((np.stack((x_c[::-1], y_t[::-1]), axis=1), np.stack((x_c[1:], -y_t[1:]), axis=1)))
+    n_chord = np.size(coords, 0)
+    z = np.linspace(0.0, 1.0, n_span)
+    points = np.column_stack((np.tile(coords, (n_span, 1)), np.repeat(z, n_chord)))
+
+    i, j = np.meshgrid(np.arange(n_chord), np.arange(n_span - 1))
+    a = np.ravel(j * n_chord + i)
+    b = np.ravel(j * n_chord + (i + 1) % n_chord)
+    connectivity = np.ravel(np.column_stack((a, b, b + n_chord, a + n_chord)))
+
+    return {
+        "points": points,
+        "connectivity": connectivity,
+        "offsets": np.arange(0, np.size(connectivity) + 1, 4),
+        "cell_arrays": {},
+        "point_arrays": {"p": np.sin(3.0 * points[:, 0]) + points[:, 1]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument("-nc", "--n_chord", help="Number of points around. Default is 400.", type=int, default=400)
+    parser.add_argument("-ns", "--n_span", help="Number of points along. Default is 1000.", type=int, default=1000)
+    parser.add_argument("-sl", "--n_slices", help="Number of slices. Default is 20.", type=int, default=20)
+    parser.add_argument("-nt", "--n_time_steps", help="Number of time steps. Default is 50.", type=int, default=50)
+    args = parser.parse_args()
+
+    surface = create_wing(args.n_chord, args.n_span)
+    normal = np.array([0.0, 0.0, 1.0])
+    lift_direction = np.array([0.0, 1.0, 0.0])
+    drag_direction = np.array([1.0, 0.0, 0.0])
+    x = np.column_stack((np.zeros(args.n_slices), np.zeros(args.n_slices), np.linspace(0.01, 0.99, args.n_slices)))
+    pressures = [(1.0 + 0.1 * k) * surface["point_arrays"]["p"] for k in range(args.n_time_steps)]
+    index = pv_cutting.create_face_index(surface["points"], surface["connectivity"], surface["offsets"], normal)
+
+    # Cut, order, and sort the sections of every time step
+    t_start = time.perf_counter()
+    results = []
+    for pressure in pressures:
+        sections = pv_cutting.cut_sections(surface, x, normal, index)
+        for section in sections:
+            ends = section["ends"]
+            section["p"] = (1.0 - section["weights"]) * pressure[ends[:, 0]] + section["weights"] * pressure[ends[:, 1]]
+        results.append(pv_slices.compute_cp_sections(sections, lift_direction, drag_direction, 1.0, 1.0, 0.0))
+    t_cut = time.perf_counter() - t_start
+    print("{:>12s}: {:8.3f} ms per time step".format("cut", 1e3 * t_cut / args.n_time_steps))
+
+    # Build the plan once and gather the pressure of every time step through it
+    t_start = time.perf_counter()
+    plan = pv_cutting.create_cp_plan(
+        pv_cutting.cut_sections(surface, x, normal, index),
+        lift_direction,
+        drag_direction,
+        np.size(surface["points"], 0),
+    )
+    plan_results = [pv_cutting.apply_cp_plan(plan, pressure, 1.0, 1.0, 0.0) for pressure in pressures]
+    t_plan = time.perf_counter() - t_start
+    print("{:>12s}: {:8.3f} ms per time step".format("plan", 1e3 * t_plan / args.n_time_steps))
+
+    print("Speedup: {:.2f}x".format(t_cut / t_plan))
+    identical = all(
+        np.allclose(coords2D, coords, rtol=1e-12) and np.allclose(cp, plan_cp, rtol=1e-12)
+        for result, plan_result in zip(results, plan_results)
+        for (coords2D, cp), coords, plan_cp in zip(result, plan["coords"], plan_result)
+    )
+    print("Identical outputs: {}".format(identical))
+
+
+if __name__ == "__main__":
+    main()
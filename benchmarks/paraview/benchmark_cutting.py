@@ -0,0 +1,159 @@
+"""
+Cutting Benchmark
+=================
+
+This script compares the time the numpy engine takes to cut a surface with
+and without a face index. Without an index, every edge of the surface is
+checked against each plane. With the spanwise face index of
+create_face_index(), which is built once, only the edges of the faces in the
+buckets holding the planes are checked. The index is timed when cutting the
+stations one at a time, when cutting all uniform stations at once, and with
+adaptive spacing, which cuts a few new stations per refinement pass.
+
+It then compares cutting every time step of a static mesh against building
+the sparse load operator once and applying it to all time steps at once.
+
+Run with a Python with numpy, for example:
+
+    python benchmark_cutting.py --n_chord 400 --n_span 1000 --n_stations 100 --max_stations 1000 --n_time_steps 50
+"""
+
+# External imports
+import time
+import argparse
+import numpy as np
+
+# Internal imports
+import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.cutting as pv_cutting
+
+
+def create_surface(n_chord, n_span):
+    """
+    Create a cylindrical surface of quadrilateral faces along the z axis,
+    with a force per unit area at each point that changes sharply in the
+    middle of the span.
+
+    Parameters
+    ----------
+    n_chord : int
+        Number of points around the surface.
+    n_span : int
+        Number of points along the surface.
+
+    Returns
+    -------
+    dict
+        Surface with the "points", face "connectivity" and "offsets" arrays,
+        and the "cell_arrays" and "point_arrays" dictionaries.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, n_chord, endpoint=False)
+    z = np.linspace(0.0, 1.0, n_span)
+    points = np.column_stack((np.tile(np.cos(theta), n_span), np.tile(np.sin(theta), n_span), np.repeat(z, n_chord)))
+
+    i, j = np.meshgrid(np.arange(n_chord), np.arange(n_span - 1))
+    a = np.ravel(j * n_chord + i)
+    b = np.ravel(j * n_chord + (i + 1) % n_chord)
+    connectivity = np.ravel(np.column_stack((a, b, b + n_chord, a + n_chord)))
+
+    return {
+        "points": points,
+        "connectivity": connectivity,
+        "offsets": np.arange(0, np.size(connectivity) + 1, 4),
+        "cell_arrays": {},
+        "point_arrays": {
+            "forcePerS": np.column_stack((points[:, 1], points[:, 0], 0.0 * points[:, 2]))
+            * (1.5 + 0.5 * np.tanh((points[:, 2:] - 0.5) / 0.02))
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument("-nc", "--n_chord", help="Number of points around. Default is 400.", type=int, default=400)
+    parser.add_argument("-ns", "--n_span", help="Number of points along. Default is 1000.", type=int, default=1000)
+    parser.add_argument("-st", "--n_stations", help="Number of stations. Default is 100.", type=int, default=100)
+    parser.add_argument(
+        "-ms", "--max_stations", help="Maximum stations of adaptive spacing. Default is 1000.", type=int, default=1000
+    )
+    parser.add_argument("-nt", "--n_time_steps", help="Number of time steps. Default is 50.", type=int, default=50)
+    args = parser.parse_args()
+
+    surface = create_surface(args.n_chord, args.n_span)
+    normal = np.array([0.0, 0.0, 1.0])
+    direction = np.array([0.0, 1.0, 0.0])
+    x = np.column_stack(
+        (np.zeros(args.n_stations), np.zeros(args.n_stations), np.linspace(0.01, 0.99, args.n_stations))
+    )
+
+    t_start = time.perf_counter()
+    index = pv_cutting.create_face_index(surface["points"], surface["connectivity"], surface["offsets"], normal)
+    print("{:>12s}: {:8.3f} ms".format("index build", 1e3 * (time.perf_counter() - t_start)))
+
+    # Cut one station at a time, with and without the index
+    results = {}
+    for mode, mode_index in [("full", None), ("indexed", index)]:
+        t_start = time.perf_counter()
+        loads = np.concatenate(
+            [
+                pv_cutting.compute_surface_loads(surface, x[j : j + 1, :], normal, direction, index=mode_index)
+                for j in range(args.n_stations)
+            ]
+        )
+        results[mode] = (time.perf_counter() - t_start, loads)
+        print("{:>12s}: {:8.3f} ms per station".format(mode, 1e3 * results[mode][0] / args.n_stations))
+
+    print("Speedup: {:.2f}x".format(results["full"][0] / results["indexed"][0]))
+    print("Identical outputs: {}".format(np.allclose(results["full"][1], results["indexed"][1], rtol=1e-12)))
+
+    # Cut all uniform stations at once, as every time step of a moving mesh
+    results = {}
+    for mode, mode_index in [("full", None), ("indexed", index)]:
+        t_start = time.perf_counter()
+        loads = pv_cutting.compute_surface_loads(surface, x, normal, direction, index=mode_index)
+        results[mode] = (time.perf_counter() - t_start, loads)
+        print("{:>12s}: {:8.3f} ms for all stations".format(mode, 1e3 * results[mode][0]))
+
+    print("Speedup: {:.2f}x".format(results["full"][0] / results["indexed"][0]))
+    print("Identical outputs: {}".format(np.allclose(results["full"][1], results["indexed"][1], rtol=1e-12)))
+
+    # Refine the stations with adaptive spacing, which cuts the new stations of
+    # each pass
+    results = {}
+    for mode, mode_index in [("full", None), ("indexed", index)]:
+        t_start = time.perf_counter()
+        x_refined, loads = pv_utils.refine_stations(
+            lambda x_new: pv_cutting.compute_surface_loads(surface, x_new, normal, direction, index=mode_index),
+            x,
+            tolerance=0.01,
+            max_stations=args.max_stations,
+        )
+        results[mode] = (time.perf_counter() - t_start, loads)
+        print("{:>12s}: {:8.3f} ms for {} adaptive stations".format(mode, 1e3 * results[mode][0], len(x_refined)))
+
+    print("Speedup: {:.2f}x".format(results["full"][0] / results["indexed"][0]))
+    print("Identical outputs: {}".format(np.allclose(results["full"][1], results["indexed"][1], rtol=1e-12)))
+
+    # Compute all stations of several time steps by cutting each one, or with
+    # the load operator built once, as on a static mesh
+    surfaces = [
+        dict(surface, point_arrays={"forcePerS": (1.0 + 0.1 * k) * surface["point_arrays"]["forcePerS"]})
+        for k in range(args.n_time_steps)
+    ]
+    t_start = time.perf_counter()
+    loads = np.stack([pv_cutting.compute_surface_loads(s, x, normal, direction, index=index) for s in surfaces])
+    t_cut = time.perf_counter() - t_start
+    print("{:>12s}: {:8.3f} ms per time step".format("cut", 1e3 * t_cut / args.n_time_steps))
+
+    t_start = time.perf_counter()
+    operator = pv_cutting.create_load_operator(surface, x, normal, direction, index=index)
+    operator_loads = pv_cutting.apply_load_operator(operator, surfaces)
+    t_operator = time.perf_counter() - t_start
+    print("{:>12s}: {:8.3f} ms per time step".format("operator", 1e3 * t_operator / args.n_time_steps))
+
+    print("Speedup: {:.2f}x".format(t_cut / t_operator))
+    print("Identical outputs: {}".format(np.allclose(loads, operator_loads, rtol=1e-10)))
+
+
+if __name__ == "__main__":
+    main()
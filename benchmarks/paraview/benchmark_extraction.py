@@ -0,0 +1,140 @@
+"""
+Extraction Benchmark
+====================
+
+This script compares two ways of converting a section split into many blocks
+into numpy arrays. The "concatenate" mode grows the point, line, and point
+array arrays with np.concatenate in the block loop, which copies everything
+gathered so far for every block. The "single" mode, used by get_lines(),
+views the arrays of every block without copying and assembles them in a
+single allocation.
+
+Run with a Python with VTK, for example:
+
+    python benchmark_extraction.py --n_blocks 2000 --n_lines 8
+"""
+
+# External imports
+import time
+import argparse
+import numpy as np
+import vtk
+from vtk.util import numpy_support as vtk_np
+
+# Internal imports
+import postprocessing.paraview.utils as pv_utils
+
+
+def create_fragmented_section(n_blocks, n_lines):
+    """
+    Create a circular section split into many polyline blocks, as returned by
+    a slice over a fragmented surface, with a pressure point array.
+
+    Parameters
+    ----------
+    n_blocks : int
+        Number of blocks.
+    n_lines : int
+        Number of line cells per block.
+
+    Returns
+    -------
+    vtkMultiBlockDataSet
+        Section with one block per fragment.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, n_blocks * n_lines + 1)
+    data = vtk.vtkMultiBlockDataSet()
+    for k in range(n_blocks):
+        t = theta[k * n_lines : (k + 1) * n_lines + 1]
+        block = vtk.vtkPolyData()
+        block.SetPoints(vtk.vtkPoints())
+        block.GetPoints().SetData(vtk_np.numpy_to_vtk(np.column_stack((np.cos(t), np.sin(t), 0.0 * t)), deep=True))
+
+        connectivity = np.stack((np.arange(n_lines), np.arange(n_lines) + 1), axis=1).ravel()
+        cells = vtk.vtkCellArray()
+        cells.SetData(
+            vtk_np.numpy_to_vtkIdTypeArray(np.arange(0, 2 * n_lines + 1, 2), deep=True),
+            vtk_np.numpy_to_vtkIdTypeArray(connectivity, deep=True),
+        )
+        block.SetLines(cells)
+
+        pressure = vtk_np.numpy_to_vtk(np.sin(t), deep=True)
+        pressure.SetName("p")
+        block.GetPointData().AddArray(pressure)
+        data.SetBlock(k, block)
+
+    return data
+
+
+def get_lines_concatenate(data, point_arrays):
+    """
+    Convert the line cells of a multiblock section into numpy arrays by
+    concatenating the arrays of every block in turn.
+
+    Parameters
+    ----------
+    data : vtkMultiBlockDataSet
+        Section with one block per fragment.
+    point_arrays : list
+        Names of the point arrays to extract.
+
+    Returns
+    -------
+    ndarray
+        Point coordinates.
+    ndarray
+        Point indices of each line.
+    dict
+        Point arrays, keyed by name.
+    """
+    points = np.zeros((0, 3))
+    lines = np.zeros((0, 2), dtype=int)
+    arrays = {name: np.zeros(0) for name in point_arrays}
+    for k in range(data.GetNumberOfBlocks()):
+        block = data.GetBlock(k)
+        cells = block.GetLines()
+        connectivity = vtk_np.vtk_to_numpy(cells.GetConnectivityArray()).astype(int)
+        block_lines = connectivity.reshape(-1, 2) + np.size(points, 0)
+
+        points = np.concatenate((points, vtk_np.vtk_to_numpy(block.GetPoints().GetData()).astype(float)))
+        lines = np.concatenate((lines, block_lines))
+        for name in point_arrays:
+            values = vtk_np.vtk_to_numpy(block.GetPointData().GetArray(name)).astype(float)
+            arrays[name] = np.concatenate((arrays[name], values))
+
+    return points, lines, arrays
+
+
+def main():
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument("-nb", "--n_blocks", help="Number of blocks. Default is 2000.", type=int, default=2000)
+    parser.add_argument("-nl", "--n_lines", help="Number of lines per block. Default is 8.", type=int, default=8)
+    parser.add_argument("-r", "--repeats", help="Number of timed repeats. Default is 5.", type=int, default=5)
+    args = parser.parse_args()
+
+    data = create_fragmented_section(args.n_blocks, args.n_lines)
+
+    # Time both modes, keeping the best of the repeats
+    results = {}
+    for mode, function in [("concatenate", get_lines_concatenate), ("single", pv_utils.get_lines)]:
+        timings = []
+        for _ in range(args.repeats):
+            t_start = time.perf_counter()
+            output = function(data, ["p"])
+            timings.append(time.perf_counter() - t_start)
+        results[mode] = (min(timings), output)
+        print("{:>12s}: {:8.3f} ms".format(mode, 1e3 * results[mode][0]))
+
+    print("Speedup: {:.2f}x".format(results["concatenate"][0] / results["single"][0]))
+    points, lines, arrays = results["concatenate"][1]
+    print(
+        "Identical outputs: {}".format(
+            np.array_equal(points, results["single"][1][0])
+            and np.array_equal(lines, results["single"][1][1])
+            and np.array_equal(arrays["p"], results["single"][1][2]["p"])
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
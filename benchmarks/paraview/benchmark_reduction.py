@@ -0,0 +1,195 @@
+"""
+Reduction Benchmark
+===================
+
+This script compares the number of bytes fetched per time step by the
+geometry distribution with the sections reduced on the client and on the
+server, on a synthetic wing surface. The client reduction fetches every
+section polyline, while the server reduction runs the section sorting and
+property computation in a Programmable Filter and only fetches the twist,
+chord, and thickness of each station.
+
+Run with ParaView Python, for example connected to a pvserver:
+
+    pvpython benchmark_reduction.py --n_span 200 --resolution 400 --url cs://localhost:11111
+"""
+
+# External imports
+import time
+import argparse
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+from vtk.util import numpy_support as vtk_np
+
+# Internal imports
+import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.slicing as pv_slicing
+import postprocessing.paraview.reduction as pv_reduction
+
+# Script generating a tapered and twisted NACA 0012 wing spanning the Z direction
+_WING_SCRIPT = """
+import numpy as np
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, VTK_QUAD
+from vtkmodules.util import numpy_support
+
+n_points = {resolution}
+n_span = 2 * n_points
+beta = np.linspace(0.0, np.pi, n_points)
+x_c = 0.5 * (1.0 - np.cos(beta))
+y_t = 0.6 * (0.2969 * np.sqrt(x_c) - 0.126 * x_c - 0.3516 * x_c**2 + 0.2843 * x_c**3 - 0.1015 * x_c**4)
+coords = np.concatenate((np.stack((x_c[::-1], y_t[::-1]), axis=1), np.stack((x_c[1:-1], -y_t[1:-1]), axis=1)))
+n_section = np.size(coords, 0)
+
+points = []
+for z in np.linspace(0.0, 1.0, n_span):
+    t = np.deg2rad(5.0 * (1.0 - z))
+    R = np.array([[np.cos(t), np.sin(t)], [-np.sin(t), np.cos(t)]])
+    section = (1.0 - 0.5 * z) * coords @ R.T
+    points.append(np.column_stack((section, np.full(n_section, z))))
+points = np.concatenate(points)
+
+i = np.arange(n_section)
+quads = []
+for k in range(n_span - 1):
+    quads.append(np.stack((i, np.roll(i, -1), np.roll(i, -1) + n_section, i + n_section), axis=1) + k * n_section)
+quads = np.concatenate(quads)
+
+output = self.GetOutput()
+vtk_points = vtkPoints()
+vtk_points.SetData(numpy_support.numpy_to_vtk(points, deep=1))
+output.SetPoints(vtk_points)
+cells = vtkCellArray()
+cells.SetData(
+    numpy_support.numpy_to_vtkIdTypeArray(np.arange(0, 4 * np.size(quads, 0) + 1, 4, dtype=np.int64), deep=1),
+    numpy_support.numpy_to_vtkIdTypeArray(quads.ravel().astype(np.int64), deep=1),
+)
+output.SetCells(VTK_QUAD, cells)
+"""
+
+
+def create_synthetic_wing(resolution):
+    """
+    Create a tapered and twisted wing surface spanning the Z direction.
+
+    Parameters
+    ----------
+    resolution : int
+        Number of points per surface of a section.
+
+    Returns
+    -------
+    Paraview source
+        Wing surface.
+    """
+    programmableSource1 = paraview.ProgrammableSource(registrationName="Wing")
+    programmableSource1.OutputDataSetType = "vtkUnstructuredGrid"
+    programmableSource1.Script = _WING_SCRIPT.format(resolution=resolution)
+    paraview.UpdatePipeline(proxy=programmableSource1)
+
+    return programmableSource1
+
+
+def time_reduction(source, x, span_direction, lift_direction, drag_direction, reduction):
+    """
+    Compute the geometry at every station with the requested reduction mode.
+
+    Parameters
+    ----------
+    source : Paraview source
+        Wing surface.
+    x : ndarray
+        Station coordinates.
+    span_direction : ndarray
+        Span direction.
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+    reduction : str
+        Reduction mode, either "client" or "server".
+
+    Returns
+    -------
+    int
+        Number of bytes fetched.
+    float
+        Wall time, in seconds.
+    ndarray
+        Twist, chord, and thickness of each station.
+    """
+    offsets = (x - x[0, :]) @ span_direction
+
+    t_start = time.perf_counter()
+    slice_pipeline = pv_slicing.create_slice_pipeline(source, span_direction)
+    if reduction == "server":
+        reduction_pipeline = pv_slicing.create_reduction_pipeline(
+            slice_pipeline,
+            x,
+            span_direction,
+            pv_reduction.reduce_geometry,
+            ["Twist", "Chord", "Thickness"],
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+        )
+        fetched_proxy = reduction_pipeline[-1]
+    else:
+        fetched_proxy = slice_pipeline[-1]
+
+    # Cut all stations at once and fetch the result
+    slice_pipeline[0].SliceType.Origin = [x[0, 0], x[0, 1], x[0, 2]]
+    slice_pipeline[0].SliceOffsetValues = offsets.tolist()
+    paraview.UpdatePipeline(proxy=fetched_proxy)
+    data = paraview.servermanager.Fetch(fetched_proxy)
+    n_bytes = 1024 * data.GetActualMemorySize()
+
+    if reduction == "server":
+        geometry = np.column_stack([vtk_np.vtk_to_numpy(data.GetColumn(k)) for k in range(3)])
+        pv_slicing.delete_slice_pipeline(reduction_pipeline)
+    else:
+        points, lines, arrays = pv_utils.get_lines(data)
+        geometry = pv_reduction.reduce_geometry(
+            points, lines, arrays, x[0, :], span_direction, offsets, lift_direction, drag_direction
+        )
+    pv_slicing.delete_slice_pipeline(slice_pipeline)
+    t_end = time.perf_counter()
+
+    return n_bytes, t_end - t_start, geometry
+
+
+def main():
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument("-ns", "--n_span", help="Number of stations. Default is 200.", type=int, default=200)
+    parser.add_argument(
+        "-r", "--resolution", help="Points per surface of a wing section. Default is 400.", type=int, default=400
+    )
+    parser.add_argument("-u", "--url", help="URL of a pvserver to connect to. Default is builtin.", type=str)
+    args = parser.parse_args()
+
+    if args.url is not None:
+        paraview.Connect(args.url)
+
+    # Synthetic surface and stations
+    source = create_synthetic_wing(args.resolution)
+    span_direction = np.array([0.0, 0.0, 1.0])
+    lift_direction = np.array([0.0, 1.0, 0.0])
+    drag_direction = np.array([1.0, 0.0, 0.0])
+    x = np.zeros((args.n_span, 3))
+    x[:, 2] = np.linspace(0.05, 0.95, args.n_span)
+
+    # Compare both modes
+    results = {}
+    for reduction in ["client", "server"]:
+        results[reduction] = time_reduction(source, x, span_direction, lift_direction, drag_direction, reduction)
+        print(
+            "{:>10s}: {:12d} bytes fetched, {:8.3f} s".format(reduction, results[reduction][0], results[reduction][1])
+        )
+
+    print("Transfer reduction: {:.1f}x".format(results["client"][0] / results["server"][0]))
+    print("Max difference: {:.3e}".format(np.max(np.abs(results["client"][2] - results["server"][2]))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Slicing Benchmark
+=================
+
+This script compares the time per station of the slicing modes used by the
+force distribution on a synthetic wing surface. The "station" mode moves a
+single persistent slice between stations and fetches each section, while the
+"multi" mode cuts every station in one filter execution and fetches all the
+sections in one transfer.
+
+Run with ParaView Python, for example:
+
+    pvpython benchmark_slicing.py --n_span 400 --resolution 512
+"""
+
+# External imports
+import time
+import argparse
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+
+# Internal imports
+import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.slicing as pv_slicing
+
+
+def create_synthetic_wing(resolution):
+    """
+    Create a cylindrical surface spanning the Y direction with a forcePerS
+    point array, used as a stand-in for a wing surface.
+
+    Parameters
+    ----------
+    resolution : int
+        Number of facets around the circumference.
+
+    Returns
+    -------
+    Paraview source
+        Surface with a forcePerS array.
+    """
+    cylinder = paraview.Cylinder(registrationName="Cylinder1")
+    cylinder.Resolution = resolution
+    cylinder.Height = 1.0
+    cylinder.Capping = 0
+
+    calculator = paraview.Calculator(registrationName="forcePerS", Input=cylinder)
+    calculator.ResultArrayName = "forcePerS"
+    calculator.Function = "coordsX*iHat + (1 - coordsY*coordsY)*jHat"
+    paraview.UpdatePipeline(proxy=calculator)
+
+    return calculator
+
+
+def time_stations(source, x, span_direction, force_direction, slicing):
+    """
+    Compute the force at every station with the requested slicing mode.
+
+    Parameters
+    ----------
+    source : Paraview source
+        Surface with a forcePerS array.
+    x : ndarray
+        Station coordinates.
+    span_direction : ndarray
+        Span direction.
+    force_direction : ndarray
+        Force direction.
+    slicing : str
+        Slicing mode, either "multi" or "station".
+
+    Returns
+    -------
+    float
+        Wall time per station, in seconds.
+    ndarray
+        Force at each station.
+    """
+    force = np.zeros(np.size(x, 0))
+
+    t_start = time.perf_counter()
+    slice_pipeline = pv_slicing.create_slice_pipeline(source, span_direction)
+    sections = pv_slicing.fetch_sections(
+        slice_pipeline, 0.0, x, span_direction, point_arrays=["forcePerS"], slicing=slicing
+    )
+    for j, section in enumerate(sections):
+        force[j] = pv_utils.integrate_lines(section["points"], section["lines"], section["forcePerS"] @ force_direction)
+    pv_slicing.delete_slice_pipeline(slice_pipeline)
+    t_end = time.perf_counter()
+
+    return (t_end - t_start) / np.size(x, 0), force
+
+
+def main():
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument("-ns", "--n_span", help="Number of stations. Default is 400.", type=int, default=400)
+    parser.add_argument(
+        "-r", "--resolution", help="Circumferential resolution of the surface. Default is 512.", type=int, default=512
+    )
+    args = parser.parse_args()
+
+    # Synthetic surface and stations
+    source = create_synthetic_wing(args.resolution)
+    span_direction = np.array([0.0, 1.0, 0.0])
+    force_direction = np.array([0.0, 1.0, 0.0])
+    x = np.zeros((args.n_span, 3))
+    x[:, 1] = np.linspace(-0.45, 0.45, args.n_span)
+
+    # Time both modes
+    results = {}
+    for slicing in ["station", "multi"]:
+        results[slicing] = time_stations(source, x, span_direction, force_direction, slicing)
+        print("{:>10s}: {:8.3f} ms per station".format(slicing, 1e3 * results[slicing][0]))
+
+    print("Speedup: {:.2f}x".format(results["station"][0] / results["multi"][0]))
+    print("Max difference: {:.3e}".format(np.max(np.abs(results["station"][1] - results["multi"][1]))))
+
+
+if __name__ == "__main__":
+    main()
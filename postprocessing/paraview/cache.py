@@ -0,0 +1,462 @@
+# External imports
+import os
+import shutil
+import argparse
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+from vtk.util import numpy_support as vtk_np
+
+# Internal Imports
+import postprocessing
+import postprocessing.paraview.surface as pv_surface
+import postprocessing.paraview.case as pv_case
+import postprocessing.paraview.parallel as pv_parallel
+import postprocessing.paraview.manifest as pv_manifest
+import postprocessing.paraview.writer as pv_writer
+
+
+def cache_surface_cmd():
+    """
+    Wrapper around the cache_surface() function to call it from the command
+    line with arguments.
+    """
+    # Parse arguments
+    parser = cache_surface_parser()
+
+    # Call function
+    cache_surface(**vars(parser.parse_args()))
+
+
+def cache_surface_parser():
+    """
+    Parser for options for the cache_surface() function to call it from the
+    command line with arguments.
+
+    Returns
+    -------
+    parser
+        Parser with specified arguments.
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument(
+        "-i",
+        "--input_file",
+        help="Relative path to input file.",
+        type=str,
+        default="",
+    )
+    parser.add_argument(
+        "-o",
+        "--output_directory",
+        help="Relative path to output directory. Default is ./",
+        type=str,
+        default="./",
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="Name of the cache directory created in the output directory. Default is surface_cache.",
+        type=str,
+        default="surface_cache",
+    )
+    parser.add_argument(
+        "-p",
+        "--patches",
+        help="Patches to include in the cache. Default is group/wall.",
+        type=str,
+        nargs="+",
+        default="group/wall",
+    )
+    parser.add_argument(
+        "-a",
+        "--arrays",
+        help="Cell arrays to include in the cache. Default is forcePerS and p.",
+        type=str,
+        nargs="+",
+        default=["forcePerS", "p"],
+    )
+    parser.add_argument(
+        "-ct",
+        "--case_type",
+        help="Case type, either reconstructed or decomposed (read the processor directories directly). Default is reconstructed.",
+        type=str,
+        default="reconstructed",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of worker processes over which to split the processor directories of a decomposed case. Default is 1.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-ow",
+        "--overwrite",
+        help="Flag to overwrite an existing cache directory. Default is False.",
+        type=str,
+        default="False",
+    )
+    return parser
+
+
+def cache_surface(
+    input_file=None,
+    output_directory="./",
+    name="surface_cache",
+    patches="group/wall",
+    arrays=["forcePerS", "p"],
+    case_type="reconstructed",
+    workers=1,
+    overwrite="False",
+):
+    """
+    Function to extract patches of an OpenFOAM case once into a surface cache
+    directory, which the other ParaView utilities accept as an input in place
+    of a .foam file.
+
+    The cache holds the surface points, the face connectivity, and the cell
+    arrays of every time step, along with the point arrays Paraview
+    interpolates from them, stored as numpy binary files that can be memory
+    mapped.
+
+    A decomposed case can be read directly from its processor directories,
+    which are split across worker processes. Only the requested patches of
+    each processor are read, one time step at a time, and they are stitched
+    into a single surface written as soon as it arrives. The point arrays of
+    a decomposed case are averaged from the stitched face arrays, since
+    those of each processor are one-sided at the processor boundaries.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to file to load with Paraview.
+    output_directory : str
+        Path to directory where the cache directory will be created. Default is
+        "./".
+    name : str
+        Name of the cache directory. Default is "surface_cache".
+    patches : str or list
+        Patch name(s) to include in the cache. Default is "group/wall".
+    arrays : list
+        Cell arrays to include in the cache. Default is ["forcePerS", "p"].
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly. Default is "reconstructed".
+    workers : int
+        Number of worker processes over which to split the processor
+        directories of a decomposed case. Default is 1.
+    overwrite : str
+        Flag to overwrite an existing cache directory. Default is "False".
+    """
+    # Check the arguments before touching an existing cache
+    if input_file is None or input_file == "":
+        raise ValueError("Input file not set.")
+    if case_type not in pv_case.CASE_TYPES:
+        raise ValueError("Case type {} not recognized, options are reconstructed and decomposed.".format(case_type))
+
+    # Check if output directory exists
+    if not os.path.isdir(output_directory):
+        raise RuntimeError("Output directory {} does not exist.".format(output_directory))
+
+    # Check if the cache exists
+    cache_directory = os.path.join(output_directory, name)
+    if os.path.exists(cache_directory) and overwrite != "True":
+        raise RuntimeError("Cache {} exists, remove it or run with overwrite set to True.".format(cache_directory))
+
+    # Import case
+    if case_type == "decomposed" and workers > 1:
+        # Read the patches of the processor directories in worker processes
+        case_directory = os.path.dirname(os.path.join(os.getcwd(), input_file))
+        processor_directories = pv_manifest.get_processor_directories(case_directory)
+        if len(processor_directories) == 0:
+            raise RuntimeError("No processor directories found in {}.".format(case_directory))
+        processor_workers = pv_parallel.start_processor_workers(processor_directories, workers)
+        reader_kwargs = {"input_file": input_file, "patches": patches, "arrays": arrays}
+        try:
+            chunk_times = [
+                future.result()
+                for future in pv_parallel.submit_processor_task(
+                    processor_workers, open_processor_readers, **reader_kwargs
+                )
+            ]
+        except BaseException:
+            pv_parallel.stop_processor_workers(processor_workers)
+            raise
+        times = chunk_times[0]
+        for chunk in chunk_times:
+            if len(chunk) != len(times) or not np.allclose(chunk, times):
+                pv_parallel.stop_processor_workers(processor_workers)
+                raise RuntimeError("The processor directories of {} hold different time steps.".format(input_file))
+        mergeBlocks1 = None
+    else:
+        processor_workers = None
+        paraviewfoam = paraview.OpenFOAMReader(
+            registrationName="paraview.foam", FileName=str(os.getcwd()) + "/{}".format(input_file)
+        )
+        paraviewfoam.CaseType = pv_case.CASE_TYPES[case_type]
+        paraviewfoam.MeshRegions = patches
+        paraviewfoam.CellArrays = arrays
+
+        # Read time data
+        animationScene1 = paraview.GetAnimationScene()
+        animationScene1.UpdateAnimationUsingDataTimeSteps()
+        times = np.atleast_1d(paraviewfoam.TimestepValues).tolist()
+
+        # Merge the patches into a single surface
+        mergeBlocks1 = paraview.MergeBlocks(registrationName="MergeBlocks1", Input=paraviewfoam)
+
+    # Build the cache in a directory of its own, swapped in once complete so
+    # that a failed run leaves an existing cache untouched
+    build_directory = cache_directory + ".tmp." + str(os.getpid())
+    if os.path.exists(build_directory):
+        shutil.rmtree(build_directory)
+    os.makedirs(build_directory)
+
+    metadata = {
+        "version": postprocessing.__version__,
+        "input_file": input_file,
+        "patches": patches,
+        "case_type": case_type,
+        "times": times,
+        "moving_mesh": False,
+    }
+
+    try:
+        # Write the arrays in the background while the next time steps are read
+        writer = pv_writer.start_writer()
+        completed = False
+        try:
+            if processor_workers is not None:
+                pending = pv_parallel.submit_processor_task(
+                    processor_workers, read_processor_surfaces, time_index=0, **reader_kwargs
+                )
+            for i in range(len(times)):
+                if processor_workers is not None:
+                    # Stitch the patches of all processors as soon as they arrive, while the
+                    # workers read the next time step
+                    surfaces = [surface for future in pending for surface in future.result()]
+                    if i + 1 < len(times):
+                        pending = pv_parallel.submit_processor_task(
+                            processor_workers, read_processor_surfaces, time_index=i + 1, **reader_kwargs
+                        )
+                    surface = pv_surface.stitch_surfaces(surfaces)
+                    del surfaces
+                else:
+                    paraview.UpdatePipeline(time=times[i], proxy=mergeBlocks1)
+                    data = paraview.servermanager.Fetch(mergeBlocks1)
+                    surface = get_surface(data, arrays)
+
+                    # Merge the points duplicated at the boundaries between processors
+                    if case_type == "decomposed":
+                        surface = pv_surface.stitch_surfaces([surface])
+
+                # Store the mesh with the first time step, and again at every time step
+                # once it is found to move
+                if i == 0:
+                    points = surface["points"]
+                    connectivity = surface["connectivity"]
+                    pv_writer.submit_write(writer, pv_surface.save_array, build_directory, "points", points)
+                    pv_writer.submit_write(writer, pv_surface.save_array, build_directory, "connectivity", connectivity)
+                    pv_writer.submit_write(
+                        writer, pv_surface.save_array, build_directory, "offsets", surface["offsets"]
+                    )
+                    metadata["cell_arrays"] = list(surface["cell_arrays"].keys())
+                    metadata["point_arrays"] = list(surface["point_arrays"].keys())
+                elif not np.array_equal(connectivity, surface["connectivity"]):
+                    raise RuntimeError(
+                        "The surface topology changes at time {}, which cannot be cached.".format(times[i])
+                    )
+                elif metadata["moving_mesh"] or not np.array_equal(points, surface["points"]):
+                    if not metadata["moving_mesh"]:
+                        for k in range(i):
+                            pv_writer.submit_write(
+                                writer, pv_surface.save_array, build_directory, "points", points, time_index=k
+                            )
+                        metadata["moving_mesh"] = True
+                    pv_writer.submit_write(
+                        writer, pv_surface.save_array, build_directory, "points", surface["points"], time_index=i
+                    )
+
+                for array_name in metadata["cell_arrays"]:
+                    pv_writer.submit_write(
+                        writer,
+                        pv_surface.save_array,
+                        build_directory,
+                        "cell_" + array_name,
+                        surface["cell_arrays"][array_name],
+                        i,
+                    )
+                for array_name in metadata["point_arrays"]:
+                    pv_writer.submit_write(
+                        writer,
+                        pv_surface.save_array,
+                        build_directory,
+                        "point_" + array_name,
+                        surface["point_arrays"][array_name],
+                        i,
+                    )
+            completed = True
+        finally:
+            if processor_workers is not None:
+                pv_parallel.stop_processor_workers(processor_workers)
+
+            # Wait for the pending writes to finish, without hiding an error of the
+            # computation behind a failed write
+            pv_writer.stop_writer(writer, raise_errors=completed)
+
+        # Mark the cache complete once every array is written
+        pv_surface.save_cache_metadata(build_directory, metadata)
+    except BaseException:
+        shutil.rmtree(build_directory, ignore_errors=True)
+        raise
+
+    # Swap the complete cache in place of an existing one
+    if os.path.exists(cache_directory):
+        print("Warning: Overwriting existing cache {}.".format(cache_directory))
+        os.replace(cache_directory, build_directory + ".old")
+        os.replace(build_directory, cache_directory)
+        shutil.rmtree(build_directory + ".old")
+    else:
+        os.replace(build_directory, cache_directory)
+
+    # Cleanup Paraview Objects
+    if mergeBlocks1 is not None:
+        paraview.Delete(mergeBlocks1)
+        paraview.Delete(paraviewfoam)
+
+
+# Readers of the processor directories opened in a worker process, kept open
+# from one time step to the next
+_PROCESSOR_READERS = {}
+
+
+def open_processor_readers(input_file, processor_directories, patches, arrays):
+    """
+    Open the readers of a set of processor directories of a decomposed case in
+    a worker process. Each processor directory is read as a case of its own,
+    and its reader is kept open for the following calls to
+    read_processor_surfaces().
+
+    Parameters
+    ----------
+    input_file : str
+        Relative path to the .foam file of the decomposed case.
+    processor_directories : list
+        Names of the processor directories to read.
+    patches : str or list
+        Patch name(s) to read.
+    arrays : list
+        Cell arrays to read.
+
+    Returns
+    -------
+    list
+        Time values of the processor directories.
+    """
+    case_directory = os.path.dirname(os.path.join(os.getcwd(), input_file))
+
+    times = None
+    for processor_directory in processor_directories:
+        if processor_directory not in _PROCESSOR_READERS:
+            paraviewfoam = paraview.OpenFOAMReader(
+                registrationName=processor_directory,
+                FileName=os.path.join(case_directory, processor_directory, os.path.basename(input_file)),
+            )
+            paraviewfoam.MeshRegions = patches
+            paraviewfoam.CellArrays = arrays
+            mergeBlocks1 = paraview.MergeBlocks(
+                registrationName="MergeBlocks_{}".format(processor_directory), Input=paraviewfoam
+            )
+            _PROCESSOR_READERS[processor_directory] = (paraviewfoam, mergeBlocks1)
+
+        # Read time data
+        paraviewfoam, _ = _PROCESSOR_READERS[processor_directory]
+        animationScene1 = paraview.GetAnimationScene()
+        animationScene1.UpdateAnimationUsingDataTimeSteps()
+        if times is None:
+            times = np.atleast_1d(paraviewfoam.TimestepValues).tolist()
+
+    return times
+
+
+def read_processor_surfaces(input_file, processor_directories, patches, arrays, time_index):
+    """
+    Read the patches of a set of processor directories of a decomposed case at
+    one time step, with the readers opened by open_processor_readers(). Only
+    one time step is returned at a time, so the worker never holds, nor sends
+    back, the whole history of its processors.
+
+    Parameters
+    ----------
+    input_file : str
+        Relative path to the .foam file of the decomposed case.
+    processor_directories : list
+        Names of the processor directories to read.
+    patches : str or list
+        Patch name(s) to read.
+    arrays : list
+        Cell arrays to read.
+    time_index : int
+        Index of the time step to read.
+
+    Returns
+    -------
+    list
+        Surfaces of the processor directories, as returned by get_surface().
+    """
+    times = open_processor_readers(input_file, processor_directories, patches, arrays)
+
+    surfaces = []
+    for processor_directory in processor_directories:
+        _, mergeBlocks1 = _PROCESSOR_READERS[processor_directory]
+        paraview.UpdatePipeline(time=times[time_index], proxy=mergeBlocks1)
+        surfaces.append(get_surface(paraview.servermanager.Fetch(mergeBlocks1), arrays))
+
+    return surfaces
+
+
+def get_surface(data, arrays):
+    """
+    Convert a merged surface fetched from Paraview into numpy arrays.
+
+    Parameters
+    ----------
+    data : vtkUnstructuredGrid
+        Merged surface.
+    arrays : list
+        Names of the cell and point arrays to extract, if they exist.
+
+    Returns
+    -------
+    dict
+        Surface with the "points", face "connectivity" and "offsets" arrays,
+        and the "cell_arrays" and "point_arrays" dictionaries.
+    """
+    # Processors without faces in the requested patches
+    if data.GetNumberOfPoints() == 0 or data.GetNumberOfCells() == 0:
+        return {
+            "points": np.zeros((0, 3)),
+            "connectivity": np.zeros(0, dtype=np.int64),
+            "offsets": np.zeros(1, dtype=np.int64),
+            "cell_arrays": {},
+            "point_arrays": {},
+        }
+
+    cells = data.GetCells()
+    surface = {
+        "points": vtk_np.vtk_to_numpy(data.GetPoints().GetData()).astype(float),
+        "connectivity": vtk_np.vtk_to_numpy(cells.GetConnectivityArray()).astype(np.int64),
+        "offsets": vtk_np.vtk_to_numpy(cells.GetOffsetsArray()).astype(np.int64),
+        "cell_arrays": {},
+        "point_arrays": {},
+    }
+    # Copy the arrays, which are written after the data is released
+    for array_name in arrays:
+        if data.GetCellData().GetArray(array_name) is not None:
+            surface["cell_arrays"][array_name] = vtk_np.vtk_to_numpy(data.GetCellData().GetArray(array_name)).copy()
+        if data.GetPointData().GetArray(array_name) is not None:
+            surface["point_arrays"][array_name] = vtk_np.vtk_to_numpy(data.GetPointData().GetArray(array_name)).copy()
+
+    return surface
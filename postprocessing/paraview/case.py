@@ -0,0 +1,267 @@
+# External imports
+import os
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+
+# Internal Imports
+import postprocessing.paraview.mpi as pv_mpi
+import postprocessing.paraview.surface as pv_surface
+import postprocessing.paraview.manifest as pv_manifest
+
+# Case types of the OpenFOAM reader
+CASE_TYPES = {"reconstructed": "Reconstructed Case", "decomposed": "Decomposed Case"}
+
+# Sources kept open between calls by a long-lived process, keyed by case and
+# read options, or None when sources are not kept
+_source_cache = None
+
+
+def enable_reader_cache():
+    """
+    Keep the sources opened by open_case() between calls, so that a long-lived
+    process such as pv_daemon only reads each case once. A kept source is
+    opened again when the files of its case change.
+    """
+    global _source_cache
+    if _source_cache is None:
+        _source_cache = {}
+
+
+def open_case(input_file, patches="group/wall", cell_arrays=None, case_type="reconstructed"):
+    """
+    Open an OpenFOAM case with Paraview and read its time steps. A surface
+    cache written by pv_cache can be given in place of the .foam file. When
+    running on several MPI processes, the processor directories of a
+    decomposed case are read in parallel by the ranks, while a reconstructed
+    case is read on the root process and redistributed across the ranks. If
+    enable_reader_cache() was called, the source of an unchanged case is
+    reused from a previous call.
+
+    Parameters
+    ----------
+    input_file : str
+        Relative path to the .foam file to load with Paraview, or to a surface
+        cache directory.
+    patches : str or list
+        Patch name(s) to read. Default is "group/wall".
+    cell_arrays : list
+        Cell arrays to read. Default is None, which reads all arrays.
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly. Default is "reconstructed".
+
+    Returns
+    -------
+    Paraview source
+        OpenFOAM reader or surface cache source, or the filter redistributing
+        its data across MPI ranks.
+    list
+        Time values of the case.
+    """
+    if input_file is None or input_file == "":
+        raise ValueError("Input file not set.")
+
+    # Check case type
+    if case_type not in CASE_TYPES:
+        raise ValueError("Case type {} not recognized, options are reconstructed and decomposed.".format(case_type))
+
+    if _source_cache is None:
+        sources, times = _open_sources(input_file, patches, cell_arrays, case_type)
+        return sources[-1], times
+
+    # Reuse the sources of a previous call if the case files are unchanged
+    key = (
+        os.path.abspath(input_file),
+        tuple(np.atleast_1d(patches).tolist()),
+        None if cell_arrays is None else tuple(cell_arrays),
+        case_type,
+    )
+    state = get_case_state(input_file)
+    if key in _source_cache:
+        sources, times, cached_state = _source_cache[key]
+        if cached_state == state:
+            return sources[-1], times
+        for source in reversed(sources):
+            paraview.Delete(source)
+
+    sources, times = _open_sources(input_file, patches, cell_arrays, case_type)
+    _source_cache[key] = (sources, times, state)
+
+    return sources[-1], times
+
+
+def get_case_state(input_file):
+    """
+    List the modification times and sizes of the files a case is read from:
+    the mesh and time directories of an OpenFOAM case and of its processor
+    directories, or the files of a surface cache. Any change to the case
+    changes its state.
+
+    Parameters
+    ----------
+    input_file : str
+        Relative path to the .foam file of the case, or to a surface cache
+        directory.
+
+    Returns
+    -------
+    list
+        Path, modification time, and size of each file.
+    """
+    if pv_surface.is_surface_cache(os.path.join(os.getcwd(), input_file)):
+        directories = [os.path.join(os.getcwd(), input_file)]
+    else:
+        case_directory = os.path.dirname(os.path.join(os.getcwd(), input_file))
+        directories = [case_directory]
+        for base_directory in [case_directory] + [
+            os.path.join(case_directory, processor_directory)
+            for processor_directory in pv_manifest.get_processor_directories(case_directory)
+        ]:
+            directories.append(os.path.join(base_directory, "constant", "polyMesh"))
+            for time_directory in pv_manifest.get_time_directories(base_directory).values():
+                directories.append(os.path.join(base_directory, time_directory))
+                directories.append(os.path.join(base_directory, time_directory, "polyMesh"))
+
+    state = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for entry in os.scandir(directory):
+            if entry.is_file():
+                stat = entry.stat()
+                state.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+    return sorted(state)
+
+
+def _open_sources(input_file, patches, cell_arrays, case_type):
+    """
+    Create the sources reading a case, returning them in pipeline order along
+    with the time values of the case.
+    """
+    is_cache = pv_surface.is_surface_cache(os.path.join(os.getcwd(), input_file))
+    if is_cache:
+        # Load the memory mapped surface cache instead of parsing the case
+        paraviewfoam, times = open_cache(os.path.join(os.getcwd(), input_file), patches, cell_arrays)
+    else:
+        paraviewfoam = paraview.OpenFOAMReader(
+            registrationName="paraview.foam", FileName=str(os.getcwd()) + "/{}".format(input_file)
+        )
+        paraviewfoam.CaseType = CASE_TYPES[case_type]
+        paraviewfoam.MeshRegions = patches
+        if cell_arrays is not None:
+            paraviewfoam.CellArrays = cell_arrays
+
+        # Read time data
+        animationScene1 = paraview.GetAnimationScene()
+        animationScene1.UpdateAnimationUsingDataTimeSteps()
+
+        # A single time step is returned as a scalar
+        times = np.atleast_1d(paraviewfoam.TimestepValues).tolist()
+
+    # A reconstructed case or cache is read on the root process only, so distribute it
+    if pv_mpi.get_size() > 1 and (case_type != "decomposed" or is_cache):
+        redistributeDataSet1 = paraview.RedistributeDataSet(registrationName="RedistributeDataSet1", Input=paraviewfoam)
+        return [paraviewfoam, redistributeDataSet1], times
+
+    return [paraviewfoam], times
+
+
+# Script run by the ProgrammableSource to report the time steps of a cache
+_REQUEST_INFORMATION_SCRIPT = """
+from vtkmodules.vtkCommonExecutionModel import vtkStreamingDemandDrivenPipeline as sddp
+import postprocessing.paraview.surface as pv_surface
+
+times = pv_surface.load_cache_metadata({cache_directory!r})["times"]
+info = self.GetOutputInformation(0)
+info.Remove(sddp.TIME_STEPS())
+info.Remove(sddp.TIME_RANGE())
+for time in times:
+    info.Append(sddp.TIME_STEPS(), time)
+info.Append(sddp.TIME_RANGE(), times[0])
+info.Append(sddp.TIME_RANGE(), times[-1])
+"""
+
+# Script run by the ProgrammableSource to load a time step of a cache
+_REQUEST_DATA_SCRIPT = """
+import numpy as np
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, VTK_POLYGON
+from vtkmodules.vtkCommonExecutionModel import vtkStreamingDemandDrivenPipeline as sddp
+from vtkmodules.util import numpy_support
+import postprocessing.paraview.surface as pv_surface
+
+info = self.GetOutputInformation(0)
+
+# The whole surface is produced on the first piece and redistributed if needed
+if not info.Has(sddp.UPDATE_PIECE_NUMBER()) or info.Get(sddp.UPDATE_PIECE_NUMBER()) == 0:
+    times = np.array(pv_surface.load_cache_metadata({cache_directory!r})["times"])
+    time = info.Get(sddp.UPDATE_TIME_STEP()) if info.Has(sddp.UPDATE_TIME_STEP()) else times[0]
+    surface = pv_surface.load_surface({cache_directory!r}, int(np.argmin(np.abs(times - time))))
+
+    output = self.GetOutput()
+    points = vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(np.ascontiguousarray(surface["points"]), deep=1))
+    output.SetPoints(points)
+
+    cells = vtkCellArray()
+    cells.SetData(
+        numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(surface["offsets"]), deep=1),
+        numpy_support.numpy_to_vtkIdTypeArray(np.ascontiguousarray(surface["connectivity"]), deep=1),
+    )
+    output.SetCells(VTK_POLYGON, cells)
+
+    for attributes, arrays in [(output.GetCellData(), surface["cell_arrays"]), (output.GetPointData(), surface["point_arrays"])]:
+        for name, values in arrays.items():
+            array = numpy_support.numpy_to_vtk(np.ascontiguousarray(values), deep=1)
+            array.SetName(name)
+            attributes.AddArray(array)
+"""
+
+
+def open_cache(cache_directory, patches="group/wall", cell_arrays=None):
+    """
+    Open a surface cache as a Paraview source, which loads the memory mapped
+    arrays of the requested time step.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Path to the surface cache directory.
+    patches : str or list
+        Patch name(s) requested by the caller, checked against the patches
+        stored in the cache. Default is "group/wall".
+    cell_arrays : list
+        Cell arrays requested by the caller, checked against the arrays stored
+        in the cache. Default is None, which does not check any array.
+
+    Returns
+    -------
+    Paraview source
+        Programmable source producing the cached surface.
+    list
+        Time values of the cache.
+    """
+    metadata = pv_surface.load_cache_metadata(cache_directory)
+
+    # Check the cache holds what is requested
+    if np.atleast_1d(patches).tolist() != np.atleast_1d(metadata["patches"]).tolist():
+        print(
+            "Warning: Requested patches {} differ from the patches {} stored in the cache, using the cached patches.".format(
+                patches, metadata["patches"]
+            )
+        )
+    for array_name in cell_arrays if cell_arrays is not None else []:
+        if array_name not in metadata["cell_arrays"]:
+            raise RuntimeError("Array {} is not stored in the cache {}.".format(array_name, cache_directory))
+
+    cache_directory = os.path.abspath(cache_directory)
+    programmableSource1 = paraview.ProgrammableSource(registrationName="SurfaceCache")
+    programmableSource1.OutputDataSetType = "vtkUnstructuredGrid"
+    programmableSource1.ScriptRequestInformation = _REQUEST_INFORMATION_SCRIPT.format(cache_directory=cache_directory)
+    programmableSource1.Script = _REQUEST_DATA_SCRIPT.format(cache_directory=cache_directory)
+    paraview.UpdatePipelineInformation(programmableSource1)
+
+    return programmableSource1, metadata["times"]
@@ -0,0 +1,863 @@
+# External imports
+import argparse
+import importlib
+
+# Internal Imports
+import postprocessing.paraview.daemon as pv_daemon
+
+
+# The command line entry points of the utilities that can run in a daemon live
+# here, apart from the utilities, so that forwarding a job to a daemon does not
+# import Paraview. The utility module, and Paraview with it, is only imported
+# when the job runs in this process.
+
+
+def force_distribution_cmd():
+    """
+    Wrapper around the force_distribution() function to call it from
+    the command line with arguments.
+    """
+    # Parse arguments
+    parser = force_distribution_parser()
+    args = vars(parser.parse_args())
+
+    # Watch the case for new time steps, forward the job to a running daemon, or call function
+    daemon = args.pop("daemon")
+    watch = {key: args.pop(key) for key in ["watch", "poll_interval", "settle_time", "watch_timeout"]}
+    if watch.pop("watch") == "True":
+        distributions = importlib.import_module("postprocessing.paraview.distributions")
+        distributions.watch_force_distribution(args, daemon, **watch)
+    elif daemon is not None:
+        pv_daemon.submit_job(daemon, "force_distribution", args)
+    else:
+        pv_daemon.get_job_function("force_distribution")(**args)
+
+
+def geometry_distribution_cmd():
+    """
+    Wrapper around the geometry_distribution() function to call it from the
+    command line with arguments.
+    """
+    # Parse arguments
+    parser = geometry_distribution_parser()
+    args = vars(parser.parse_args())
+
+    # Forward the job to a running daemon, or call function
+    daemon = args.pop("daemon")
+    if daemon is not None:
+        pv_daemon.submit_job(daemon, "geometry_distribution", args)
+    else:
+        pv_daemon.get_job_function("geometry_distribution")(**args)
+
+
+def slices_cp_cmd():
+    """
+    Wrapper around the slices_cp() function to call it from the
+    command line with arguments.
+    """
+    # Parse arguments
+    parser = slices_cp_parser()
+    args = vars(parser.parse_args())
+
+    # Watch the case for new time steps, forward the job to a running daemon, or call function
+    daemon = args.pop("daemon")
+    watch = {key: args.pop(key) for key in ["watch", "poll_interval", "settle_time", "watch_timeout"]}
+    if watch.pop("watch") == "True":
+        importlib.import_module("postprocessing.paraview.slices").watch_slices_cp(args, daemon, **watch)
+    elif daemon is not None:
+        pv_daemon.submit_job(daemon, "slices_cp", args)
+    else:
+        pv_daemon.get_job_function("slices_cp")(**args)
+
+
+def sections_cmd():
+    """
+    Wrapper around the sections() function to call it from the command line
+    with arguments.
+    """
+    # Parse arguments
+    parser = sections_parser()
+    args = vars(parser.parse_args())
+
+    # Forward the job to a running daemon, or call function
+    daemon = args.pop("daemon")
+    if daemon is not None:
+        pv_daemon.submit_job(daemon, "sections", args)
+    else:
+        pv_daemon.get_job_function("sections")(**args)
+
+
+def force_distribution_parser():
+    """
+    Parser for options for the force_distribution() function to call
+    it from the command line with arguments.
+
+    Returns
+    -------
+    parser
+        Parser with specified arguments.
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument(
+        "-i",
+        "--input_file",
+        help="Relative path to input file.",
+        type=str,
+        default="",
+    )
+    parser.add_argument(
+        "-o",
+        "--output_directory",
+        help="Relative path to output directory. Default is ./",
+        type=str,
+        default="./",
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="Name pattern to write out files in the output directory. Default is force_distribution.",
+        type=str,
+        default="force_distribution",
+    )
+    parser.add_argument(
+        "-p",
+        "--patches",
+        help="Patches to include in the calculation. Default is group/wall.",
+        type=str,
+        nargs="+",
+        default="group/wall",
+    )
+    parser.add_argument(
+        "-s",
+        "--span_direction",
+        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
+        type=str,
+        nargs="+",
+        default=["Z+"],
+    )
+    parser.add_argument(
+        "-f",
+        "--force_direction",
+        help="Force direction(s). Strings in (X+, X-, Y+, Y-, Z+, Z-) or lists of three floats specifying vectors, with one output column per direction. Default is Y+.",
+        type=str,
+        nargs="+",
+        default=["Y+"],
+    )
+    parser.add_argument(
+        "-xs",
+        "--x_start",
+        help="Coordinate to start slices from. Default is [0, 0, 0].",
+        type=str,
+        nargs="+",
+        default=[0, 0, 0],
+    )
+    parser.add_argument(
+        "-xe",
+        "--x_end",
+        help="Coordinate to end slices a. Default is [0, 0, 1].",
+        type=str,
+        nargs="+",
+        default=[0, 0, 1],
+    )
+    parser.add_argument(
+        "-ns",
+        "--n_span",
+        help="Number of spanwise samples. Default is 100.",
+        type=int,
+        default=100,
+    )
+    parser.add_argument(
+        "-sl",
+        "--slicing",
+        help="Slicing mode, either multi (cut all stations in one filter execution) or station (move a single slice between stations). Default is multi.",
+        type=str,
+        default="multi",
+    )
+    parser.add_argument(
+        "-pl",
+        "--pipeline",
+        help="Deprecated, use --slicing. Either persistent or rebuild, which both run with --slicing station. Default is None.",
+        type=str,
+        default=None,
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of worker processes over which to split the time steps. Default is 1.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-pt",
+        "--partition",
+        help="Work split across workers, either time (split the time steps) or span (split the stations, clipping the surface to each worker's spanwise slab). Default is time.",
+        type=str,
+        default="time",
+    )
+    parser.add_argument(
+        "-inc",
+        "--incremental",
+        help="Flag to only process time steps whose outputs are missing or out of date, using the run manifest in the output directory. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-of",
+        "--output_format",
+        help="Output format, either csv (one file per time step) or store (a compressed binary store holding all time steps). Default is csv.",
+        type=str,
+        default="csv",
+    )
+    parser.add_argument(
+        "-ct",
+        "--case_type",
+        help="Case type, either reconstructed or decomposed (read the processor directories directly). Default is reconstructed.",
+        type=str,
+        default="reconstructed",
+    )
+    parser.add_argument(
+        "-sp",
+        "--spacing",
+        help="Station spacing, either uniform (n_span evenly spaced stations) or adaptive (start from n_span stations and add stations where the results change quickly). Default is uniform.",
+        type=str,
+        default="uniform",
+    )
+    parser.add_argument(
+        "-tol",
+        "--tolerance",
+        help="Largest change of a result between neighboring stations with adaptive spacing, relative to the range of the result. Default is 0.01.",
+        type=float,
+        default=0.01,
+    )
+    parser.add_argument(
+        "-mx",
+        "--max_stations",
+        help="Maximum number of stations with adaptive spacing. Default is 1000.",
+        type=int,
+        default=1000,
+    )
+    parser.add_argument(
+        "-mp",
+        "--moment_points",
+        help="Reference points of the sectional moments about the span direction, as lists of three floats, with one output column per point. Default is None.",
+        type=str,
+        nargs="+",
+        default=None,
+    )
+    parser.add_argument(
+        "-st",
+        "--statistics",
+        help="Flag to only write the time statistics (mean, standard deviation, minimum, and maximum) of every station to <name>_statistics.csv, updated one time step at a time. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-tt",
+        "--transient_time",
+        help="Time before which time steps are skipped, for example to exclude an initial transient from the statistics. Default is None, which processes all time steps.",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "-ps",
+        "--spectra",
+        help="Flag to write the power spectral density of every station to <name>_spectra.csv, averaged over overlapping segments of time steps (Welch's method) updated one time step at a time. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-sg",
+        "--segment_length",
+        help="Number of time steps per segment of the spectra, which sets the frequency resolution. Default is 256.",
+        type=int,
+        default=256,
+    )
+    parser.add_argument(
+        "-ol",
+        "--overlap",
+        help="Fraction of each segment of the spectra shared with the next one. Default is 0.5.",
+        type=float,
+        default=0.5,
+    )
+    parser.add_argument(
+        "-eg",
+        "--engine",
+        help="Engine computing the sections, either paraview (slice the surface with Paraview) or numpy (cut a surface cache written by pv_cache with numpy, without Paraview). Default is paraview.",
+        type=str,
+        default="paraview",
+    )
+    parser.add_argument(
+        "-wa",
+        "--watch",
+        help="Flag to keep polling the case and process the time directories completed by a running solver as they appear. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-pi",
+        "--poll_interval",
+        help="Time in seconds between polls of the case in watch mode. Default is 5.",
+        type=float,
+        default=5.0,
+    )
+    parser.add_argument(
+        "-se",
+        "--settle_time",
+        help="Time in seconds for which the files of a time directory must be unchanged before it is processed in watch mode. Default is 2.",
+        type=float,
+        default=2.0,
+    )
+    parser.add_argument(
+        "-wo",
+        "--watch_timeout",
+        help="Time in seconds without any new time directory after which watch mode stops. Default is None, which watches until interrupted.",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "-dm",
+        "--daemon",
+        help="Address of a running pv_daemon to run the job in, either the path to a Unix socket or host:port. Default is None, which runs the job in this process.",
+        type=str,
+        default=None,
+    )
+    return parser
+
+
+def geometry_distribution_parser():
+    """
+    Parser for options for the geometry_distribution() function to call it from the
+    command line with arguments.
+
+    Returns
+    -------
+    parser
+        Parser with specified arguments.
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument(
+        "-i",
+        "--input_file",
+        help="Relative path to input file.",
+        type=str,
+        default="",
+    )
+    parser.add_argument(
+        "-o",
+        "--output_directory",
+        help="Relative path to output directory. Default is ./",
+        type=str,
+        default="./",
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="Name pattern to write out files in the output directory. Default is geometry_distribution.",
+        type=str,
+        default="geometry_distribution",
+    )
+    parser.add_argument(
+        "-p",
+        "--patches",
+        help="Patches to include in the calculation. Default is group/wall.",
+        type=str,
+        nargs="+",
+        default="group/wall",
+    )
+    parser.add_argument(
+        "-s",
+        "--span_direction",
+        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
+        type=str,
+        nargs="+",
+        default=["Z+"],
+    )
+    parser.add_argument(
+        "-l",
+        "--lift_direction",
+        help="Lift direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Y+.",
+        type=str,
+        nargs="+",
+        default=["Y+"],
+    )
+    parser.add_argument(
+        "-d",
+        "--drag_direction",
+        help="Drag direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is X+.",
+        type=str,
+        nargs="+",
+        default=["X+"],
+    )
+    parser.add_argument(
+        "-xs",
+        "--x_start",
+        help="Coordinate to start slices from. Default is [0, 0, 0].",
+        type=str,
+        nargs="+",
+        default=[0, 0, 0],
+    )
+    parser.add_argument(
+        "-xe",
+        "--x_end",
+        help="Coordinate to end slices a. Default is [0, 0, 1].",
+        type=str,
+        nargs="+",
+        default=[0, 0, 1],
+    )
+    parser.add_argument(
+        "-ns",
+        "--n_span",
+        help="Number of spanwise samples. Default is 100.",
+        type=int,
+        default=100,
+    )
+    parser.add_argument(
+        "-sl",
+        "--slicing",
+        help="Slicing mode, either multi (cut all stations in one filter execution) or station (move a single slice between stations). Default is multi.",
+        type=str,
+        default="multi",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of worker processes over which to split the time steps. Default is 1.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-pt",
+        "--partition",
+        help="Work split across workers, either time (split the time steps) or span (split the stations, clipping the surface to each worker's spanwise slab). Default is time.",
+        type=str,
+        default="time",
+    )
+    parser.add_argument(
+        "-inc",
+        "--incremental",
+        help="Flag to only process time steps whose outputs are missing or out of date, using the run manifest in the output directory. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-rd",
+        "--reduction",
+        help="Where the sections are reduced to twist, chord, and thickness, either client (fetch the sections) or server (reduce them in a Programmable Filter and only fetch the per-station values). Default is client.",
+        type=str,
+        default="client",
+    )
+    parser.add_argument(
+        "-of",
+        "--output_format",
+        help="Output format, either csv (one file per time step) or store (a compressed binary store holding all time steps). Default is csv.",
+        type=str,
+        default="csv",
+    )
+    parser.add_argument(
+        "-ct",
+        "--case_type",
+        help="Case type, either reconstructed or decomposed (read the processor directories directly). Default is reconstructed.",
+        type=str,
+        default="reconstructed",
+    )
+    parser.add_argument(
+        "-sp",
+        "--spacing",
+        help="Station spacing, either uniform (n_span evenly spaced stations) or adaptive (start from n_span stations and add stations where the results change quickly). Default is uniform.",
+        type=str,
+        default="uniform",
+    )
+    parser.add_argument(
+        "-tol",
+        "--tolerance",
+        help="Largest change of a result between neighboring stations with adaptive spacing, relative to the range of the result. Default is 0.01.",
+        type=float,
+        default=0.01,
+    )
+    parser.add_argument(
+        "-mx",
+        "--max_stations",
+        help="Maximum number of stations with adaptive spacing. Default is 1000.",
+        type=int,
+        default=1000,
+    )
+    parser.add_argument(
+        "-st",
+        "--statistics",
+        help="Flag to only write the time statistics (mean, standard deviation, minimum, and maximum) of every station to <name>_statistics.csv, updated one time step at a time. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-tt",
+        "--transient_time",
+        help="Time before which time steps are skipped, for example to exclude an initial transient from the statistics. Default is None, which processes all time steps.",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "-dm",
+        "--daemon",
+        help="Address of a running pv_daemon to run the job in, either the path to a Unix socket or host:port. Default is None, which runs the job in this process.",
+        type=str,
+        default=None,
+    )
+    return parser
+
+
+def slices_cp_parser():
+    """
+    Parser for options for the slices_cp() function to call it from
+    the command line with arguments.
+
+    Returns
+    -------
+    parser
+        Parser with specified arguments.
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument(
+        "-i",
+        "--input_file",
+        help="Relative path to input file.",
+        type=str,
+        default="",
+    )
+    parser.add_argument(
+        "-o",
+        "--output_directory",
+        help="Relative path to output directory. Default is ./",
+        type=str,
+        default="./",
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="Name pattern to write out files in the output directory. Default is slice.",
+        type=str,
+        default="slice",
+    )
+    parser.add_argument(
+        "-p",
+        "--patches",
+        help="Patches to include in the calculation. Default is group/wall.",
+        type=str,
+        nargs="+",
+        default="group/wall",
+    )
+    parser.add_argument(
+        "-s",
+        "--span_direction",
+        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
+        type=str,
+        nargs="+",
+        default=["Z+"],
+    )
+    parser.add_argument(
+        "-l",
+        "--lift_direction",
+        help="Lift direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Y+.",
+        type=str,
+        nargs="+",
+        default=["Y+"],
+    )
+    parser.add_argument(
+        "-d",
+        "--drag_direction",
+        help="Drag direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is X+.",
+        type=str,
+        nargs="+",
+        default=["X+"],
+    )
+    parser.add_argument(
+        "-x",
+        "--x",
+        help="Coordinates to sample. Default is [[0, 0, 0]].",
+        type=str,
+        nargs="+",
+        action="append",
+    )
+    parser.add_argument(
+        "-r0",
+        "--rho0",
+        help="Freestream density.",
+        type=float,
+    )
+    parser.add_argument(
+        "-u0",
+        "--u0",
+        help="Freestream velocity magnitude.",
+        type=float,
+    )
+    parser.add_argument(
+        "-p0",
+        "--p0",
+        help="Freestream pressure.",
+        type=float,
+    )
+    parser.add_argument(
+        "-sl",
+        "--slicing",
+        help="Slicing mode, either multi (cut all slices in one filter execution) or station (move a single slice between locations). Default is multi.",
+        type=str,
+        default="multi",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of worker processes over which to split the time steps. Default is 1.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-inc",
+        "--incremental",
+        help="Flag to only process time steps whose outputs are missing or out of date, using the run manifest in the output directory. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-of",
+        "--output_format",
+        help="Output format, either csv (one file per time step) or store (a compressed binary store holding all time steps). Default is csv.",
+        type=str,
+        default="csv",
+    )
+    parser.add_argument(
+        "-ct",
+        "--case_type",
+        help="Case type, either reconstructed or decomposed (read the processor directories directly). Default is reconstructed.",
+        type=str,
+        default="reconstructed",
+    )
+    parser.add_argument(
+        "-st",
+        "--statistics",
+        help="Flag to only write the time statistics (mean, standard deviation, minimum, and maximum) of every slice point to <name>_statistics_<slice index>.csv, updated one time step at a time. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-tt",
+        "--transient_time",
+        help="Time before which time steps are skipped, for example to exclude an initial transient from the statistics. Default is None, which processes all time steps.",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "-eg",
+        "--engine",
+        help="Engine computing the sections, either paraview (slice the surface with Paraview) or numpy (cut a surface cache written by pv_cache with numpy, without Paraview). Default is paraview.",
+        type=str,
+        default="paraview",
+    )
+    parser.add_argument(
+        "-wa",
+        "--watch",
+        help="Flag to keep polling the case and process the time directories completed by a running solver as they appear. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-pi",
+        "--poll_interval",
+        help="Time in seconds between polls of the case in watch mode. Default is 5.",
+        type=float,
+        default=5.0,
+    )
+    parser.add_argument(
+        "-se",
+        "--settle_time",
+        help="Time in seconds for which the files of a time directory must be unchanged before it is processed in watch mode. Default is 2.",
+        type=float,
+        default=2.0,
+    )
+    parser.add_argument(
+        "-wo",
+        "--watch_timeout",
+        help="Time in seconds without any new time directory after which watch mode stops. Default is None, which watches until interrupted.",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "-dm",
+        "--daemon",
+        help="Address of a running pv_daemon to run the job in, either the path to a Unix socket or host:port. Default is None, which runs the job in this process.",
+        type=str,
+        default=None,
+    )
+    return parser
+
+
+def sections_parser():
+    """
+    Parser for options for the sections() function to call it from the command
+    line with arguments.
+
+    Returns
+    -------
+    parser
+        Parser with specified arguments.
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument(
+        "-i",
+        "--input_file",
+        help="Relative path to input file.",
+        type=str,
+        default="",
+    )
+    parser.add_argument(
+        "-o",
+        "--output_directory",
+        help="Relative path to output directory. Default is ./",
+        type=str,
+        default="./",
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="Name pattern to write out files in the output directory. Default is sections.",
+        type=str,
+        default="sections",
+    )
+    parser.add_argument(
+        "-p",
+        "--patches",
+        help="Patches to include in the calculation. Default is group/wall.",
+        type=str,
+        nargs="+",
+        default="group/wall",
+    )
+    parser.add_argument(
+        "-out",
+        "--outputs",
+        help="Outputs to compute from the sections, any of force, geometry, and cp. Default is force geometry cp.",
+        type=str,
+        nargs="+",
+        default=["force", "geometry", "cp"],
+    )
+    parser.add_argument(
+        "-s",
+        "--span_direction",
+        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
+        type=str,
+        nargs="+",
+        default=["Z+"],
+    )
+    parser.add_argument(
+        "-f",
+        "--force_direction",
+        help="Force direction(s). Strings in (X+, X-, Y+, Y-, Z+, Z-) or lists of three floats specifying vectors, with one output column per direction. Default is Y+.",
+        type=str,
+        nargs="+",
+        default=["Y+"],
+    )
+    parser.add_argument(
+        "-mp",
+        "--moment_points",
+        help="Reference points of the sectional moments about the span direction, as lists of three floats, with one output column per point. Default is None.",
+        type=str,
+        nargs="+",
+        default=None,
+    )
+    parser.add_argument(
+        "-l",
+        "--lift_direction",
+        help="Lift direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Y+.",
+        type=str,
+        nargs="+",
+        default=["Y+"],
+    )
+    parser.add_argument(
+        "-d",
+        "--drag_direction",
+        help="Drag direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is X+.",
+        type=str,
+        nargs="+",
+        default=["X+"],
+    )
+    parser.add_argument(
+        "-xs",
+        "--x_start",
+        help="Coordinate to start slices from. Default is [0, 0, 0].",
+        type=str,
+        nargs="+",
+        default=[0, 0, 0],
+    )
+    parser.add_argument(
+        "-xe",
+        "--x_end",
+        help="Coordinate to end slices at. Default is [0, 0, 1].",
+        type=str,
+        nargs="+",
+        default=[0, 0, 1],
+    )
+    parser.add_argument(
+        "-ns",
+        "--n_span",
+        help="Number of spanwise samples. Default is 100.",
+        type=int,
+        default=100,
+    )
+    parser.add_argument(
+        "-r0",
+        "--rho0",
+        help="Freestream density, required for the cp output.",
+        type=float,
+    )
+    parser.add_argument(
+        "-u0",
+        "--u0",
+        help="Freestream velocity magnitude, required for the cp output.",
+        type=float,
+    )
+    parser.add_argument(
+        "-p0",
+        "--p0",
+        help="Freestream pressure, required for the cp output.",
+        type=float,
+    )
+    parser.add_argument(
+        "-sl",
+        "--slicing",
+        help="Slicing mode, either multi (cut all stations in one filter execution) or station (move a single slice between stations). Default is multi.",
+        type=str,
+        default="multi",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Number of worker processes over which to split the time steps. Default is 1.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-inc",
+        "--incremental",
+        help="Flag to only process time steps whose outputs are missing or out of date, using the run manifest in the output directory. Default is False.",
+        type=str,
+        default="False",
+    )
+    parser.add_argument(
+        "-of",
+        "--output_format",
+        help="Output format, either csv (one file per time step) or store (a compressed binary store holding all time steps). Default is csv.",
+        type=str,
+        default="csv",
+    )
+    parser.add_argument(
+        "-ct",
+        "--case_type",
+        help="Case type, either reconstructed or decomposed (read the processor directories directly). Default is reconstructed.",
+        type=str,
+        default="reconstructed",
+    )
+    parser.add_argument(
+        "-dm",
+        "--daemon",
+        help="Address of a running pv_daemon to run the job in, either the path to a Unix socket or host:port. Default is None, which runs the job in this process.",
+        type=str,
+        default=None,
+    )
+    return parser
@@ -0,0 +1,712 @@
+# External imports
+import numpy as np
+import scipy.sparse
+
+# Internal Imports
+import postprocessing.paraview.utils as pv_utils
+
+
+def get_face_edges(connectivity, offsets):
+    """
+    List the edges of the faces of a surface, in the order of the vertices of
+    each face.
+
+    Parameters
+    ----------
+    connectivity : ndarray
+        Point indices of the vertices of all faces.
+    offsets : ndarray
+        Start of each face in the connectivity, followed by its length, with
+        shape (n_faces + 1,).
+
+    Returns
+    -------
+    ndarray
+        Point indices of the start and end of each edge, with shape
+        (n_edges, 2).
+    ndarray
+        Face of each edge.
+    """
+    connectivity = np.asarray(connectivity)
+    offsets = np.asarray(offsets)
+    sizes = np.diff(offsets)
+    faces = np.repeat(np.arange(np.size(sizes)), sizes)
+
+    # Each vertex connects to the next one, and the last one to the first
+    following = np.arange(1, np.size(connectivity) + 1)
+    following[offsets[1:][sizes > 0] - 1] = offsets[:-1][sizes > 0]
+
+    return np.column_stack((connectivity, connectivity[following])), faces
+
+
+def create_face_index(points, connectivity, offsets, normal, n_buckets=None):
+    """
+    Index the faces of a surface by their extent along a direction, so that
+    the faces crossed by a plane normal to it are found without scanning the
+    whole surface. The extent is split into buckets of equal width, each
+    listing the faces that overlap it.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates, with shape (n_points, 3).
+    connectivity : ndarray
+        Point indices of the vertices of all faces.
+    offsets : ndarray
+        Start of each face in the connectivity, followed by its length, with
+        shape (n_faces + 1,).
+    normal : ndarray
+        Unit vector of the direction, such as the span direction.
+    n_buckets : int
+        Number of buckets. Default is None, which uses the square root of the
+        number of faces.
+
+    Returns
+    -------
+    dict
+        Face index, with the "normal", the "lower" and "upper" coordinate of
+        each face along it, the "start" and "width" of the buckets, the faces
+        of each bucket as "bucket_faces", starting at "bucket_offsets", the
+        round-off "tolerance" of the coordinates, and the face "edges" and
+        their "faces" returned by get_face_edges().
+    """
+    connectivity = np.asarray(connectivity)
+    offsets = np.asarray(offsets)
+    n_faces = np.size(offsets) - 1
+    if n_buckets is None:
+        n_buckets = max(1, int(np.sqrt(n_faces)))
+
+    # Extent of each face along the direction
+    distance = (np.asarray(points) @ normal)[connectivity]
+    if n_faces > 0:
+        lower = np.minimum.reduceat(distance, offsets[:-1])
+        upper = np.maximum.reduceat(distance, offsets[:-1])
+    else:
+        lower = upper = np.zeros(0)
+
+    start = np.min(lower) if n_faces > 0 else 0.0
+    width = max((np.max(upper) - start) / n_buckets if n_faces > 0 else 0.0, np.finfo(float).tiny)
+
+    # List each face in every bucket it overlaps
+    first = np.clip(((lower - start) // width).astype(int), 0, n_buckets - 1)
+    counts = np.clip(((upper - start) // width).astype(int), 0, n_buckets - 1) - first + 1
+    faces = np.repeat(np.arange(n_faces), counts)
+    buckets = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+    grouping = np.argsort(buckets, kind="stable")
+    edges, edge_faces = get_face_edges(connectivity, offsets)
+
+    return {
+        "normal": np.asarray(normal, dtype=float),
+        "tolerance": 1e-9 * max(abs(start), abs(start + n_buckets * width), n_buckets * width),
+        "lower": lower,
+        "upper": upper,
+        "start": start,
+        "width": width,
+        "bucket_faces": faces[grouping],
+        "bucket_offsets": np.concatenate(([0], np.cumsum(np.bincount(buckets, minlength=n_buckets)))),
+        "edges": edges,
+        "faces": edge_faces,
+    }
+
+
+def query_face_index(index, distances):
+    """
+    Find the faces crossed by planes normal to the direction of a face index.
+
+    Parameters
+    ----------
+    index : dict
+        Face index returned by create_face_index().
+    distances : ndarray
+        Coordinate of each plane along the direction of the index.
+
+    Returns
+    -------
+    ndarray
+        Sorted indices of the faces with lower < distance <= upper for at
+        least one plane, along with the faces within round-off of a plane.
+    """
+    distances = np.sort(np.atleast_1d(np.asarray(distances, dtype=float)))
+    n_buckets = np.size(index["bucket_offsets"]) - 1
+    tolerance = index["tolerance"]
+
+    # Gather the faces of the buckets holding the planes
+    bounds = np.concatenate((distances - tolerance, distances + tolerance))
+    buckets = np.unique(((bounds - index["start"]) // index["width"]).astype(int))
+    buckets = buckets[(buckets >= 0) & (buckets < n_buckets)]
+    faces = np.unique(
+        np.concatenate(
+            [np.zeros(0, dtype=int)]
+            + [
+                index["bucket_faces"][index["bucket_offsets"][bucket] : index["bucket_offsets"][bucket + 1]]
+                for bucket in buckets
+            ]
+        )
+    )
+
+    # Keep the faces that a plane actually crosses
+    first = np.searchsorted(distances, index["lower"][faces] - tolerance, side="right")
+    last = np.searchsorted(distances, index["upper"][faces] + tolerance, side="right")
+
+    return faces[last > first]
+
+
+def get_face_edge_indices(offsets, faces):
+    """
+    Get the indices of the edges of some faces, as numbered by
+    get_face_edges().
+
+    Parameters
+    ----------
+    offsets : ndarray
+        Start of each face in the connectivity, followed by its length.
+    faces : ndarray
+        Indices of the faces.
+
+    Returns
+    -------
+    ndarray
+        Indices of the edges of the faces, in order.
+    """
+    offsets = np.asarray(offsets)
+    counts = offsets[np.asarray(faces) + 1] - offsets[faces]
+
+    return np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(offsets[faces], counts)
+
+
+def cut_surface(points, edges, origin, normal, plane_offsets, candidates=None):
+    """
+    Cut the faces of a surface with parallel planes, all at once. A point lies
+    above a plane when its distance to the plane is positive or zero, and
+    every face edge with one point on each side is cut. The cuts of each face
+    are paired in the order of its edges, giving one line segment per face
+    and plane, which is exact for convex faces.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates, with shape (n_points, 3).
+    edges : ndarray
+        Face edges returned by get_face_edges(), with shape (n_edges, 2).
+    origin : ndarray
+        Point of the plane with zero offset.
+    normal : ndarray
+        Unit normal of the planes.
+    plane_offsets : ndarray
+        Offset of each plane from the origin along the normal.
+    candidates : ndarray
+        Indices of the edges of the faces that may be cut, such as those of
+        the faces returned by query_face_index(). Default is None, which
+        checks every edge.
+
+    Returns
+    -------
+    dict
+        Cut with the "plane" of each segment, and the "edges" cut at both ends
+        of each segment, as indices into the edges, with the "weights" of the
+        end point of the edges, with shape (n_segments, 2).
+    """
+    if candidates is None:
+        candidates = np.arange(np.size(edges, 0))
+    plane_offsets = np.asarray(plane_offsets, dtype=float)
+    points = np.asarray(points)
+    start = (points[edges[candidates, 0]] - origin) @ normal
+    end = (points[edges[candidates, 1]] - origin) @ normal
+
+    # Each edge is cut by the planes with lower < offset <= upper, which are
+    # contiguous once the planes are sorted
+    order = np.argsort(plane_offsets, kind="stable")
+    sorted_offsets = plane_offsets[order]
+    first = np.searchsorted(sorted_offsets, np.minimum(start, end), side="right")
+    last = np.searchsorted(sorted_offsets, np.maximum(start, end), side="right")
+    counts = last - first
+
+    cut_edges = np.repeat(np.arange(np.size(candidates)), counts)
+    cut_planes = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+
+    # Group the cuts by plane, keeping the order of the edges within each face
+    grouping = np.lexsort((cut_edges, cut_planes))
+    cut_edges = cut_edges[grouping]
+    cut_planes = cut_planes[grouping]
+    weights = (sorted_offsets[cut_planes] - start[cut_edges]) / (end[cut_edges] - start[cut_edges])
+
+    return {
+        "plane": order[cut_planes[0::2]],
+        "edges": np.reshape(candidates[cut_edges], (-1, 2)),
+        "weights": np.reshape(weights, (-1, 2)),
+    }
+
+
+def interpolate_cut(cut, edges, values):
+    """
+    Interpolate point values at the ends of the segments of a cut.
+
+    Parameters
+    ----------
+    cut : dict
+        Cut returned by cut_surface().
+    edges : ndarray
+        Face edges the cut was computed from.
+    values : ndarray
+        Point values, with shape (n_points,) or (n_points, n_components).
+
+    Returns
+    -------
+    ndarray
+        Values at the start and end of each segment, with shape
+        (n_segments, 2) followed by the shape of the values components.
+    """
+    values = np.asarray(values)
+    weights = np.reshape(cut["weights"], np.shape(cut["weights"]) + (1,) * (np.ndim(values) - 1))
+    start = values[edges[cut["edges"], 0]]
+    end = values[edges[cut["edges"], 1]]
+
+    return start + weights * (end - start)
+
+
+def integrate_cut_loads(cut, edges, faces, points, force, n_planes, directions, moment_points=None, moment_axis=None):
+    """
+    Integrate the force per unit area along the segments of a cut, projected
+    onto several directions, and the moments of the force about several
+    reference points, for every plane. The values are interpolated linearly
+    along each segment, as by integrate_loads().
+
+    Parameters
+    ----------
+    cut : dict
+        Cut returned by cut_surface().
+    edges : ndarray
+        Face edges the cut was computed from.
+    faces : ndarray
+        Face of each edge.
+    points : ndarray
+        Point coordinates, with shape (n_points, 3).
+    force : ndarray
+        Force per unit area at each point, with shape (n_points, 3), or of
+        each face, with shape (n_faces, 3), constant along its segments.
+    n_planes : int
+        Number of planes of the cut.
+    directions : ndarray
+        Directions onto which the force is projected, with shape
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments, with shape (n_moments, 3). Default
+        is None, which computes no moment.
+    moment_axis : ndarray
+        Unit vector onto which the moments are projected, such as the span
+        direction. Default is None.
+
+    Returns
+    -------
+    ndarray
+        Integrated forces followed by the integrated moments of each plane,
+        with shape (n_planes, n_directions + n_moments).
+    """
+    ends = interpolate_cut(cut, edges, points)
+    if np.size(force, 0) == np.size(points, 0):
+        force = interpolate_cut(cut, edges, force)
+    else:
+        force = np.repeat(np.asarray(force)[faces[cut["edges"][:, 0]], np.newaxis, :], 2, axis=1)
+
+    # Projected forces and moments at both ends of each segment
+    values = [force @ np.reshape(directions, (-1, 3)).T]
+    if moment_points is not None and np.size(moment_points) > 0:
+        arms = ends[:, :, np.newaxis, :] - np.reshape(moment_points, (1, 1, -1, 3))
+        values.append(np.cross(arms, force[:, :, np.newaxis, :]) @ moment_axis)
+    values = np.concatenate(values, axis=2)
+
+    length = np.linalg.norm(ends[:, 1, :] - ends[:, 0, :], axis=1)
+    segment_loads = length[:, np.newaxis] * 0.5 * (values[:, 0, :] + values[:, 1, :])
+
+    loads = np.zeros((n_planes, np.size(values, 2)))
+    np.add.at(loads, cut["plane"], segment_loads)
+
+    return loads
+
+
+def compute_surface_loads(
+    surface, x, span_direction, force_direction, moment_points=None, array="forcePerS", index=None
+):
+    """
+    Compute the force, and optionally the moment, of every station from a
+    surface held in numpy arrays, without Paraview. The point values of the
+    force, as interpolated by Paraview, are used when the surface holds them,
+    and the face values otherwise.
+
+    Parameters
+    ----------
+    surface : dict
+        Surface with the "points", face "connectivity" and "offsets" arrays,
+        and the "cell_arrays" and "point_arrays" dictionaries, as returned by
+        load_surface().
+    x : ndarray
+        Coordinates of the stations, with shape (n_stations, 3).
+    span_direction : ndarray
+        Span direction, used as the normal of the planes.
+    force_direction : ndarray
+        Direction(s) onto which the force is projected, with shape (3,) or
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments about the span direction, with shape
+        (n_moments, 3). Default is None, which computes no moment.
+    array : str
+        Name of the force per unit area array. Default is "forcePerS".
+    index : dict
+        Face index of the surface along the span direction, returned by
+        create_face_index(), so that only the faces near the stations are
+        cut. Default is None, which checks every face.
+
+    Returns
+    -------
+    ndarray
+        Forces followed by moments per unit length of each station, with shape
+        (n_stations, n_directions + n_moments).
+    """
+    force = get_surface_force(surface, array)
+    points = np.asarray(surface["points"])
+    cut, edges, faces = _cut_stations(surface, x, span_direction, index)
+
+    return integrate_cut_loads(
+        cut, edges, faces, points, force, np.size(x, 0), force_direction, moment_points, span_direction
+    )
+
+
+def _cut_stations(surface, x, span_direction, index=None):
+    """
+    Cut a surface at every station, only checking the edges of the faces
+    crossed by a station when a face index is given, and return the cut with
+    the face edges and their faces.
+    """
+    if index is None:
+        edges, faces = get_face_edges(surface["connectivity"], surface["offsets"])
+        candidates = None
+    else:
+        if not np.allclose(index["normal"], span_direction):
+            raise ValueError("The face index was built along {}, not {}.".format(index["normal"], span_direction))
+        edges, faces = index["edges"], index["faces"]
+        candidates = get_face_edge_indices(surface["offsets"], query_face_index(index, x @ span_direction))
+
+    cut = cut_surface(
+        np.asarray(surface["points"]), edges, x[0, :], span_direction, (x - x[0, :]) @ span_direction, candidates
+    )
+
+    return cut, edges, faces
+
+
+def get_surface_force(surface, array="forcePerS"):
+    """
+    Get the force per unit area of a surface, at its points when Paraview
+    interpolated them, and of its faces otherwise.
+
+    Parameters
+    ----------
+    surface : dict
+        Surface returned by load_surface().
+    array : str
+        Name of the force per unit area array. Default is "forcePerS".
+
+    Returns
+    -------
+    ndarray
+        Force per unit area, with shape (n_points, 3) or (n_faces, 3).
+    """
+    if array in surface["point_arrays"]:
+        return surface["point_arrays"][array]
+    if array in surface["cell_arrays"]:
+        return surface["cell_arrays"][array]
+    raise RuntimeError("Array {} is not held by the surface.".format(array))
+
+
+def create_load_operator(
+    surface, x, span_direction, force_direction, moment_points=None, array="forcePerS", index=None
+):
+    """
+    Build the sparse matrix mapping the force per unit area of a surface to
+    the forces and moments of every station. The map only depends on the
+    mesh, so on a static mesh it is built once and applied to the force of
+    every time step.
+
+    Parameters
+    ----------
+    surface : dict
+        Surface returned by load_surface(), whose mesh is used.
+    x : ndarray
+        Coordinates of the stations, with shape (n_stations, 3).
+    span_direction : ndarray
+        Span direction, used as the normal of the planes.
+    force_direction : ndarray
+        Direction(s) onto which the force is projected, with shape (3,) or
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments about the span direction, with shape
+        (n_moments, 3). Default is None, which computes no moment.
+    array : str
+        Name of the force per unit area array. Default is "forcePerS".
+    index : dict
+        Face index of the surface along the span direction. Default is None,
+        which checks every face.
+
+    Returns
+    -------
+    dict
+        Load operator, with the sparse "matrix" of shape
+        (n_stations * n_loads, 3 * n_values), the number of "stations", and
+        the force "array".
+    """
+    points = np.asarray(surface["points"])
+    n_values = np.size(get_surface_force(surface, array), 0)
+    cut, edges, faces = _cut_stations(surface, x, span_direction, index)
+
+    # Vector dotted with the force at both ends of each segment for every load,
+    # using (arm x force) . axis = force . (axis x arm) for the moments
+    ends = interpolate_cut(cut, edges, points)
+    n_segments = np.size(cut["plane"])
+    directions = np.reshape(force_direction, (-1, 3))
+    coefficients = [np.broadcast_to(directions, (n_segments, 2) + np.shape(directions))]
+    if moment_points is not None and np.size(moment_points) > 0:
+        arms = ends[:, :, np.newaxis, :] - np.reshape(moment_points, (1, 1, -1, 3))
+        coefficients.append(np.cross(span_direction, arms))
+    coefficients = np.concatenate(coefficients, axis=2)
+    n_loads = np.size(coefficients, 2)
+
+    # Trapezoidal weight of both ends of each segment
+    length = np.linalg.norm(ends[:, 1, :] - ends[:, 0, :], axis=1)
+    coefficients = 0.5 * length[:, np.newaxis, np.newaxis, np.newaxis] * coefficients
+
+    # Values each end is interpolated from, with their weights
+    if n_values == np.size(points, 0):
+        columns = np.stack((edges[cut["edges"], 0], edges[cut["edges"], 1]), axis=2)
+        weights = np.stack((1.0 - cut["weights"], cut["weights"]), axis=2)
+    else:
+        columns = faces[cut["edges"]][:, :, np.newaxis]
+        weights = np.ones(np.shape(columns))
+
+    # One entry per segment end, interpolated value, load, and force component
+    shape = np.shape(columns) + (n_loads, 3)
+    rows = np.broadcast_to((cut["plane"] * n_loads)[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis], shape)
+    rows = rows + np.arange(n_loads)[:, np.newaxis]
+    columns = 3 * columns[:, :, :, np.newaxis, np.newaxis] + np.arange(3)
+    values = weights[:, :, :, np.newaxis, np.newaxis] * coefficients[:, :, np.newaxis, :, :]
+    matrix = scipy.sparse.csr_matrix(
+        (np.ravel(values), (np.ravel(rows), np.ravel(np.broadcast_to(columns, shape)))),
+        shape=(np.size(x, 0) * n_loads, 3 * n_values),
+    )
+
+    return {"matrix": matrix, "stations": np.size(x, 0), "array": array}
+
+
+def apply_load_operator(operator, surfaces):
+    """
+    Compute the forces and moments of every station for several time steps
+    at once, with a single sparse matrix product.
+
+    Parameters
+    ----------
+    operator : dict
+        Load operator returned by create_load_operator().
+    surfaces : list
+        Surfaces of the time steps, returned by load_surface(), on the mesh
+        the operator was built from.
+
+    Returns
+    -------
+    ndarray
+        Forces followed by moments per unit length of each station, with shape
+        (n_time_steps, n_stations, n_directions + n_moments).
+    """
+    forces = np.column_stack([np.ravel(get_surface_force(surface, operator["array"])) for surface in surfaces])
+    if np.size(forces, 0) != np.size(operator["matrix"], 1):
+        raise RuntimeError(
+            "The load operator was built for {} force values, got {}.".format(
+                np.size(operator["matrix"], 1) // 3, np.size(forces, 0) // 3
+            )
+        )
+
+    return np.reshape(np.transpose(operator["matrix"] @ forces), (len(surfaces), operator["stations"], -1))
+
+
+def cut_sections(surface, x, span_direction, index=None):
+    """
+    Cut a surface at every station into sections, as fetched from Paraview's
+    slice by fetch_sections(), recording the two surface points each section
+    point lies between and its weight, so that the point values of other time
+    steps on the same mesh can be gathered without cutting again.
+
+    Parameters
+    ----------
+    surface : dict
+        Surface returned by load_surface(), whose mesh is cut.
+    x : ndarray
+        Coordinates of the stations, with shape (n_stations, 3).
+    span_direction : ndarray
+        Span direction, used as the normal of the planes.
+    index : dict
+        Face index of the surface along the span direction. Default is None,
+        which checks every face.
+
+    Returns
+    -------
+    list
+        One dictionary per station holding the section "points", the section
+        "lines" as point index pairs, the surface points each section point
+        is interpolated between as "ends", with shape (n_section_points, 2),
+        and the "weights" of the second end.
+    """
+    points = np.asarray(surface["points"])
+    cut, edges, _ = _cut_stations(surface, x, span_direction, index)
+    n_segments = np.size(cut["plane"])
+
+    # Merge the segment ends shared by neighboring faces, or by the edges
+    # meeting at a point that lies on a plane
+    ends = np.reshape(interpolate_cut(cut, edges, points), (-1, 3))
+    kept, lines = pv_utils.merge_points(ends, np.reshape(np.arange(2 * n_segments), (-1, 2)))
+    sources = np.reshape(edges[cut["edges"]], (-1, 2))[kept]
+    weights = np.ravel(cut["weights"])[kept]
+
+    # Group the segments by station
+    order = np.argsort(cut["plane"], kind="stable")
+    bounds = np.searchsorted(cut["plane"][order], np.arange(np.size(x, 0) + 1))
+    sections = []
+    for k in range(np.size(x, 0)):
+        used, inverse = np.unique(lines[order[bounds[k] : bounds[k + 1]]], return_inverse=True)
+        sections.append(
+            {
+                "points": ends[kept[used]],
+                "lines": np.reshape(inverse, (-1, 2)),
+                "ends": sources[used],
+                "weights": weights[used],
+            }
+        )
+
+    return sections
+
+
+def create_gather_operator(sections, n_points):
+    """
+    Build the sparse matrix interpolating the point values of a surface at the
+    points of cut sections, in the order of their points.
+
+    Parameters
+    ----------
+    sections : list
+        Sections holding the "ends" and "weights" of their points, such as
+        those returned by cut_sections(), in any point order.
+    n_points : int
+        Number of points of the surface.
+
+    Returns
+    -------
+    dict
+        Gather operator, with the sparse "matrix" of shape
+        (n_section_points, n_points) and the "bounds" of the rows of each
+        section.
+    """
+    sizes = [np.size(section["weights"]) for section in sections]
+    ends = np.concatenate(
+        [np.zeros((0, 2), dtype=int)] + [np.reshape(section["ends"], (-1, 2)) for section in sections]
+    )
+    weights = np.concatenate([np.zeros(0)] + [section["weights"] for section in sections])
+
+    matrix = scipy.sparse.csr_matrix(
+        (
+            np.ravel(np.column_stack((1.0 - weights, weights))),
+            (np.repeat(np.arange(np.size(weights)), 2), np.ravel(ends)),
+        ),
+        shape=(np.size(weights), n_points),
+    )
+
+    return {"matrix": matrix, "bounds": np.concatenate(([0], np.cumsum(sizes, dtype=int)))}
+
+
+def gather_sections(operator, values):
+    """
+    Interpolate point values of a surface at the points of every section, with
+    a single sparse matrix product.
+
+    Parameters
+    ----------
+    operator : dict
+        Gather operator returned by create_gather_operator().
+    values : ndarray
+        Point values of the surface, on the mesh the operator was built from,
+        with shape (n_points,) or (n_points, n_components).
+
+    Returns
+    -------
+    list
+        Values at the points of each section.
+    """
+    if np.size(values, 0) != np.size(operator["matrix"], 1):
+        raise RuntimeError(
+            "The gather operator was built for {} points, got {}.".format(
+                np.size(operator["matrix"], 1), np.size(values, 0)
+            )
+        )
+
+    gathered = np.asarray(operator["matrix"] @ np.asarray(values))
+    bounds = operator["bounds"]
+
+    return [gathered[bounds[k] : bounds[k + 1]] for k in range(np.size(bounds) - 1)]
+
+
+def create_cp_plan(sections, lift_direction, drag_direction, n_points):
+    """
+    Sort sections cut with numpy once, and record the surface points and
+    weights the pressure of each sorted point is interpolated from, so that
+    the pressure coefficient of other time steps on the same mesh is gathered
+    without cutting and sorting the sections again.
+
+    Parameters
+    ----------
+    sections : list
+        Sections returned by cut_sections().
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+    n_points : int
+        Number of points of the surface.
+
+    Returns
+    -------
+    dict
+        Plan with the sorted 2D "coords" of each section and the "operator"
+        gathering the pressure at the sorted points, returned by
+        create_gather_operator().
+    """
+    coords = []
+    sorted_sections = []
+    for section in sections:
+        coords2D, arrays = pv_utils.sort_section(
+            section, lift_direction, drag_direction, {"ends": section["ends"], "weights": section["weights"]}
+        )
+        coords.append(coords2D)
+        sorted_sections.append(arrays)
+
+    return {"coords": coords, "operator": create_gather_operator(sorted_sections, n_points)}
+
+
+def apply_cp_plan(plan, pressure, rho0, u0, p0):
+    """
+    Compute the pressure coefficient at the sorted points of every section of
+    a plan.
+
+    Parameters
+    ----------
+    plan : dict
+        Plan returned by create_cp_plan().
+    pressure : ndarray
+        Pressure at the points of the surface.
+    rho0 : float
+        Freestream density.
+    u0 : float
+        Freestream velocity magnitude.
+    p0 : float
+        Freestream pressure.
+
+    Returns
+    -------
+    list
+        Pressure coefficient of each section.
+    """
+    return [(values - p0) / (0.5 * rho0 * u0 * u0) for values in gather_sections(plan["operator"], pressure)]
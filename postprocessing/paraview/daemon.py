@@ -0,0 +1,346 @@
+# External imports
+import io
+import os
+import socket
+import secrets
+import argparse
+import ipaddress
+import importlib
+import traceback
+import contextlib
+import multiprocessing
+from multiprocessing.connection import Listener, Client
+
+
+# Jobs accepted by the daemon, imported on first use so that submitting a job
+# does not import Paraview
+JOBS = {
+    "force_distribution": "postprocessing.paraview.distributions:force_distribution",
+    "geometry_distribution": "postprocessing.paraview.distributions:geometry_distribution",
+    "slices_cp": "postprocessing.paraview.slices:slices_cp",
+    "sections": "postprocessing.paraview.sections:sections",
+    "cache_surface": "postprocessing.paraview.cache:cache_surface",
+}
+
+# Per-user file holding the random key that authenticates the connections to
+# the daemon, created on the first start
+KEY_FILE = os.path.join("~", ".postprocessing", "pv_daemon.key")
+
+
+def daemon_cmd():
+    """
+    Wrapper around the run_daemon() function to call it from the command line
+    with arguments.
+    """
+    # Parse arguments
+    parser = daemon_parser()
+    args = vars(parser.parse_args())
+
+    # Call function
+    if args.pop("shutdown") == "True":
+        shutdown_daemon(**args)
+    else:
+        run_daemon(**args)
+
+
+def daemon_parser():
+    """
+    Parser for options for the run_daemon() function to call it from the
+    command line with arguments.
+
+    Returns
+    -------
+    parser
+        Parser with specified arguments.
+    """
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument(
+        "-a",
+        "--address",
+        help="Address to listen on, either the path to a Unix socket or host:port for a TCP socket on the loopback interface. Default is pv_daemon.sock.",
+        type=str,
+        default="pv_daemon.sock",
+    )
+    parser.add_argument(
+        "-ak",
+        "--authkey",
+        help="Key the clients must present to submit jobs, required to listen on a TCP port that is not on the loopback interface. Default is None, which uses the random key of the per-user key file {}, created with 0600 permissions on the first start.".format(
+            KEY_FILE
+        ),
+        type=str,
+        default=None,
+    )
+    parser.add_argument(
+        "-sd",
+        "--shutdown",
+        help="Flag to stop the daemon running at the address instead of starting one. Default is False.",
+        type=str,
+        default="False",
+    )
+    return parser
+
+
+def parse_address(address):
+    """
+    Convert a daemon address to the format used by multiprocessing.connection.
+
+    Parameters
+    ----------
+    address : str
+        Path to a Unix socket, or host:port for a TCP socket.
+
+    Returns
+    -------
+    str or tuple
+        Path to the Unix socket, or (host, port) tuple for a TCP socket.
+    """
+    host, separator, port = address.rpartition(":")
+    if separator and os.sep not in address and port.isdigit():
+        return (host, int(port))
+
+    return os.path.abspath(address)
+
+
+def is_loopback(address):
+    """
+    Check if a daemon address can only be reached from this machine, either a
+    Unix socket or a TCP socket on the loopback interface.
+
+    Parameters
+    ----------
+    address : str
+        Path to a Unix socket, or host:port for a TCP socket.
+
+    Returns
+    -------
+    bool
+        True if the address is a Unix socket or a loopback TCP socket.
+    """
+    parsed = parse_address(address)
+    if not isinstance(parsed, tuple):
+        return True
+
+    try:
+        addresses = [info[4][0] for info in socket.getaddrinfo(parsed[0], parsed[1], proto=socket.IPPROTO_TCP)]
+    except socket.gaierror:
+        return False
+
+    return len(addresses) > 0 and all(ipaddress.ip_address(host).is_loopback for host in addresses)
+
+
+def get_authkey(authkey=None, create=False):
+    """
+    Get the key authenticating the connections to the daemon. Unless a key is
+    given, the random key of the per-user key file is used, which is only
+    readable by its owner.
+
+    Parameters
+    ----------
+    authkey : str
+        Key to use instead of the key file. Default is None.
+    create : bool
+        Create the key file with a random key if it does not exist, as done
+        when the daemon starts. Default is False.
+
+    Returns
+    -------
+    bytes
+        Key.
+    """
+    if authkey is not None:
+        return authkey.encode()
+
+    key_file = os.path.expanduser(KEY_FILE)
+    if not os.path.isfile(key_file):
+        if not create:
+            raise RuntimeError("Daemon key file {} not found, start pv_daemon first.".format(key_file))
+
+        # Only the owner can read the key, and an existing file is never overwritten
+        os.makedirs(os.path.dirname(key_file), mode=0o700, exist_ok=True)
+        descriptor = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(descriptor, "w") as f:
+            f.write(secrets.token_hex(32))
+
+    if os.stat(key_file).st_mode & 0o077:
+        raise RuntimeError("Daemon key file {} must only be accessible by its owner, run chmod 600.".format(key_file))
+    with open(key_file, "r") as f:
+        return f.read().strip().encode()
+
+
+def run_daemon(address="pv_daemon.sock", authkey=None):
+    """
+    Run a long-lived process that keeps Paraview imported and the cases it
+    reads open, and runs the jobs submitted with submit_job() or the --daemon
+    option of the command line utilities. Jobs are run one at a time until a
+    shutdown is requested.
+
+    Parameters
+    ----------
+    address : str
+        Address to listen on, either the path to a Unix socket or host:port for
+        a TCP socket on the loopback interface. Default is "pv_daemon.sock".
+    authkey : str
+        Key the clients must present to submit jobs, required to listen on a
+        TCP port that is not on the loopback interface. Default is None, which
+        uses the random key of the per-user key file, created on the first
+        start.
+    """
+    # Jobs are pickled, so whoever can submit one can run code as this user
+    if authkey is None and not is_loopback(address):
+        raise ValueError(
+            "Address {} is not a Unix socket or on the loopback interface, pass an explicit key to listen on it.".format(
+                address
+            )
+        )
+    key = get_authkey(authkey, create=True)
+
+    # Keep the readers open between jobs
+    importlib.import_module("postprocessing.paraview.case").enable_reader_cache()
+
+    # Only the user can connect to a Unix socket
+    umask = os.umask(0o177)
+    try:
+        listener = Listener(parse_address(address), authkey=key)
+    finally:
+        os.umask(umask)
+
+    with listener:
+        print("Listening on {}.".format(address))
+        serve(listener)
+
+
+def serve(listener):
+    """
+    Accept connections and run the submitted jobs until a shutdown is
+    requested.
+
+    Parameters
+    ----------
+    listener : multiprocessing.connection.Listener
+        Listener accepting the client connections.
+    """
+    while True:
+        try:
+            connection = listener.accept()
+        except (multiprocessing.AuthenticationError, EOFError, OSError) as error:
+            print("Warning: Rejected connection, {}.".format(error))
+            continue
+
+        with connection:
+            try:
+                job = connection.recv()
+            except EOFError:
+                continue
+            if job["name"] == "shutdown":
+                connection.send({"status": "ok", "output": "", "result": None})
+                return
+            connection.send(run_job(job))
+
+
+def run_job(job):
+    """
+    Run a job in the working directory of the client, capturing what it
+    prints.
+
+    Parameters
+    ----------
+    job : dict
+        Job with the "name" of the function to run, its "kwargs", and the
+        "cwd" of the client.
+
+    Returns
+    -------
+    dict
+        Job "status", either "ok" or "error", the printed "output", and the
+        "result" of the function or the "error" traceback.
+    """
+    output = io.StringIO()
+    cwd = os.getcwd()
+    try:
+        function = get_job_function(job["name"])
+
+        os.chdir(job["cwd"])
+        with contextlib.redirect_stdout(output):
+            result = function(**job["kwargs"])
+
+        return {"status": "ok", "output": output.getvalue(), "result": result}
+    except Exception:
+        return {"status": "error", "output": output.getvalue(), "error": traceback.format_exc()}
+    finally:
+        os.chdir(cwd)
+
+
+def get_job_function(name):
+    """
+    Import the function of a job.
+
+    Parameters
+    ----------
+    name : str
+        Name of the job, such as "force_distribution".
+
+    Returns
+    -------
+    function
+        Function of the job.
+    """
+    if name not in JOBS:
+        raise ValueError("Job {} not recognized, options are {}.".format(name, ", ".join(JOBS)))
+    module, function = JOBS[name].split(":")
+
+    return getattr(importlib.import_module(module), function)
+
+
+def submit_job(address, name, kwargs, authkey=None):
+    """
+    Submit a job to a running daemon and wait for it to finish. What the job
+    prints is printed here, and a failed job raises an error holding the
+    traceback from the daemon. This function does not import Paraview, so it
+    can be called cheaply from an optimization driver.
+
+    Parameters
+    ----------
+    address : str
+        Address of the daemon, either the path to a Unix socket or host:port
+        for a TCP socket.
+    name : str
+        Name of the job, such as "force_distribution".
+    kwargs : dict
+        Keyword arguments of the job function. Relative paths are relative to
+        the current working directory.
+    authkey : str
+        Key expected by the daemon. Default is None, which uses the key of the
+        per-user key file.
+
+    Returns
+    -------
+    object
+        Value returned by the job function.
+    """
+    with Client(parse_address(address), authkey=get_authkey(authkey)) as connection:
+        connection.send({"name": name, "kwargs": kwargs, "cwd": os.getcwd()})
+        response = connection.recv()
+
+    print(response["output"], end="")
+    if response["status"] != "ok":
+        raise RuntimeError("Job {} failed in the daemon at {}:\n{}".format(name, address, response["error"]))
+
+    return response["result"]
+
+
+def shutdown_daemon(address, authkey=None):
+    """
+    Stop a running daemon once its current job is finished.
+
+    Parameters
+    ----------
+    address : str
+        Address of the daemon, either the path to a Unix socket or host:port
+        for a TCP socket.
+    authkey : str
+        Key expected by the daemon. Default is None, which uses the key of the
+        per-user key file.
+    """
+    with Client(parse_address(address), authkey=get_authkey(authkey)) as connection:
+        connection.send({"name": "shutdown"})
+        connection.recv()
@@ -1,139 +1,554 @@
 # External imports
 import os
-import csv
-import argparse
 import numpy as np
-import scipy
-from scipy.interpolate import Akima1DInterpolator
-
-# Paraview imports
-import paraview.simple as paraview
-from vtk.util import numpy_support as vtk_np
 
 # Internal Imports
 import postprocessing.utils as utils
 import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.slicing as pv_slicing
+import postprocessing.paraview.case as pv_case
+import postprocessing.paraview.parallel as pv_parallel
+import postprocessing.paraview.mpi as pv_mpi
+import postprocessing.paraview.reduction as pv_reduction
+import postprocessing.paraview.statistics as pv_statistics
+import postprocessing.paraview.spectra as pv_spectra
+import postprocessing.paraview.watch as pv_watch
+import postprocessing.paraview.surface as pv_surface
+import postprocessing.paraview.cutting as pv_cutting
+import postprocessing.paraview.outputs as pv_outputs
+
+# Command line entry points, kept importable from this module
+from postprocessing.paraview.commands import (  # noqa: F401
+    force_distribution_cmd,
+    force_distribution_parser,
+    geometry_distribution_cmd,
+    geometry_distribution_parser,
+)
+
+# Section properties, kept importable from this module
+from postprocessing.paraview.reduction import compute_section_properties  # noqa: F401
 
 
-def force_distribution_cmd():
+def force_distribution(
+    input_file=None,
+    output_directory="./",
+    name="force_distribution",
+    patches="group/wall",
+    span_direction="Z+",
+    force_direction="Y+",
+    x_start=[0, 0, 0],
+    x_end=[0, 0, 1],
+    n_span=100,
+    slicing="multi",
+    workers=1,
+    partition="time",
+    incremental="False",
+    output_format="csv",
+    case_type="reconstructed",
+    spacing="uniform",
+    tolerance=0.01,
+    max_stations=1000,
+    moment_points=None,
+    statistics="False",
+    transient_time=None,
+    spectra="False",
+    segment_length=256,
+    overlap=0.5,
+    engine="paraview",
+    time_values=None,
+    time_indices=None,
+    pipeline=None,
+):
+    """
+    Function to compute a force distribution using Paraview.
+
+
+    Parameters
+    ----------
+    input_file : str
+        Path to file to load with Paraview.
+    output_directory : str
+        Path to directory where the distribution files will be written. Default
+        is "./".
+    name : str
+        Name pattern to write out files in the output directory. Default is
+        "force_distribution".
+    patches : str or list
+        Patch name(s) over which to compute the force distribution. Default
+        is "group/wall".
+    span_direction : str or list
+        Vector direction for span direction either as a string (eg. X) or list
+        (eg. [0 0 1]). Should be of magnitude 1. Default is "Z+".
+    force_direction : str or list
+        Vector direction for force direction either as a string (eg. X) or list
+        (eg. [0 1 0]). Should be of magnitude 1. Several directions can be
+        given as a list (eg. ["Y+", "X+"]), and are all integrated from the
+        same sections. Default is "Y+".
+    x_start : list
+        Coordinates to start slices from. Default is [0, 0, 0].
+    x_end : list
+        Coordinates to end slices at. Default is [0, 0, 1].
+    n_span : int
+        Number of spanwise samples. Default is 100.
+    slicing : str
+        Slicing mode. With "multi", all stations are cut in a single filter
+        execution and fetched in one transfer per time step. With "station", a
+        single slice is moved between stations. Default is "multi".
+    workers : int
+        Number of worker processes over which to split the time steps. Each
+        worker opens its own reader. Default is 1.
+    partition : str
+        How the work is split across workers. With "time", each worker
+        processes a subset of the time steps. With "span", each worker clips
+        the surface to the slab around a contiguous chunk of stations and the
+        results are merged into the same per-time-step file. Default is "time".
+    incremental : str
+        Flag to only process the time steps whose outputs are missing or were
+        written from different inputs, as recorded in the run manifest of the
+        output directory. Default is "False".
+    output_format : str
+        Output format. With "csv", one file is written per time step. With
+        "store", the results of all time steps are written in compressed
+        chunks of a results store directory named <name>_store, which can be
+        loaded with postprocessing.paraview.store.load_store(). Default is
+        "csv".
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly, in parallel when running with MPI.
+        Default is "reconstructed".
+    spacing : str
+        Station spacing. With "uniform", n_span evenly spaced stations are
+        used. With "adaptive", the n_span evenly spaced stations are refined
+        at every time step by adding stations in the middle of the intervals
+        over which the results change by more than the tolerance. Default is
+        "uniform".
+    tolerance : float
+        Largest change of a result between neighboring stations with adaptive
+        spacing, relative to the range of the result. Default is 0.01.
+    max_stations : int
+        Maximum number of stations with adaptive spacing. Default is 1000.
+    moment_points : list
+        Reference points of the sectional moments, either as a list of points
+        (eg. [[0.25, 0, 0]]) or as a flat list of coordinates. The moments are
+        taken about the span direction through each point. Default is None,
+        which computes no moment.
+    statistics : str
+        Flag to only write the time statistics of every station to
+        <name>_statistics.csv instead of one file per time step. The mean,
+        standard deviation, minimum, and maximum are updated one time step at
+        a time, so the memory used does not depend on the number of time
+        steps. Default is "False".
+    transient_time : float
+        Time before which time steps are skipped, for example to exclude an
+        initial transient from the statistics. Default is None, which
+        processes all time steps.
+    spectra : str
+        Flag to write the one-sided power spectral density of the forces and
+        moments of every station to <name>_spectra.csv instead of one file
+        per time step. The time steps are split into overlapping segments with
+        a Hann window, whose periodograms are averaged (Welch's method). Only
+        the time steps of one segment are held in memory. The time steps must
+        be uniformly spaced. Default is "False".
+    segment_length : int
+        Number of time steps per segment of the spectra, which sets the
+        frequency resolution. Default is 256.
+    overlap : float
+        Fraction of each segment of the spectra shared with the next one.
+        Default is 0.5.
+    engine : str
+        Engine computing the sections. With "paraview", the surface is sliced
+        with Paraview at every time step. With "numpy", the faces of a surface
+        cache written by pv_cache are cut at all stations at once with numpy,
+        without Paraview, which requires a surface cache as the input file.
+        On a static mesh with uniform spacing, the numpy engine only cuts the
+        surface once, as long as the points of every time step match those
+        of the first one. Default is "paraview".
+    time_values : list
+        Time values of the time steps to process, such as the time directories
+        completed since the last poll of watch mode. Default is None, which
+        processes all time steps.
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
+    pipeline : str
+        Deprecated, replaced by slicing. The "persistent" pipeline, which
+        moves a single slice between stations, is the "station" slicing mode.
+        The "rebuild" pipeline, which created new filters at every station,
+        gives the same results and also runs in the "station" slicing mode.
+        Default is None, which uses the slicing mode.
     """
-    Wrapper around the force_distribution() function to call it from
-    the command line with arguments.
+    # Check if output directory exists
+    if not os.path.isdir(output_directory):
+        raise RuntimeError("Output directory {} does not exist.".format(output_directory))
+
+    # Map the pipeline mode of earlier versions to the slicing mode replacing it
+    if pipeline is not None:
+        if pipeline not in ["persistent", "rebuild"]:
+            raise ValueError("Pipeline mode {} not recognized, options are persistent and rebuild.".format(pipeline))
+        print("Warning: The pipeline option is deprecated, running with slicing set to station.")
+        slicing = "station"
+
+    # Check partition mode
+    if partition not in ["time", "span"]:
+        raise ValueError("Partition mode {} not recognized, options are time and span.".format(partition))
+
+    # Check output format
+    if output_format not in ["csv", "store"]:
+        raise ValueError("Output format {} not recognized, options are csv and store.".format(output_format))
+
+    # Check station spacing
+    refinement = check_spacing(spacing, tolerance, max_stations, output_format, workers, partition)
+
+    # Check engine
+    check_engine(engine, input_file, workers, partition)
+
+    # Check statistics and spectra modes
+    pv_statistics.check_statistics(statistics, output_format, incremental, spacing)
+    pv_spectra.check_spectra(spectra, output_format, incremental, spacing, workers, partition)
+
+    # Generate direction vectors
+    span_direction = utils.check_input_vector(span_direction, "span direction", check_norm=True)
+    force_direction = utils.check_input_vectors(force_direction, "force direction", check_norm=True)
+    if moment_points is not None:
+        moment_points = utils.check_input_vectors(moment_points, "moment point", check_norm=False)
+
+    # Generate sample points
+    x = get_stations(x_start, x_end, n_span)
+
+    # Import case, or only read the time values of the surface cache cut by the numpy engine
+    if engine == "numpy":
+        paraviewfoam = None
+        times = pv_surface.load_cache_metadata(os.path.join(os.getcwd(), input_file))["times"]
+    else:
+        paraviewfoam, times = pv_case.open_case(input_file, patches, cell_arrays=["forcePerS"], case_type=case_type)
+
+    # Worker processes and MPI ranks are exclusive
+    if workers > 1 and pv_mpi.get_size() > 1:
+        raise RuntimeError("Worker processes cannot be combined with MPI execution, set workers to 1.")
+
+    # Distribute time steps over worker processes
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    # Skip the initial transient
+    if transient_time is not None:
+        time_indices = [i for i in time_indices if times[i] >= transient_time]
+
+    # Only process the requested time values
+    if time_values is not None:
+        time_indices = [i for i in time_indices if np.any(np.isclose(times[i], time_values, rtol=1e-10, atol=1e-14))]
+
+    # Settings shared by the output modes
+    options = {
+        "input_file": input_file,
+        "output_directory": output_directory,
+        "name": name,
+        "patches": patches,
+        "span_direction": span_direction,
+        "force_direction": force_direction,
+        "moment_points": moment_points,
+        "x_start": x_start,
+        "x_end": x_end,
+        "n_span": n_span,
+        "x": x,
+        "slicing": slicing,
+        "workers": workers,
+        "partition": partition,
+        "incremental": incremental,
+        "output_format": output_format,
+        "case_type": case_type,
+        "spacing": spacing,
+        "tolerance": tolerance,
+        "max_stations": max_stations,
+        "refinement": refinement,
+        "engine": engine,
+        "paraviewfoam": paraviewfoam,
+        "times": times,
+        "case_kwargs": dict(input_file=input_file, patches=patches, case_type=case_type, cell_arrays=["forcePerS"]),
+        "run": pv_outputs.create_run(
+            output_directory, name, output_format, incremental, lambda i: [name + "_" + str(i) + ".csv"]
+        ),
+    }
+
+    # Create the results store
+    pv_outputs.create_stores(options["run"], get_force_fields(force_direction, moment_points), x, times)
+
+    # Skip time steps whose outputs are up to date
+    if incremental == "True":
+        time_indices = _select_force_time_steps(options, time_indices)
+
+    # Only write the statistics or spectra of the time steps
+    if statistics == "True" or spectra == "True":
+        summaries = {
+            "statistics": statistics == "True",
+            "spectra": spectra == "True",
+            "segment_length": segment_length,
+            "overlap": overlap,
+        }
+        _write_force_summaries(options, time_indices, summaries)
+    elif workers > 1 and partition == "time":
+        _run_force_time_workers(options, time_indices)
+    else:
+        _write_force_outputs(options, time_indices)
+
+
+def watch_force_distribution(args, daemon=None, poll_interval=5.0, settle_time=2.0, watch_timeout=None):
     """
-    # Parse arguments
-    parser = force_distribution_parser()
+    Watch a case for the time directories completed by a running solver, and
+    compute the force distribution of each one as it appears.
 
-    # Call function
-    force_distribution(**vars(parser.parse_args()))
+    Parameters
+    ----------
+    args : dict
+        Keyword arguments of force_distribution().
+    daemon : str
+        Address of a running pv_daemon to run the jobs in. Default is None,
+        which runs the jobs in this process.
+    poll_interval : float
+        Time in seconds between polls of the case. Default is 5.
+    settle_time : float
+        Time in seconds for which the files of a time directory must be
+        unchanged before it is processed. Default is 2.
+    watch_timeout : float
+        Time in seconds without any new time directory after which watching
+        stops. Default is None, which watches until interrupted.
+    """
+    if pv_mpi.get_size() > 1:
+        raise RuntimeError("Watch mode cannot be combined with MPI execution.")
+
+    # Keep the reader open between polls
+    pv_case.enable_reader_cache()
+    pv_watch.watch_case(
+        "force_distribution",
+        args,
+        ["forcePerS"],
+        daemon,
+        poll_interval=poll_interval,
+        settle_time=settle_time,
+        watch_timeout=watch_timeout,
+    )
 
 
-def force_distribution_parser():
+def _select_force_time_steps(options, time_indices):
     """
-    Parser for options for the force_distribution() function to call
-    it from the command line with arguments.
+    Select the time steps whose outputs are missing or were written from
+    different inputs, as select_time_steps() does.
+
+    Parameters
+    ----------
+    options : dict
+        Settings of the run, as gathered by force_distribution().
+    time_indices : list
+        Indices of the time steps to process.
 
     Returns
     -------
-    parser
-        Parser with specified arguments.
-    """
-    parser = argparse.ArgumentParser(allow_abbrev=False)
-    parser.add_argument(
-        "-i",
-        "--input_file",
-        help="Relative path to input file.",
-        type=str,
-        default="",
-    )
-    parser.add_argument(
-        "-o",
-        "--output_directory",
-        help="Relative path to output directory. Default is ./",
-        type=str,
-        default="./",
-    )
-    parser.add_argument(
-        "-n",
-        "--name",
-        help="Name pattern to write out files in the output directory. Default is force_distribution.",
-        type=str,
-        default="force_distribution",
-    )
-    parser.add_argument(
-        "-p",
-        "--patches",
-        help="Patches to include in the calculation. Default is group/wall.",
-        type=str,
-        nargs="+",
-        default="group/wall",
-    )
-    parser.add_argument(
-        "-s",
-        "--span_direction",
-        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
-        type=str,
-        nargs="+",
-        default=["Z+"],
-    )
-    parser.add_argument(
-        "-f",
-        "--force_direction",
-        help="Force direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Y+.",
-        type=str,
-        nargs="+",
-        default=["Y+"],
+    list
+        Indices of the time steps to process again.
+    """
+    parameters = dict(
+        patches=options["patches"],
+        span_direction=options["span_direction"],
+        force_direction=np.squeeze(options["force_direction"]),
+        x=options["x"],
     )
-    parser.add_argument(
-        "-xs",
-        "--x_start",
-        help="Coordinate to start slices from. Default is [0, 0, 0].",
-        type=str,
-        nargs="+",
-        default=[0, 0, 0],
+    if options["moment_points"] is not None:
+        parameters["moment_points"] = options["moment_points"]
+    if options["refinement"] is not None:
+        parameters.update(options["refinement"])
+
+    return pv_outputs.select_time_steps(
+        options["run"], options["input_file"], options["times"], time_indices, ["forcePerS"], parameters
     )
-    parser.add_argument(
-        "-xe",
-        "--x_end",
-        help="Coordinate to end slices a. Default is [0, 0, 1].",
-        type=str,
-        nargs="+",
-        default=[0, 0, 1],
+
+
+def _write_force_summaries(options, time_indices, summaries):
+    """
+    Write the time statistics and/or the spectra of every station, updated one
+    time step at a time, instead of one file per time step.
+
+    Parameters
+    ----------
+    options : dict
+        Settings of the run, as gathered by force_distribution().
+    time_indices : list
+        Indices of the time steps to process.
+    summaries : dict
+        Summaries to write, with the "statistics" and "spectra" flags, and the
+        "segment_length" and "overlap" of the spectra.
+    """
+    spectrum = pv_spectra.create_spectrum(summaries["segment_length"], summaries["overlap"])
+    kwargs = {
+        key: options[key]
+        for key in [
+            "input_file",
+            "patches",
+            "span_direction",
+            "force_direction",
+            "x_start",
+            "x_end",
+            "n_span",
+            "slicing",
+            "case_type",
+            "moment_points",
+            "engine",
+        ]
+    }
+    running = pv_outputs.compute_statistics(
+        _iter_force_options(options, time_indices, refinement=None),
+        get_force_loads,
+        spectrum if summaries["spectra"] else None,
+        iter_force_distribution,
+        kwargs,
+        time_indices,
+        options["workers"] if options["partition"] == "time" else 1,
     )
-    parser.add_argument(
-        "-ns",
-        "--n_span",
-        help="Number of spanwise samples. Default is 100.",
-        type=int,
-        default=100,
+
+    # Summaries are only written on the root process
+    if not pv_mpi.is_root():
+        return
+
+    fields = get_force_fields(options["force_direction"], options["moment_points"])
+    file_name = options["output_directory"] + options["name"]
+    if summaries["statistics"]:
+        write_statistics(file_name + "_statistics.csv", options["x"], fields, running)
+    if summaries["spectra"]:
+        write_spectra(file_name + "_spectra.csv", fields, spectrum)
+
+
+def _run_force_time_workers(options, time_indices):
+    """
+    Split the time steps across worker processes, each writing the outputs of
+    its own time steps, and record the outputs in the run manifest.
+
+    Parameters
+    ----------
+    options : dict
+        Settings of the run, as gathered by force_distribution().
+    time_indices : list
+        Indices of the time steps to process.
+    """
+    kwargs = {
+        key: options[key]
+        for key in [
+            "input_file",
+            "output_directory",
+            "name",
+            "patches",
+            "span_direction",
+            "force_direction",
+            "x_start",
+            "x_end",
+            "n_span",
+            "slicing",
+            "output_format",
+            "case_type",
+            "spacing",
+            "tolerance",
+            "max_stations",
+            "moment_points",
+            "engine",
+        ]
+    }
+
+    pv_outputs.run_time_workers(options["run"], force_distribution, kwargs, time_indices, options["workers"])
+
+
+def _write_force_outputs(options, time_indices):
+    """
+    Write the force distribution of every time step to a CSV file or to the
+    results store, in the background while the next time steps are computed.
+
+    Parameters
+    ----------
+    options : dict
+        Settings of the run, as gathered by force_distribution().
+    time_indices : list
+        Indices of the time steps to process.
+    """
+    name = options["name"]
+    fields = ["X", "Y", "Z"] + get_force_fields(options["force_direction"], options["moment_points"])
+
+    # Values of the time step for the results store, or its CSV file
+    def iter_results():
+        for record in _iter_force_options(options, time_indices, options["refinement"]):
+            i = record["time_index"]
+            loads = get_force_loads(record)
+            if options["output_format"] == "store":
+                yield i, loads
+            else:
+                yield i, [(name + "_" + str(i) + ".csv", fields, np.column_stack((record["x"], loads)))]
+
+    pv_outputs.write_time_steps(options["run"], iter_results())
+
+
+def _iter_force_options(options, time_indices, refinement):
+    """
+    Yield the force distribution of the time steps of a run, as
+    _iter_force_records() does.
+
+    Parameters
+    ----------
+    options : dict
+        Settings of the run, as gathered by force_distribution().
+    time_indices : list
+        Indices of the time steps to process.
+    refinement : dict
+        Keyword arguments of refine_stations() with adaptive spacing, or None
+        to keep the stations.
+
+    Yields
+    ------
+    dict
+        Record of a time step.
+    """
+    yield from _iter_force_records(
+        options["paraviewfoam"],
+        options["times"],
+        time_indices,
+        options["x"],
+        options["span_direction"],
+        options["force_direction"],
+        options["moment_points"],
+        options["slicing"],
+        options["workers"],
+        options["case_kwargs"],
+        refinement,
+        options["engine"],
     )
-    return parser
 
 
-def force_distribution(
+def iter_force_distribution(
     input_file=None,
-    output_directory="./",
-    name="force_distribution",
     patches="group/wall",
     span_direction="Z+",
     force_direction="Y+",
     x_start=[0, 0, 0],
     x_end=[0, 0, 1],
     n_span=100,
+    slicing="multi",
+    workers=1,
+    case_type="reconstructed",
+    spacing="uniform",
+    tolerance=0.01,
+    max_stations=1000,
+    moment_points=None,
+    engine="paraview",
+    time_indices=None,
 ):
     """
-    Function to compute a force distribution using Paraview.
+    Generator computing a force distribution using Paraview, yielding the
+    results of one time step at a time instead of writing them to files. Only
+    one time step is held in memory, unless the stations are split across
+    worker processes.
 
+    When running with MPI, the records are only yielded on the root process,
+    and the generator must be consumed to the end on every process.
 
     Parameters
     ----------
     input_file : str
         Path to file to load with Paraview.
-    output_directory : str
-        Path to directory where the distribution files will be written. Default
-        is "./".
-    name : str
-        Name pattern to write out files in the output directory. Default is
-        "force_distribution".
     patches : str or list
         Patch name(s) over which to compute the force distribution. Default
         is "group/wall".
@@ -142,28 +557,393 @@ def force_distribution(
         (eg. [0 0 1]). Should be of magnitude 1. Default is "Z+".
     force_direction : str or list
         Vector direction for force direction either as a string (eg. X) or list
-        (eg. [0 1 0]). Should be of magnitude 1. Default is "Y+".
+        (eg. [0 1 0]). Should be of magnitude 1. Several directions can be
+        given as a list (eg. ["Y+", "X+"]), and are all integrated from the
+        same sections. Default is "Y+".
     x_start : list
         Coordinates to start slices from. Default is [0, 0, 0].
     x_end : list
         Coordinates to end slices at. Default is [0, 0, 1].
     n_span : int
         Number of spanwise samples. Default is 100.
+    slicing : str
+        Slicing mode, either "multi" or "station". Default is "multi".
+    workers : int
+        Number of worker processes over which to split the stations in
+        contiguous spanwise chunks. All time steps are computed before the
+        first one is yielded. Default is 1.
+    case_type : str
+        Case type, either "reconstructed" or "decomposed". Default is
+        "reconstructed".
+    spacing : str
+        Station spacing. With "uniform", n_span evenly spaced stations are
+        used. With "adaptive", the n_span evenly spaced stations are refined
+        at every time step by adding stations in the middle of the intervals
+        over which the results change by more than the tolerance. Default is
+        "uniform".
+    tolerance : float
+        Largest change of a result between neighboring stations with adaptive
+        spacing, relative to the range of the result. Default is 0.01.
+    max_stations : int
+        Maximum number of stations with adaptive spacing. Default is 1000.
+    moment_points : list
+        Reference points of the sectional moments, either as a list of points
+        (eg. [[0.25, 0, 0]]) or as a flat list of coordinates. The moments are
+        taken about the span direction through each point. Default is None,
+        which computes no moment.
+    engine : str
+        Engine computing the sections. With "paraview", the surface is sliced
+        with Paraview at every time step. With "numpy", the faces of a surface
+        cache written by pv_cache are cut at all stations at once with numpy,
+        without Paraview, which requires a surface cache as the input file.
+        On a static mesh with uniform spacing, the numpy engine only cuts the
+        surface once, as long as the points of every time step match those
+        of the first one. Default is "paraview".
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
+
+    Yields
+    ------
+    dict
+        Record of a time step, with the "time_index", the "time" value, the
+        station coordinates "x", the "force" per unit length of each station,
+        with one column per direction when several are given, and the
+        "moment" per unit length of each station when reference points are
+        given, with one column per point when several are given.
     """
-    # Check if output directory exists
-    if not os.path.isdir(output_directory):
-        raise RuntimeError("Output directory {} does not exist.".format(output_directory))
+    # Check station spacing
+    refinement = check_spacing(spacing, tolerance, max_stations, "csv", workers, "span")
+
+    # Check engine
+    check_engine(engine, input_file, workers, "span")
 
     # Generate direction vectors
     span_direction = utils.check_input_vector(span_direction, "span direction", check_norm=True)
-    force_direction = utils.check_input_vector(force_direction, "force direction", check_norm=True)
+    force_direction = utils.check_input_vectors(force_direction, "force direction", check_norm=True)
+    if moment_points is not None:
+        moment_points = utils.check_input_vectors(moment_points, "moment point", check_norm=False)
 
     # Generate sample points
+    x = get_stations(x_start, x_end, n_span)
+
+    # Import case, or only read the time values of the surface cache cut by the numpy engine
+    if engine == "numpy":
+        paraviewfoam = None
+        times = pv_surface.load_cache_metadata(os.path.join(os.getcwd(), input_file))["times"]
+    else:
+        paraviewfoam, times = pv_case.open_case(input_file, patches, cell_arrays=["forcePerS"], case_type=case_type)
+
+    # Worker processes and MPI ranks are exclusive
+    if workers > 1 and pv_mpi.get_size() > 1:
+        raise RuntimeError("Worker processes cannot be combined with MPI execution, set workers to 1.")
+
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    case_kwargs = dict(input_file=input_file, patches=patches, case_type=case_type, cell_arrays=["forcePerS"])
+    yield from _iter_force_records(
+        paraviewfoam,
+        times,
+        time_indices,
+        x,
+        span_direction,
+        force_direction,
+        moment_points,
+        slicing,
+        workers,
+        case_kwargs,
+        refinement,
+        engine,
+    )
+
+
+def _iter_force_records(
+    paraviewfoam,
+    times,
+    time_indices,
+    x,
+    span_direction,
+    force_direction,
+    moment_points,
+    slicing,
+    workers,
+    case_kwargs,
+    refinement=None,
+    engine="paraview",
+):
+    """
+    Yield the force distribution of the time steps of an open case.
+
+    Parameters
+    ----------
+    paraviewfoam : Paraview source
+        Source returned by open_case().
+    times : list
+        Time values of the case.
+    time_indices : list
+        Indices of the time steps to process.
+    x : ndarray
+        Coordinates of the stations.
+    span_direction : ndarray
+        Span direction, used as the slice normal.
+    force_direction : ndarray
+        Directions onto which the force is projected, with shape
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments, with shape (n_moments, 3), or None.
+    slicing : str
+        Slicing mode, either "multi" or "station".
+    workers : int
+        Number of worker processes over which to split the stations.
+    case_kwargs : dict
+        Keyword arguments of open_case() used by the worker processes.
+    refinement : dict
+        Keyword arguments of refine_stations() with adaptive spacing. Default
+        is None, which keeps the stations.
+    engine : str
+        Engine computing the sections, either "paraview" or "numpy" to cut
+        the surface cache given as input file. Default is "paraview".
+
+    Yields
+    ------
+    dict
+        Record of a time step.
+    """
+
+    def record(i, loads, x_i=x):
+        # A single direction or moment is kept as a 1D array
+        force = loads[:, : np.size(force_direction, 0)]
+        moment = loads[:, np.size(force_direction, 0) :]
+        result = {
+            "time_index": i,
+            "time": times[i],
+            "x": x_i,
+            "force": force[:, 0] if np.size(force, 1) == 1 else force,
+        }
+        if np.size(moment, 1) > 0:
+            result["moment"] = moment[:, 0] if np.size(moment, 1) == 1 else moment
+        return result
+
+    # Cut the surface cache of each time step with numpy
+    if engine == "numpy":
+        cache_directory = os.path.join(os.getcwd(), case_kwargs["input_file"])
+        moving_mesh = pv_surface.load_cache_metadata(cache_directory)["moving_mesh"]
+        time_indices = list(time_indices)
+
+        # On a static mesh, the loads are a fixed linear map of the force per unit
+        # area, built from the first time step and applied to blocks of time steps
+        if refinement is None and not moving_mesh and len(time_indices) > 0:
+            surface = pv_surface.load_surface(cache_directory, time_indices[0])
+            checksum = pv_surface.get_points_checksum(surface["points"])
+            index = pv_cutting.create_face_index(
+                surface["points"], surface["connectivity"], surface["offsets"], span_direction
+            )
+            operator = pv_cutting.create_load_operator(
+                surface, x, span_direction, force_direction, moment_points, index=index
+            )
+
+            # Stack the forces of at most 64 time steps, and about 128 MB, per product
+            block_size = int(np.clip(2**24 // np.size(operator["matrix"], 1), 1, 64))
+            n_done = 0
+            while n_done < len(time_indices):
+                block = time_indices[n_done : n_done + block_size]
+                surfaces = [pv_surface.load_surface(cache_directory, i) for i in block]
+
+                # Only apply the operator up to the first time step whose points differ
+                # from those it was built on
+                n_static = len(block)
+                for k, surface in enumerate(surfaces):
+                    if pv_surface.get_points_checksum(surface["points"]) != checksum:
+                        n_static = k
+                        break
+                if n_static > 0:
+                    loads = pv_cutting.apply_load_operator(operator, surfaces[:n_static])
+                    for k, i in enumerate(block[:n_static]):
+                        yield record(i, loads[k])
+                n_done += n_static
+
+                if n_static < len(block):
+                    print(
+                        "Warning: The points at time {} differ from those at time {}, cutting the remaining time "
+                        "steps one at a time.".format(times[block[n_static]], times[time_indices[0]])
+                    )
+                    break
+            time_indices = time_indices[n_done:]
+
+        index = None
+        for i in time_indices:
+            surface = pv_surface.load_surface(cache_directory, i)
+
+            # Index the faces along the span once per mesh, checking the points of every
+            # time step
+            if index is None or pv_surface.get_points_checksum(surface["points"]) != checksum:
+                checksum = pv_surface.get_points_checksum(surface["points"])
+                index = pv_cutting.create_face_index(
+                    surface["points"], surface["connectivity"], surface["offsets"], span_direction
+                )
+
+            def compute(x_new):
+                return pv_cutting.compute_surface_loads(
+                    surface, x_new, span_direction, force_direction, moment_points, index=index
+                )
+
+            if refinement is None:
+                x_i, loads = x, compute(x)
+            else:
+                x_i, loads = pv_utils.refine_stations(compute, x, **refinement)
+            yield record(i, loads, x_i)
+        return
+
+    # Compute all time steps with the stations split across workers
+    if workers > 1:
+        values = pv_parallel.run_span_chunks(
+            compute_force_distribution,
+            case_kwargs,
+            [times[i] for i in time_indices],
+            x,
+            span_direction,
+            workers,
+            force_direction=force_direction,
+            slicing=slicing,
+            moment_points=moment_points,
+        )
+        for k, i in enumerate(time_indices):
+            yield record(i, values[k])
+        return
+
+    # Build the slicing pipeline once for all stations and time steps
+    slice_pipeline = pv_slicing.create_slice_pipeline(paraviewfoam, span_direction)
+    try:
+        for i in time_indices:
+            if refinement is None:
+                x_i = x
+                loads = compute_force_distribution(
+                    slice_pipeline, times[i], x, span_direction, force_direction, slicing, moment_points
+                )
+            else:
+                # Every process needs the results to refine the same stations
+                x_i, loads = pv_utils.refine_stations(
+                    lambda x_new: pv_mpi.broadcast(
+                        compute_force_distribution(
+                            slice_pipeline, times[i], x_new, span_direction, force_direction, slicing, moment_points
+                        )
+                    ),
+                    x,
+                    **refinement,
+                )
+
+            # Results are only gathered on the root process
+            if pv_mpi.is_root():
+                yield record(i, loads, x_i)
+    finally:
+        # Cleanup Paraview Objects
+        pv_slicing.delete_slice_pipeline(slice_pipeline)
+
+
+def get_force_loads(record):
+    """
+    Stack the forces and moments of a force distribution record.
+
+    Parameters
+    ----------
+    record : dict
+        Record yielded by iter_force_distribution().
+
+    Returns
+    -------
+    ndarray
+        Forces followed by moments of each station, with shape
+        (n_stations, n_directions + n_moments).
+    """
+    return np.column_stack([record["force"]] + ([record["moment"]] if "moment" in record else []))
+
+
+def write_statistics(file_name, x, fields, running):
+    """
+    Write the summary of the time statistics of a distribution to a CSV file,
+    with one row per station.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the CSV file.
+    x : ndarray
+        Coordinates of the stations.
+    fields : list
+        Names of the quantities.
+    running : dict
+        Running statistics returned by create_statistics().
+    """
+    if running["count"] is None:
+        print("Warning: No time step to compute the statistics of, {} was not written.".format(file_name))
+        return
+
+    utils.write_csv(
+        file_name,
+        ["X", "Y", "Z"] + pv_statistics.get_statistics_fields(fields),
+        np.column_stack((x, pv_statistics.summarize_statistics(running))),
+    )
+    print("Wrote the statistics of {} time steps to {}.".format(np.max(running["count"]), file_name))
+
+
+def write_spectra(file_name, fields, spectrum):
+    """
+    Write the power spectral densities of a distribution to a CSV file, with
+    one row per frequency and one column per quantity and station.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the CSV file.
+    fields : list
+        Names of the quantities.
+    spectrum : dict
+        Spectrum estimate returned by create_spectrum().
+    """
+    if spectrum["n_segments"] == 0:
+        print(
+            "Warning: At least {} time steps are needed to compute the spectra, got {}, {} was not written.".format(
+                spectrum["segment_length"], spectrum["n_values"], file_name
+            )
+        )
+        return
+
+    # Columns are ordered by quantity, then by station
+    frequencies, psd = pv_spectra.summarize_spectrum(spectrum)
+    n_stations = np.size(psd, 1)
+    utils.write_csv(
+        file_name,
+        ["Frequency"] + [field + "_" + str(j) for field in fields for j in range(n_stations)],
+        np.column_stack((frequencies, np.reshape(np.transpose(psd, (0, 2, 1)), (np.size(psd, 0), -1)))),
+    )
+    print("Wrote the spectra of {} segments to {}.".format(spectrum["n_segments"], file_name))
+
+
+def get_stations(x_start, x_end, n_span):
+    """
+    Generate evenly spaced stations between two points.
+
+    Parameters
+    ----------
+    x_start : list
+        Coordinates of the first station.
+    x_end : list
+        Coordinates of the last station.
+    n_span : int
+        Number of stations.
+
+    Returns
+    -------
+    ndarray
+        Coordinates of the stations, with shape (n_span, 3).
+    """
     if len(x_start) != 3:
         raise ValueError("x_start should be list of length 3, not {} with length {}.".format(x_start, len(x_start)))
     if len(x_end) != 3:
         raise ValueError("x_end should be list of length 3, not {} with length {}.".format(x_end, len(x_end)))
-    x = np.array(
+
+    return np.array(
         [
             np.linspace(float(x_start[0]), float(x_end[0]), n_span),
             np.linspace(float(x_start[1]), float(x_end[1]), n_span),
@@ -171,175 +951,181 @@ def force_distribution(
         ]
     ).T
 
-    # Import case
-    if input_file is None:
-        raise ValueError("Input file not set.")
-    paraviewfoam = paraview.OpenFOAMReader(
-        registrationName="paraview.foam", FileName=str(os.getcwd()) + "/{}".format(input_file)
-    )
-    paraviewfoam.MeshRegions = patches
-    paraviewfoam.CellArrays = ["forcePerS"]
-
-    # Read time data
-    animationScene1 = paraview.GetAnimationScene()
-    animationScene1.UpdateAnimationUsingDataTimeSteps()
 
-    reader = paraview.GetActiveSource()
-    times = reader.TimestepValues
+def get_force_fields(force_direction, moment_points=None):
+    """
+    Get the names of the quantities of a force distribution. A single force
+    direction is named "Force", and several are numbered in the order they
+    are given, as are the moments.
 
-    force = np.zeros(n_span)
-    for i in range(len(times)):
-        paraview.UpdatePipeline(time=times[i], proxy=paraviewfoam)
+    Parameters
+    ----------
+    force_direction : ndarray
+        Directions onto which the force is projected, with shape
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments, with shape (n_moments, 3). Default
+        is None.
 
-        # Zero Force Array
-        force[:] = 0.0
+    Returns
+    -------
+    list
+        Names of the forces followed by the names of the moments.
+    """
+    fields = []
+    for quantity, n in [("Force", np.size(force_direction, 0)), ("Moment", np.size(moment_points) // 3)]:
+        fields += [quantity] if n == 1 else [quantity + "_" + str(k) for k in range(n)]
 
-        # Iterate over span
-        for j in range(n_span):
-            # Create a slice
-            slice1 = paraview.Slice(registrationName="Slice1", Input=paraviewfoam)
+    return fields
 
-            # Set slice location and normal
-            slice1.SliceType.Origin = [x[j, 0], x[j, 1], x[j, 2]]
-            slice1.SliceType.Normal = [span_direction[0], span_direction[1], span_direction[2]]
 
-            # Set calculator
-            calculator1 = paraview.Calculator(registrationName="Calculator", Input=slice1)
-            calculator1.ResultArrayName = "force_dot_dir"
-            calculator1.Function = "dot(forcePerS,{}*iHat + {}*jHat + {}*kHat)".format(
-                force_direction[0], force_direction[1], force_direction[2]
-            )
+def check_spacing(spacing, tolerance, max_stations, output_format, workers, partition, reduction="client"):
+    """
+    Check the station spacing options of a distribution.
 
-            # Integrate variables
-            integrateVariables1 = paraview.IntegrateVariables(registrationName="IntegrateVariables", Input=calculator1)
+    Parameters
+    ----------
+    spacing : str
+        Station spacing, either "uniform" or "adaptive".
+    tolerance : float
+        Tolerance of the adaptive spacing.
+    max_stations : int
+        Maximum number of stations with adaptive spacing.
+    output_format : str
+        Output format, either "csv" or "store".
+    workers : int
+        Number of worker processes.
+    partition : str
+        Partition mode of the worker processes, either "time" or "span".
+    reduction : str
+        Reduction mode, either "client" or "server". Default is "client".
 
-            # Get arrays
-            passArrays1 = paraview.PassArrays(Input=integrateVariables1)
-            passArrays1.CellDataArrays = ["force_dot_dir"]
-            passArrays1.PointDataArrays = ["force_dot_dir"]
+    Returns
+    -------
+    dict
+        Keyword arguments of refine_stations(), or None with uniform spacing.
+    """
+    if spacing not in ["uniform", "adaptive"]:
+        raise ValueError("Station spacing {} not recognized, options are uniform and adaptive.".format(spacing))
+    if spacing == "uniform":
+        return None
 
-            # Store data
-            data = paraview.servermanager.Fetch(passArrays1)
-            force[j] = data.GetPointData().GetArray("force_dot_dir").GetValue(0)
+    # The refined stations change between time steps and depend on all stations
+    if tolerance <= 0:
+        raise ValueError("Tolerance should be positive, not {}.".format(tolerance))
+    if output_format == "store":
+        raise ValueError("Adaptive spacing cannot be combined with the store output format.")
+    if workers > 1 and partition == "span":
+        raise ValueError("Adaptive spacing cannot be combined with the span partition.")
+    if reduction == "server":
+        raise ValueError("Adaptive spacing cannot be combined with server reduction.")
 
-            # Cleanup
-            paraview.Delete(passArrays1)
-            paraview.Delete(integrateVariables1)
-            paraview.Delete(calculator1)
-            paraview.Delete(slice1)
+    return dict(tolerance=tolerance, max_stations=max_stations)
 
-        # Write CSV file
-        fields = ["X", "Y", "Z", "Force"]
-        results = np.stack((x[:, 0], x[:, 1], x[:, 2], force), axis=1)
-        with open(output_directory + name + "_" + str(i) + ".csv", "w") as csvfile:
-            # creating a csv writer object
-            csvwriter = csv.writer(csvfile)
-            # writing the fields
-            csvwriter.writerow(fields)
-            # writing the data rows
-            csvwriter.writerows(results)
 
+def check_engine(engine, input_file, workers, partition):
+    """
+    Check the engine computing the sections of a force distribution, or of
+    pressure coefficient slices.
 
-def geometry_distribution_cmd():
+    Parameters
+    ----------
+    engine : str
+        Engine, either "paraview" or "numpy".
+    input_file : str
+        Relative path to the input file.
+    workers : int
+        Number of worker processes.
+    partition : str
+        Partition mode of the worker processes, either "time" or "span".
     """
-    Wrapper around the geometry_distribution() function to call it from the
-    command line with arguments.
+    if engine not in ["paraview", "numpy"]:
+        raise ValueError("Engine {} not recognized, options are paraview and numpy.".format(engine))
+    if engine == "paraview":
+        return
+
+    # The numpy engine cuts the whole surface of a cache in one process
+    if not pv_surface.is_surface_cache(os.path.join(os.getcwd(), input_file)):
+        raise ValueError("The numpy engine requires a surface cache written by pv_cache as input file.")
+    if workers > 1 and partition == "span":
+        raise ValueError("The numpy engine cannot be combined with the span partition.")
+    if pv_mpi.get_size() > 1:
+        raise RuntimeError("The numpy engine cannot be combined with MPI execution.")
+
+
+def compute_force_distribution(
+    slice_pipeline, time, x, span_direction, force_direction, slicing="multi", moment_points=None
+):
+    """
+    Compute the force, and optionally the moment, of every station at one
+    time step.
+
+    Parameters
+    ----------
+    slice_pipeline : list
+        Paraview filters created by create_slice_pipeline().
+    time : float
+        Time value at which to evaluate the pipeline.
+    x : ndarray
+        Coordinates of the stations.
+    span_direction : ndarray
+        Span direction, used as the slice normal.
+    force_direction : ndarray
+        Direction(s) onto which the force is projected, with shape (3,) or
+        (n_directions, 3).
+    slicing : str
+        Slicing mode, either "multi" or "station". Default is "multi".
+    moment_points : ndarray
+        Reference points of the moments about the span direction, with shape
+        (n_moments, 3). Default is None, which computes no moment.
+
+    Returns
+    -------
+    ndarray
+        Forces followed by moments per unit length of each station, with shape
+        (n_stations, n_directions + n_moments).
     """
-    # Parse arguments
-    parser = geometry_distribution_parser()
+    # Cut and fetch all stations
+    sections = pv_slicing.fetch_sections(
+        slice_pipeline, time, x, span_direction, point_arrays=["forcePerS"], slicing=slicing
+    )
 
-    # Call function
-    geometry_distribution(**vars(parser.parse_args()))
+    return compute_force_sections(sections, force_direction, moment_points, span_direction)
 
 
-def geometry_distribution_parser():
+def compute_force_sections(sections, force_direction, moment_points=None, moment_axis=None):
     """
-    Parser for options for the geometry_distribution() function to call it from the
-    command line with arguments.
+    Compute the force, and optionally the moment, of every fetched section.
+
+    Parameters
+    ----------
+    sections : list
+        Sections returned by fetch_sections(), with the "forcePerS" point
+        array.
+    force_direction : ndarray
+        Direction(s) onto which the force is projected, with shape (3,) or
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments, with shape (n_moments, 3). Default
+        is None, which computes no moment.
+    moment_axis : ndarray
+        Axis of the moments, such as the span direction. Default is None.
 
     Returns
     -------
-    parser
-        Parser with specified arguments.
-    """
-    parser = argparse.ArgumentParser(allow_abbrev=False)
-    parser.add_argument(
-        "-i",
-        "--input_file",
-        help="Relative path to input file.",
-        type=str,
-        default="",
-    )
-    parser.add_argument(
-        "-o",
-        "--output_directory",
-        help="Relative path to output directory. Default is ./",
-        type=str,
-        default="./",
-    )
-    parser.add_argument(
-        "-n",
-        "--name",
-        help="Name pattern to write out files in the output directory. Default is geometry_distribution.",
-        type=str,
-        default="geometry_distribution",
-    )
-    parser.add_argument(
-        "-p",
-        "--patches",
-        help="Patches to include in the calculation. Default is group/wall.",
-        type=str,
-        nargs="+",
-        default="group/wall",
-    )
-    parser.add_argument(
-        "-s",
-        "--span_direction",
-        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
-        type=str,
-        nargs="+",
-        default=["Z+"],
-    )
-    parser.add_argument(
-        "-l",
-        "--lift_direction",
-        help="Lift direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Y+.",
-        type=str,
-        nargs="+",
-        default=["Y+"],
-    )
-    parser.add_argument(
-        "-d",
-        "--drag_direction",
-        help="Drag direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is X+.",
-        type=str,
-        nargs="+",
-        default=["X+"],
-    )
-    parser.add_argument(
-        "-xs",
-        "--x_start",
-        help="Coordinate to start slices from. Default is [0, 0, 0].",
-        type=str,
-        nargs="+",
-        default=[0, 0, 0],
-    )
-    parser.add_argument(
-        "-xe",
-        "--x_end",
-        help="Coordinate to end slices a. Default is [0, 0, 1].",
-        type=str,
-        nargs="+",
-        default=[0, 0, 1],
-    )
-    parser.add_argument(
-        "-ns",
-        "--n_span",
-        help="Number of spanwise samples. Default is 100.",
-        type=int,
-        default=100,
-    )
-    return parser
+    ndarray
+        Forces followed by moments per unit length of each section, with shape
+        (n_sections, n_directions + n_moments).
+    """
+    # Integrate all projected forces and moments over each section at once
+    n_loads = np.size(force_direction) // 3 + np.size(moment_points) // 3
+    loads = np.zeros((len(sections), n_loads))
+    for j, section in enumerate(sections):
+        loads[j, :] = pv_utils.integrate_loads(
+            section["points"], section["lines"], section["forcePerS"], force_direction, moment_points, moment_axis
+        )
+
+    return loads
 
 
 def geometry_distribution(
@@ -353,6 +1139,19 @@ def geometry_distribution(
     x_start=[0, 0, 0],
     x_end=[0, 0, 1],
     n_span=100,
+    slicing="multi",
+    workers=1,
+    partition="time",
+    incremental="False",
+    reduction="client",
+    output_format="csv",
+    case_type="reconstructed",
+    spacing="uniform",
+    tolerance=0.01,
+    max_stations=1000,
+    statistics="False",
+    transient_time=None,
+    time_indices=None,
 ):
     """
     Function to compute a force distribution using Paraview.
@@ -386,204 +1185,568 @@ def geometry_distribution(
         Coordinates to end slices at. Default is [0, 0, 1].
     n_span : int
         Number of spanwise samples. Default is 100.
+    slicing : str
+        Slicing mode. With "multi", all stations are cut in a single filter
+        execution and fetched in one transfer per time step. With "station", a
+        single slice is moved between stations. Default is "multi".
+    workers : int
+        Number of worker processes over which to split the time steps. Each
+        worker opens its own reader. Default is 1.
+    partition : str
+        How the work is split across workers. With "time", each worker
+        processes a subset of the time steps. With "span", each worker clips
+        the surface to the slab around a contiguous chunk of stations and the
+        results are merged into the same per-time-step file. Default is "time".
+    incremental : str
+        Flag to only process the time steps whose outputs are missing or were
+        written from different inputs, as recorded in the run manifest of the
+        output directory. Default is "False".
+    reduction : str
+        Where the sections are reduced to twist, chord, and thickness. With
+        "client", the sections are fetched and reduced locally. With "server",
+        they are reduced by a Programmable Filter where the data lives, and
+        only the per-station values are fetched, which requires the package
+        to be importable by the server's Python and the "multi" slicing mode.
+        Default is "client".
+    output_format : str
+        Output format. With "csv", one file is written per time step. With
+        "store", the results of all time steps are written in compressed
+        chunks of a results store directory named <name>_store, which can be
+        loaded with postprocessing.paraview.store.load_store(). Default is
+        "csv".
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly, in parallel when running with MPI.
+        Default is "reconstructed".
+    spacing : str
+        Station spacing. With "uniform", n_span evenly spaced stations are
+        used. With "adaptive", the n_span evenly spaced stations are refined
+        at every time step by adding stations in the middle of the intervals
+        over which the results change by more than the tolerance. Default is
+        "uniform".
+    tolerance : float
+        Largest change of a result between neighboring stations with adaptive
+        spacing, relative to the range of the result. Default is 0.01.
+    max_stations : int
+        Maximum number of stations with adaptive spacing. Default is 1000.
+    statistics : str
+        Flag to only write the time statistics of every station to
+        <name>_statistics.csv instead of one file per time step. The mean,
+        standard deviation, minimum, and maximum are updated one time step at
+        a time, so the memory used does not depend on the number of time
+        steps. Default is "False".
+    transient_time : float
+        Time before which time steps are skipped, for example to exclude an
+        initial transient from the statistics. Default is None, which
+        processes all time steps.
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
     """
     # Check if output directory exists
     if not os.path.isdir(output_directory):
         raise RuntimeError("Output directory {} does not exist.".format(output_directory))
 
+    # Check partition mode
+    if partition not in ["time", "span"]:
+        raise ValueError("Partition mode {} not recognized, options are time and span.".format(partition))
+
+    # Check output format
+    if output_format not in ["csv", "store"]:
+        raise ValueError("Output format {} not recognized, options are csv and store.".format(output_format))
+
+    # Check reduction mode
+    if reduction not in ["client", "server"]:
+        raise ValueError("Reduction mode {} not recognized, options are client and server.".format(reduction))
+    if reduction == "server" and slicing != "multi":
+        raise ValueError("Server reduction requires the multi slicing mode.")
+    if reduction == "server" and workers > 1 and partition == "span":
+        raise ValueError("Server reduction cannot be combined with the span partition.")
+
+    # Check station spacing
+    refinement = check_spacing(spacing, tolerance, max_stations, output_format, workers, partition, reduction)
+
+    # Check statistics mode
+    pv_statistics.check_statistics(statistics, output_format, incremental, spacing)
+
     # Generate direction vectors
     span_direction = utils.check_input_vector(span_direction, "span direction", check_norm=True)
     lift_direction = utils.check_input_vector(lift_direction, "lift direction", check_norm=True)
     drag_direction = utils.check_input_vector(drag_direction, "drag direction", check_norm=True)
 
     # Generate sample points
-    if len(x_start) != 3:
-        raise ValueError("x_start should be list of length 3, not {} with length {}.".format(x_start, len(x_start)))
-    if len(x_end) != 3:
-        raise ValueError("x_end should be list of length 3, not {} with length {}.".format(x_end, len(x_end)))
-    x = np.array(
-        [
-            np.linspace(float(x_start[0]), float(x_end[0]), n_span),
-            np.linspace(float(x_start[1]), float(x_end[1]), n_span),
-            np.linspace(float(x_start[2]), float(x_end[2]), n_span),
-        ]
-    ).T
+    x = get_stations(x_start, x_end, n_span)
 
     # Import case
-    if input_file is None:
-        raise ValueError("Input file not set.")
-    paraviewfoam = paraview.OpenFOAMReader(
-        registrationName="paraview.foam", FileName=str(os.getcwd()) + "/{}".format(input_file)
+    paraviewfoam, times = pv_case.open_case(input_file, patches, case_type=case_type)
+
+    # Worker processes and MPI ranks are exclusive
+    if workers > 1 and pv_mpi.get_size() > 1:
+        raise RuntimeError("Worker processes cannot be combined with MPI execution, set workers to 1.")
+
+    # Distribute time steps over worker processes
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    # Skip the initial transient
+    if transient_time is not None:
+        time_indices = [i for i in time_indices if times[i] >= transient_time]
+
+    # Output settings of the run
+    run = pv_outputs.create_run(
+        output_directory, name, output_format, incremental, lambda i: [name + "_" + str(i) + ".csv"]
     )
-    paraviewfoam.MeshRegions = patches
-
-    # Read time data
-    animationScene1 = paraview.GetAnimationScene()
-    animationScene1.UpdateAnimationUsingDataTimeSteps()
-
-    reader = paraview.GetActiveSource()
-    times = reader.TimestepValues
-
-    chord = np.zeros(n_span)
-    twist = np.zeros(n_span)
-    thickness = np.zeros(n_span)
-    for i in range(len(times)):
-        paraview.UpdatePipeline(time=times[i], proxy=paraviewfoam)
-
-        # Zero Arrays
-        chord[:] = 0.0
-        twist[:] = 0.0
-        thickness[:] = 0.0
-
-        # Iterate over span
-        for j in range(n_span):
-            # Create a slice
-            slice1 = paraview.Slice(registrationName="Slice1", Input=paraviewfoam)
-
-            # Set slice location and normal
-            slice1.SliceType.Origin = [x[j, 0], x[j, 1], x[j, 2]]
-            slice1.SliceType.Normal = [span_direction[0], span_direction[1], span_direction[2]]
-
-            # Compute Sorted Line
-            plotOnSortedLines1 = paraview.PlotOnSortedLines(registrationName="PlotOnSortedLines1", Input=slice1)
-
-            # Extract Data
-            data = paraview.servermanager.Fetch(plotOnSortedLines1).GetBlock(0)
-            coords = np.zeros((0, 3))
-            arclen = np.zeros(0)
-            for k in range(data.GetNumberOfBlocks()):
-                if data.GetBlock(k).GetNumberOfBlocks() > 0:
-                    seg_coords = vtk_np.vtk_to_numpy(data.GetBlock(k).GetBlock(0).GetPoints().GetData())
-                    seg_arclen = vtk_np.vtk_to_numpy(data.GetBlock(k).GetBlock(0).GetPointData().GetArray("arc_length"))
-                    coords = np.concatenate((coords, seg_coords), axis=0)
-                    arclen = np.concatenate((arclen, seg_arclen), axis=0)
-
-            # Cleanup Paraview Objects
-            paraview.Delete(plotOnSortedLines1)
-            paraview.Delete(slice1)
-
-            # Rotate points to X-Y plane
-            R = np.array([drag_direction, lift_direction, np.cross(drag_direction, lift_direction)])
-            coords2D = (R @ coords.T).T[:, :2]
-
-            # Sort
-            coords2D, arclen, _ = pv_utils.sort_airfoil(coords2D, arclen)
-
-            # Compute sectional properties
-            chord[j], twist[j], thickness[j] = compute_section_properties(coords2D)
-
-        # Write CSV File
-        fields = ["X", "Y", "Z", "Twist", "Chord", "Thickness"]
-        results = np.stack((x[:, 0], x[:, 1], x[:, 2], twist, chord, thickness), axis=1)
-        with open(output_directory + name + "_" + str(i) + ".csv", "w") as csvfile:
-            # creating a csv writer object
-            csvwriter = csv.writer(csvfile)
-            # writing the fields
-            csvwriter.writerow(fields)
-            # writing the data rows
-            csvwriter.writerows(results)
-
-
-def compute_section_properties(coords2D):
-    """
-    Compute the chord and twist of an airfoil section given a set of ordered
-    points.
+
+    # Create the results store
+    fields = ["Twist", "Chord", "Thickness"]
+    pv_outputs.create_stores(run, fields, x, times)
+
+    # Skip time steps whose outputs are up to date
+    if incremental == "True":
+        parameters = dict(
+            patches=patches,
+            span_direction=span_direction,
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+            x=x,
+        )
+        if refinement is not None:
+            parameters.update(refinement)
+        time_indices = pv_outputs.select_time_steps(run, input_file, times, time_indices, [], parameters)
+
+    kwargs = dict(
+        input_file=input_file,
+        patches=patches,
+        span_direction=span_direction,
+        lift_direction=lift_direction,
+        drag_direction=drag_direction,
+        x_start=x_start,
+        x_end=x_end,
+        n_span=n_span,
+        slicing=slicing,
+        reduction=reduction,
+        case_type=case_type,
+    )
+    case_kwargs = dict(input_file=input_file, patches=patches, case_type=case_type)
+
+    # Only write the statistics of the time steps
+    if statistics == "True":
+        running = pv_outputs.compute_statistics(
+            _iter_geometry_records(
+                paraviewfoam,
+                times,
+                time_indices,
+                x,
+                span_direction,
+                lift_direction,
+                drag_direction,
+                slicing,
+                workers,
+                reduction,
+                case_kwargs,
+            ),
+            get_geometry_values,
+            function=iter_geometry_distribution,
+            kwargs=kwargs,
+            time_indices=time_indices,
+            workers=workers if partition == "time" else 1,
+        )
+
+        if pv_mpi.is_root():
+            write_statistics(output_directory + name + "_statistics.csv", x, fields, running)
+        return
+
+    if workers > 1 and partition == "time":
+        kwargs.update(
+            output_directory=output_directory,
+            name=name,
+            output_format=output_format,
+            spacing=spacing,
+            tolerance=tolerance,
+            max_stations=max_stations,
+        )
+        pv_outputs.run_time_workers(run, geometry_distribution, kwargs, time_indices, workers)
+        return
+
+    # Values of the time step for the results store, or its CSV file
+    def iter_results():
+        for record in _iter_geometry_records(
+            paraviewfoam,
+            times,
+            time_indices,
+            x,
+            span_direction,
+            lift_direction,
+            drag_direction,
+            slicing,
+            workers,
+            reduction,
+            case_kwargs,
+            refinement,
+        ):
+            i = record["time_index"]
+            geometry = get_geometry_values(record)
+            if output_format == "store":
+                yield i, geometry
+            else:
+                yield i, [
+                    (name + "_" + str(i) + ".csv", ["X", "Y", "Z"] + fields, np.column_stack((record["x"], geometry)))
+                ]
+
+    pv_outputs.write_time_steps(run, iter_results())
+
+
+def iter_geometry_distribution(
+    input_file=None,
+    patches="group/wall",
+    span_direction="Z+",
+    lift_direction="Y+",
+    drag_direction="X+",
+    x_start=[0, 0, 0],
+    x_end=[0, 0, 1],
+    n_span=100,
+    slicing="multi",
+    workers=1,
+    reduction="client",
+    case_type="reconstructed",
+    spacing="uniform",
+    tolerance=0.01,
+    max_stations=1000,
+    time_indices=None,
+):
+    """
+    Generator computing a geometry distribution using Paraview, yielding the
+    results of one time step at a time instead of writing them to files. Only
+    one time step is held in memory, unless the stations are split across
+    worker processes.
+
+    When running with MPI, the records are only yielded on the root process,
+    and the generator must be consumed to the end on every process.
 
     Parameters
     ----------
-    coords2D : ndarray
-        Sorted 2D airfoil coordinates rotated to an X-Y plane, with the flow
-        direction as +X and lift direction as +Y.
-
-    Returns
-    -------
-    float
-        Section chord length, in current working units.
-    float
-        Section twist, in degrees.
-    float
-        Section maximum thickness, in current working units.
+    input_file : str
+        Path to file to load with Paraview.
+    patches : str or list
+        Patch name(s) over which to compute the geometry distribution. Default
+        is "group/wall".
+    span_direction : str or list
+        Vector direction for span direction either as a string (eg. X+) or list
+        (eg. [0 0 1]). Should be of magnitude 1. Default is "Z+".
+    lift_direction : str or list
+        Vector direction for lift direction either as a string (eg. X+) or list
+        (eg. [0 1 0]). Should be of magnitude 1. Default is "Y+".
+    drag_direction : str or list
+        Vector direction for drag direction either as a string (eg. X+) or list
+        (eg. [1 0 0]). Should be of magnitude 1. Default is "X+".
+    x_start : list
+        Coordinates to start slices from. Default is [0, 0, 0].
+    x_end : list
+        Coordinates to end slices at. Default is [0, 0, 1].
+    n_span : int
+        Number of spanwise samples. Default is 100.
+    slicing : str
+        Slicing mode, either "multi" or "station". Default is "multi".
+    workers : int
+        Number of worker processes over which to split the stations in
+        contiguous spanwise chunks. All time steps are computed before the
+        first one is yielded. Default is 1.
+    reduction : str
+        Where the sections are reduced, either "client" or "server". Default
+        is "client".
+    case_type : str
+        Case type, either "reconstructed" or "decomposed". Default is
+        "reconstructed".
+    spacing : str
+        Station spacing. With "uniform", n_span evenly spaced stations are
+        used. With "adaptive", the n_span evenly spaced stations are refined
+        at every time step by adding stations in the middle of the intervals
+        over which the results change by more than the tolerance. Default is
+        "uniform".
+    tolerance : float
+        Largest change of a result between neighboring stations with adaptive
+        spacing, relative to the range of the result. Default is 0.01.
+    max_stations : int
+        Maximum number of stations with adaptive spacing. Default is 1000.
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
+
+    Yields
+    ------
+    dict
+        Record of a time step, with the "time_index", the "time" value, the
+        station coordinates "x", and the "twist", "chord", and "thickness" of
+        each station.
     """
-    # Find the trailing edge
-    te_pts, te_idx = pv_utils.find_te(coords2D)
-    x_te = np.mean(te_pts, axis=0)
+    # Check reduction mode
+    if reduction not in ["client", "server"]:
+        raise ValueError("Reduction mode {} not recognized, options are client and server.".format(reduction))
+    if reduction == "server" and slicing != "multi":
+        raise ValueError("Server reduction requires the multi slicing mode.")
+    if reduction == "server" and workers > 1:
+        raise ValueError("Server reduction cannot be combined with the span partition.")
 
-    # Find coordinate furthest from trailing edge and two neighbors
-    max_dist = 0.0
-    i_max_dist = -1
-    for k in range(1, np.size(coords2D, 0)):
-        dist = np.linalg.norm(coords2D[k, :] - x_te)
-        if dist > max_dist:
-            max_dist = dist
-            i_max_dist = k
+    # Check station spacing
+    refinement = check_spacing(spacing, tolerance, max_stations, "csv", workers, "span", reduction)
 
-    x_le_pt_down = coords2D[i_max_dist - 1, :]
-    x_le_pt = coords2D[i_max_dist, :]
-    x_le_pt_up = coords2D[i_max_dist + 1, :]
+    # Generate direction vectors
+    span_direction = utils.check_input_vector(span_direction, "span direction", check_norm=True)
+    lift_direction = utils.check_input_vector(lift_direction, "lift direction", check_norm=True)
+    drag_direction = utils.check_input_vector(drag_direction, "drag direction", check_norm=True)
 
-    # Compute center and radius of leading edge circle
-    def circle_from_3_points(x1, x2, x3):
-        z1 = complex(x1[0], x1[1])
-        z2 = complex(x2[0], x2[1])
-        z3 = complex(x3[0], x3[1])
+    # Generate sample points
+    x = get_stations(x_start, x_end, n_span)
 
-        if (z1 == z2) or (z2 == z3) or (z3 == z1):
-            raise ValueError(f"Duplicate points: {z1}, {z2}, {z3}")
+    # Import case
+    paraviewfoam, times = pv_case.open_case(input_file, patches, case_type=case_type)
+
+    # Worker processes and MPI ranks are exclusive
+    if workers > 1 and pv_mpi.get_size() > 1:
+        raise RuntimeError("Worker processes cannot be combined with MPI execution, set workers to 1.")
+
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    case_kwargs = dict(input_file=input_file, patches=patches, case_type=case_type)
+    yield from _iter_geometry_records(
+        paraviewfoam,
+        times,
+        time_indices,
+        x,
+        span_direction,
+        lift_direction,
+        drag_direction,
+        slicing,
+        workers,
+        reduction,
+        case_kwargs,
+        refinement,
+    )
 
-        w = (z3 - z1) / (z2 - z1)
 
-        # Check for colinear points
-        if abs(w.imag) <= 1e-5:
-            raise ValueError(f"Points are collinear: {z1}, {z2}, {z3}")
+def _iter_geometry_records(
+    paraviewfoam,
+    times,
+    time_indices,
+    x,
+    span_direction,
+    lift_direction,
+    drag_direction,
+    slicing,
+    workers,
+    reduction,
+    case_kwargs,
+    refinement=None,
+):
+    """
+    Yield the geometry distribution of the time steps of an open case.
+
+    Parameters
+    ----------
+    paraviewfoam : Paraview source
+        Source returned by open_case().
+    times : list
+        Time values of the case.
+    time_indices : list
+        Indices of the time steps to process.
+    x : ndarray
+        Coordinates of the stations.
+    span_direction : ndarray
+        Span direction, used as the slice normal.
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+    slicing : str
+        Slicing mode, either "multi" or "station".
+    workers : int
+        Number of worker processes over which to split the stations.
+    reduction : str
+        Where the sections are reduced, either "client" or "server".
+    case_kwargs : dict
+        Keyword arguments of open_case() used by the worker processes.
+    refinement : dict
+        Keyword arguments of refine_stations() with adaptive spacing. Default
+        is None, which keeps the stations.
+
+    Yields
+    ------
+    dict
+        Record of a time step.
+    """
 
-        c = (z2 - z1) * (w - abs(w) ** 2) / (2j * w.imag) + z1
-        r = abs(z1 - c).real
+    def record(i, geometry, x_i=x):
+        return {
+            "time_index": i,
+            "time": times[i],
+            "x": x_i,
+            "twist": geometry[:, 0],
+            "chord": geometry[:, 1],
+            "thickness": geometry[:, 2],
+        }
+
+    # Compute all time steps with the stations split across workers
+    if workers > 1:
+        values = pv_parallel.run_span_chunks(
+            compute_geometry_distribution,
+            case_kwargs,
+            [times[i] for i in time_indices],
+            x,
+            span_direction,
+            workers,
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+            slicing=slicing,
+        )
+        for k, i in enumerate(time_indices):
+            yield record(i, values[k])
+        return
+
+    # Build the slicing pipeline once for all stations and time steps
+    slice_pipeline = pv_slicing.create_slice_pipeline(paraviewfoam, span_direction)
+
+    # Reduce the sections where the data lives
+    reduction_pipeline = None
+    if reduction == "server":
+        reduction_pipeline = pv_slicing.create_reduction_pipeline(
+            slice_pipeline,
+            x,
+            span_direction,
+            pv_reduction.reduce_geometry,
+            ["Twist", "Chord", "Thickness"],
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+        )
+
+    try:
+        for i in time_indices:
+            if refinement is None:
+                x_i = x
+                geometry = compute_geometry_distribution(
+                    slice_pipeline,
+                    times[i],
+                    x,
+                    span_direction,
+                    lift_direction,
+                    drag_direction,
+                    slicing,
+                    reduction_pipeline,
+                )
+            else:
+                # Every process needs the results to refine the same stations
+                x_i, geometry = pv_utils.refine_stations(
+                    lambda x_new: pv_mpi.broadcast(
+                        compute_geometry_distribution(
+                            slice_pipeline, times[i], x_new, span_direction, lift_direction, drag_direction, slicing
+                        )
+                    ),
+                    x,
+                    **refinement,
+                )
+
+            # Results are only gathered on the root process
+            if pv_mpi.is_root():
+                yield record(i, geometry, x_i)
+    finally:
+        # Cleanup Paraview Objects
+        if reduction_pipeline is not None:
+            pv_slicing.delete_slice_pipeline(reduction_pipeline)
+        pv_slicing.delete_slice_pipeline(slice_pipeline)
+
+
+def get_geometry_values(record):
+    """
+    Stack the twist, chord, and thickness of a geometry distribution record.
+
+    Parameters
+    ----------
+    record : dict
+        Record yielded by iter_geometry_distribution().
 
-        c = np.array([c.real, c.imag])
-        return c, r
+    Returns
+    -------
+    ndarray
+        Twist, chord, and thickness of each station, with shape
+        (n_stations, 3).
+    """
+    return np.column_stack((record["twist"], record["chord"], record["thickness"]))
 
-    c, r = circle_from_3_points(x_le_pt_down, x_le_pt, x_le_pt_up)
 
-    # Find true leading edge
-    def minFunc(theta, c, r, xTE):
-        x = np.array([r * np.cos(theta[0]) + c[0], r * np.sin(theta[0]) + c[1]])
-        return -np.linalg.norm(x - x_te)
+def compute_geometry_distribution(
+    slice_pipeline, time, x, span_direction, lift_direction, drag_direction, slicing="multi", reduction_pipeline=None
+):
+    """
+    Compute the twist, chord, and thickness of every station at one time step.
 
-    res = scipy.optimize.minimize(minFunc, x0=[np.pi / 2.0], args=(c, r, x_te), bounds=[(0.0, 2.0 * np.pi)], tol=1e-12)
-    x_le = np.array([r * np.cos(res.x[0]) + c[0], r * np.sin(res.x[0]) + c[1]])
+    Parameters
+    ----------
+    slice_pipeline : list
+        Paraview filters created by create_slice_pipeline().
+    time : float
+        Time value at which to evaluate the pipeline.
+    x : ndarray
+        Coordinates of the stations.
+    span_direction : ndarray
+        Span direction, used as the slice normal.
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+    slicing : str
+        Slicing mode, either "multi" or "station". Default is "multi".
+    reduction_pipeline : list
+        Paraview filters created by create_reduction_pipeline() to reduce the
+        sections on the server. Default is None, which fetches the sections
+        and reduces them locally.
 
-    # Compute chord
-    chord = np.linalg.norm(x_te - x_le)
+    Returns
+    -------
+    ndarray
+        Twist, chord, and thickness of each station, with shape
+        (n_stations, 3).
+    """
+    # Reduce on the server and only fetch the per-station values
+    if reduction_pipeline is not None:
+        geometry = pv_slicing.fetch_reduced(slice_pipeline, reduction_pipeline, time, x, span_direction)
+        if not pv_mpi.is_root():
+            return np.zeros((np.size(x, 0), 3))
+        return geometry
 
-    # Compute twist
-    twist = np.rad2deg(np.arctan2((x_le[1] - x_te[1]), -(x_le[0] - x_te[0])))
+    # Cut and fetch all stations
+    sections = pv_slicing.fetch_sections(slice_pipeline, time, x, span_direction, slicing=slicing)
 
-    # Rotate airfoil
-    R = np.array(
-        [
-            [np.cos(np.deg2rad(twist)), -np.sin(np.deg2rad(twist))],
-            [np.sin(np.deg2rad(twist)), np.cos(np.deg2rad(twist))],
-        ]
-    )
-    coords_disp = (R @ (coords2D - x_le).T).T
+    # Sections are only gathered on the root process
+    if not pv_mpi.is_root():
+        return np.zeros((len(sections), 3))
 
-    # Isolate coordinates
-    coords_top = np.flip(coords_disp[0:i_max_dist, :], axis=0)
-    coords_bot = coords_disp[i_max_dist + 1 :, :][0 : te_idx[1] - i_max_dist]
+    return compute_geometry_sections(sections, lift_direction, drag_direction)
 
-    # Parameterize spline through upper surface
-    spline_top = Akima1DInterpolator(coords_top[:, 0], coords_top[:, 1])
-    spline_bot = Akima1DInterpolator(coords_bot[:, 0], coords_bot[:, 1])
 
-    # Iterate along chord and compute thickness
-    x_sample = np.linspace(chord * 0.01, chord * 0.99, 100)
-    thickness = 0.0
-    for x_loc in x_sample:
-        y_top = spline_top(x_loc)
-        y_bot = spline_bot(x_loc)
+def compute_geometry_sections(sections, lift_direction, drag_direction):
+    """
+    Compute the twist, chord, and thickness of every fetched section.
 
-        thick_loc = y_top - y_bot
-        if thick_loc > thickness:
-            thickness = thick_loc
+    Parameters
+    ----------
+    sections : list
+        Sections returned by fetch_sections().
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
 
-    return chord, twist, thickness
+    Returns
+    -------
+    ndarray
+        Twist, chord, and thickness of each section, with shape
+        (n_sections, 3).
+    """
+    # Iterate over span
+    geometry = np.zeros((len(sections), 3))
+    for j, section in enumerate(sections):
+        geometry[j, :] = pv_reduction.compute_section_geometry(
+            section["points"], section["lines"], lift_direction, drag_direction
+        )
+
+    return geometry
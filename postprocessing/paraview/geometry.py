@@ -7,6 +7,7 @@ import glob
 import paraview.simple as paraview
 
 # Internal Imports
+import postprocessing.paraview.case as pv_case
 
 
 def extract_geometry_cmd():
@@ -61,10 +62,19 @@ def extract_geometry_parser():
         type=str,
         default="False",
     )
+    parser.add_argument(
+        "-ct",
+        "--case_type",
+        help="Case type, either reconstructed or decomposed (read the processor directories directly). Default is reconstructed.",
+        type=str,
+        default="reconstructed",
+    )
     return parser
 
 
-def extract_geometry(input_file=None, output_directory="./", patches="group/wall", overwrite="False"):
+def extract_geometry(
+    input_file=None, output_directory="./", patches="group/wall", overwrite="False", case_type="reconstructed"
+):
     """
     Function to extract a geometry from an OpenFOAM mesh and write it as an
     STL.
@@ -81,6 +91,9 @@ def extract_geometry(input_file=None, output_directory="./", patches="group/wall
     overwrite : str
         Flag to overwrite existing temporary geometry and geometry files.
         Default is False.
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly. Default is "reconstructed".
     """
     # Check if exist exist
     if glob.glob(output_directory + "/Temp*.stl") and overwrite != "True":
@@ -98,9 +111,12 @@ def extract_geometry(input_file=None, output_directory="./", patches="group/wall
     # Import case
     if input_file is None:
         raise ValueError("Input file not set.")
+    if case_type not in pv_case.CASE_TYPES:
+        raise ValueError("Case type {} not recognized, options are reconstructed and decomposed.".format(case_type))
     paraviewfoam = paraview.OpenFOAMReader(
         registrationName="paraview.foam", FileName=str(os.getcwd()) + "/{}".format(input_file)
     )
+    paraviewfoam.CaseType = pv_case.CASE_TYPES[case_type]
     paraviewfoam.MeshRegions = patches
 
     # Save walls to STLs
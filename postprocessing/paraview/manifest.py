@@ -0,0 +1,274 @@
+# External imports
+import os
+import json
+import hashlib
+import numpy as np
+
+# Internal Imports
+import postprocessing
+import postprocessing.paraview.surface as pv_surface
+
+
+def get_time_directories(case_directory):
+    """
+    Find the time directories of an OpenFOAM case.
+
+    Parameters
+    ----------
+    case_directory : str
+        Path to the OpenFOAM case directory.
+
+    Returns
+    -------
+    dict
+        Time directory names, keyed by their time value.
+    """
+    time_directories = {}
+    for entry in os.listdir(case_directory):
+        if not os.path.isdir(os.path.join(case_directory, entry)):
+            continue
+        try:
+            time_directories[float(entry)] = entry
+        except ValueError:
+            continue
+
+    return time_directories
+
+
+def get_processor_directories(case_directory):
+    """
+    Find the processor directories of a decomposed OpenFOAM case.
+
+    Parameters
+    ----------
+    case_directory : str
+        Path to the OpenFOAM case directory.
+
+    Returns
+    -------
+    list
+        Processor directory names, sorted by processor number.
+    """
+    processor_directories = []
+    for entry in os.listdir(case_directory):
+        if entry.startswith("processor") and entry[9:].isdigit():
+            if os.path.isdir(os.path.join(case_directory, entry)):
+                processor_directories.append(entry)
+
+    return sorted(processor_directories, key=lambda entry: int(entry[9:]))
+
+
+def get_input_files(case_directory, time_directory, fields):
+    """
+    List the files a time step of an OpenFOAM case depends on: the mesh, any
+    moving mesh points stored in the time directory, and the requested fields.
+
+    Parameters
+    ----------
+    case_directory : str
+        Path to the OpenFOAM case directory.
+    time_directory : str
+        Name of the time directory, or None if it cannot be found.
+    fields : list
+        Names of the fields read for the time step.
+
+    Returns
+    -------
+    list
+        Paths to the input files that exist, relative to the case directory.
+    """
+    candidates = []
+    for mesh_directory in [os.path.join("constant", "polyMesh")] + (
+        [os.path.join(time_directory, "polyMesh")] if time_directory is not None else []
+    ):
+        if os.path.isdir(os.path.join(case_directory, mesh_directory)):
+            candidates += [
+                os.path.join(mesh_directory, entry)
+                for entry in sorted(os.listdir(os.path.join(case_directory, mesh_directory)))
+            ]
+
+    if time_directory is not None:
+        for field in fields:
+            candidates += [os.path.join(time_directory, field), os.path.join(time_directory, field + ".gz")]
+
+    return [path for path in candidates if os.path.isfile(os.path.join(case_directory, path))]
+
+
+def compute_signature(input_file, time, fields, parameters):
+    """
+    Compute a hash of everything an output of a time step depends on: the time
+    value, the modification times and sizes of the mesh and field files,
+    including those of the processor directories of a decomposed case, the
+    post-processing parameters, and the package version.
+
+    Parameters
+    ----------
+    input_file : str
+        Relative path to the .foam file of the case, or to a surface cache
+        directory.
+    time : float
+        Time value of the time step.
+    fields : list
+        Names of the fields read for the time step.
+    parameters : dict
+        Post-processing parameters, such as patches, directions, and stations.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash of the inputs.
+    """
+    if pv_surface.is_surface_cache(os.path.join(os.getcwd(), input_file)):
+        # A surface cache holds one set of arrays per time index
+        case_directory = os.path.join(os.getcwd(), input_file)
+        times = np.array(pv_surface.load_cache_metadata(case_directory)["times"])
+        input_files = pv_surface.get_cache_files(case_directory, int(np.argmin(np.abs(times - time))))
+    else:
+        case_directory = os.path.dirname(os.path.join(os.getcwd(), input_file))
+
+        # The case and each of its processor directories hold their own time directories
+        input_files = []
+        for base_directory in [""] + get_processor_directories(case_directory):
+            # Match the time value with its directory
+            time_directory = None
+            for value, entry in get_time_directories(os.path.join(case_directory, base_directory)).items():
+                if np.isclose(value, time, rtol=1e-10, atol=1e-14):
+                    time_directory = entry
+                    break
+            input_files += [
+                os.path.join(base_directory, path)
+                for path in get_input_files(os.path.join(case_directory, base_directory), time_directory, fields)
+            ]
+
+    files = {}
+    for path in input_files:
+        stat = os.stat(os.path.join(case_directory, path))
+        files[path] = [stat.st_mtime_ns, stat.st_size]
+
+    inputs = {
+        "version": postprocessing.__version__,
+        "time": float(time),
+        "files": files,
+        "parameters": {key: np.asarray(value).tolist() for key, value in parameters.items()},
+    }
+
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def load_manifest(output_directory, name):
+    """
+    Load the run manifest of an output directory. The manifest records the
+    input hash of every output file written. The outputs recorded in the
+    journal since the manifest was last saved are merged into it, and the
+    manifest is saved again.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the output files.
+
+    Returns
+    -------
+    dict
+        Input hashes, keyed by output file name. Empty if no manifest exists.
+    """
+    manifest_file = os.path.join(output_directory, name + "_manifest.json")
+    journal_file = os.path.join(output_directory, name + "_manifest.journal")
+
+    manifest = {}
+    if os.path.isfile(manifest_file):
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+
+    # Merge the journal, skipping a line cut short by an interrupted run
+    if os.path.isfile(journal_file):
+        with open(journal_file, "r") as f:
+            for line in f:
+                try:
+                    manifest.update(json.loads(line))
+                except ValueError:
+                    continue
+        save_manifest(manifest, output_directory, name)
+        os.remove(journal_file)
+
+    return manifest
+
+
+def save_manifest(manifest, output_directory, name):
+    """
+    Save the run manifest of an output directory, replacing the previous one
+    atomically so an interrupted run never leaves a corrupted manifest.
+
+    Parameters
+    ----------
+    manifest : dict
+        Input hashes, keyed by output file name.
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the output files.
+    """
+    manifest_file = os.path.join(output_directory, name + "_manifest.json")
+    with open(manifest_file + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_file + ".tmp", manifest_file)
+
+
+def is_up_to_date(manifest, output_directory, output_files, signature):
+    """
+    Check if the output files of a time step exist and were written from the
+    same inputs.
+
+    Parameters
+    ----------
+    manifest : dict
+        Input hashes, keyed by output file name.
+    output_directory : str
+        Path to the output directory.
+    output_files : list
+        Names of the output files of the time step.
+    signature : str
+        Hash of the current inputs of the time step.
+
+    Returns
+    -------
+    bool
+        True if all the output files are up to date.
+    """
+    for output_file in output_files:
+        if manifest.get(output_file) != signature:
+            return False
+        if not os.path.isfile(os.path.join(output_directory, output_file)):
+            return False
+
+    return True
+
+
+def record_outputs(manifest, output_directory, name, output_files, signature):
+    """
+    Record the input hash of freshly written output files. The hashes are
+    appended to the journal of the manifest, so that the cost of recording a
+    time step does not grow with the number of outputs already recorded. The
+    journal is merged into the manifest by load_manifest().
+
+    Parameters
+    ----------
+    manifest : dict
+        Input hashes, keyed by output file name. Updated in place.
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the output files.
+    output_files : list
+        Names of the output files written.
+    signature : str
+        Hash of the inputs the files were written from.
+    """
+    entries = {output_file: signature for output_file in output_files}
+    manifest.update(entries)
+
+    journal_file = os.path.join(output_directory, name + "_manifest.journal")
+    with open(journal_file, "a") as f:
+        f.write(json.dumps(entries, sort_keys=True) + "\n")
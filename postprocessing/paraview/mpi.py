@@ -0,0 +1,71 @@
+# External imports
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+from vtk.util import numpy_support as vtk_np
+
+
+def get_rank():
+    """
+    Get the MPI rank of the current process. When running with pvpython or
+    without MPI, the rank is zero.
+
+    Returns
+    -------
+    int
+        Rank of the current process.
+    """
+    return paraview.servermanager.vtkProcessModule.GetProcessModule().GetPartitionId()
+
+
+def get_size():
+    """
+    Get the number of MPI processes Paraview is running on, for example when
+    running with "mpirun -np 4 pvbatch". When running with pvpython or without
+    MPI, the size is one.
+
+    Returns
+    -------
+    int
+        Number of processes.
+    """
+    return paraview.servermanager.vtkProcessModule.GetProcessModule().GetNumberOfLocalPartitions()
+
+
+def is_root():
+    """
+    Check if the current process is the root process, which receives fetched
+    data and writes output files.
+
+    Returns
+    -------
+    bool
+        True on the root process.
+    """
+    return get_rank() == 0
+
+
+def broadcast(values):
+    """
+    Broadcast an array from the root process to all processes, so that every
+    process takes the same decisions from results only gathered on the root
+    process. The array must have the same shape on every process.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array to broadcast. Only the values of the root process are used.
+
+    Returns
+    -------
+    ndarray
+        Values of the root process.
+    """
+    if get_size() == 1:
+        return values
+
+    array = vtk_np.numpy_to_vtk(np.ascontiguousarray(values, dtype=float).ravel(), deep=True)
+    paraview.servermanager.vtkProcessModule.GetProcessModule().GetGlobalController().Broadcast(array, 0)
+
+    return np.reshape(vtk_np.vtk_to_numpy(array), np.shape(values)).copy()
@@ -0,0 +1,286 @@
+# Internal Imports
+import postprocessing.utils as utils
+import postprocessing.paraview.parallel as pv_parallel
+import postprocessing.paraview.mpi as pv_mpi
+import postprocessing.paraview.manifest as pv_manifest
+import postprocessing.paraview.store as pv_store
+import postprocessing.paraview.writer as pv_writer
+import postprocessing.paraview.statistics as pv_statistics
+import postprocessing.paraview.spectra as pv_spectra
+
+
+def create_run(output_directory, name, output_format, incremental, output_files, stores=None):
+    """
+    Gather the output settings of a run of a utility, shared by the functions
+    of this module that select, compute, and write its time steps.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the output files.
+    output_format : str
+        Output format, either "csv" or "store".
+    incremental : str
+        Flag to only process the time steps whose outputs are missing or were
+        written from different inputs.
+    output_files : callable
+        Function returning the names of the CSV files of a time step, given
+        its index.
+    stores : list
+        Names of the outputs each stored in a results store of their own, named
+        <name>_<output>_store. Default is None, which stores all results in a
+        single results store named <name>_store.
+
+    Returns
+    -------
+    dict
+        Run, with the output settings, the "store_directories" keyed by output,
+        and the "manifest" and "signatures" of an incremental run.
+    """
+    store_directories = {}
+    if output_format == "store" and stores is None:
+        store_directories[None] = pv_store.get_store_directory(output_directory, name)
+    elif output_format == "store":
+        for output in stores:
+            store_directories[output] = pv_store.get_store_directory(output_directory, name + "_" + output)
+
+    return {
+        "output_directory": output_directory,
+        "name": name,
+        "output_format": output_format,
+        "incremental": incremental,
+        "output_files": output_files,
+        "store_directories": store_directories,
+        "manifest": {},
+        "signatures": {},
+    }
+
+
+def create_stores(run, fields, stations, times):
+    """
+    Create the results stores of a run on the root process.
+
+    Parameters
+    ----------
+    run : dict
+        Run returned by create_run().
+    fields : list or dict
+        Names of the quantities stored for each station, keyed by output when
+        the outputs are stored separately.
+    stations : ndarray
+        Coordinates of the stations.
+    times : list
+        Time values of the case.
+    """
+    if not pv_mpi.is_root():
+        return
+
+    for output, store_directory in run["store_directories"].items():
+        pv_store.create_store(store_directory, fields if output is None else fields[output], stations, times)
+
+
+def select_time_steps(run, input_file, times, time_indices, fields, parameters):
+    """
+    Select the time steps whose outputs are missing or were written from
+    different inputs, and record the manifest and signatures of the run. All
+    time steps are selected unless the run is incremental.
+
+    Parameters
+    ----------
+    run : dict
+        Run returned by create_run(). Updated in place.
+    input_file : str
+        Relative path to the .foam file of the case, or to a surface cache
+        directory.
+    times : list
+        Time values of the case.
+    time_indices : list
+        Indices of the time steps to process.
+    fields : list
+        Names of the fields read for each time step.
+    parameters : dict
+        Post-processing parameters the outputs depend on.
+
+    Returns
+    -------
+    list
+        Indices of the time steps to process.
+    """
+    if run["incremental"] != "True":
+        return time_indices
+
+    run["manifest"] = pv_manifest.load_manifest(run["output_directory"], run["name"])
+    run["signatures"] = {
+        i: pv_manifest.compute_signature(input_file, times[i], fields, parameters) for i in time_indices
+    }
+
+    signatures = run["signatures"]
+    if run["output_format"] == "store":
+        stored = [pv_store.load_signatures(store_directory) for store_directory in run["store_directories"].values()]
+        return [i for i in time_indices if any(signature.get(i) != signatures[i] for signature in stored)]
+
+    return [
+        i
+        for i in time_indices
+        if not pv_manifest.is_up_to_date(
+            run["manifest"], run["output_directory"], run["output_files"](i), signatures[i]
+        )
+    ]
+
+
+def run_time_workers(run, function, kwargs, time_indices, workers):
+    """
+    Split the time steps across worker processes, each writing the outputs of
+    its own time steps, and record the outputs in the run manifest.
+
+    Parameters
+    ----------
+    run : dict
+        Run returned by create_run().
+    function : callable
+        Module-level utility function run by each worker.
+    kwargs : dict
+        Keyword arguments of the function.
+    time_indices : list
+        Indices of the time steps to process.
+    workers : int
+        Number of worker processes.
+    """
+    # Workers record the signatures of their time steps in the store chunks
+    if run["output_format"] == "store":
+        kwargs = dict(kwargs, incremental=run["incremental"])
+
+    pv_parallel.run_time_steps(function, kwargs, time_indices, workers)
+    if run["incremental"] == "True" and run["output_format"] == "csv":
+        for i in time_indices:
+            pv_manifest.record_outputs(
+                run["manifest"], run["output_directory"], run["name"], run["output_files"](i), run["signatures"][i]
+            )
+
+
+def write_time_steps(run, results):
+    """
+    Write the results of the time steps of a run to CSV files or to the
+    results stores, in the background while the next time steps are computed.
+
+    Parameters
+    ----------
+    run : dict
+        Run returned by create_run().
+    results : iterable
+        Time index and results of each time step, computed as the iterable is
+        consumed. With the "store" output format, the results are the values
+        of the time step, keyed by output when the outputs are stored
+        separately. With "csv", they are the file name, field names, and
+        values of each CSV file of the time step.
+    """
+    output_directory = run["output_directory"]
+    store_directories = run["store_directories"]
+
+    writer = pv_writer.start_writer()
+    completed = False
+    try:
+        buffers = {output: [] for output in store_directories}
+        for i, values in results:
+            signature = run["signatures"][i] if run["incremental"] == "True" else ""
+
+            # Add the time step to the results stores
+            if run["output_format"] == "store":
+                for output, store_directory in store_directories.items():
+                    pv_writer.submit_write(
+                        writer,
+                        pv_store.buffer_chunk,
+                        store_directory,
+                        buffers[output],
+                        i,
+                        values if output is None else values[output],
+                        signature,
+                    )
+                continue
+
+            # Write CSV files
+            for file_name, fields, data in values:
+                pv_writer.submit_write(writer, utils.write_csv, output_directory + file_name, fields, data)
+
+            # Record the outputs of the time step
+            if run["incremental"] == "True":
+                pv_writer.submit_write(
+                    writer,
+                    pv_manifest.record_outputs,
+                    run["manifest"],
+                    output_directory,
+                    run["name"],
+                    [file_name for file_name, _, _ in values],
+                    signature,
+                )
+
+        # Write the remaining time steps to the results stores
+        if pv_mpi.is_root():
+            for output, store_directory in store_directories.items():
+                pv_writer.submit_write(writer, pv_store.write_chunk, store_directory, buffers[output])
+        completed = True
+    finally:
+        # Wait for the pending writes to finish, without hiding an error of the
+        # computation behind a failed write
+        pv_writer.stop_writer(writer, raise_errors=completed)
+
+
+def compute_statistics(records, get_values, spectrum=None, function=None, kwargs=None, time_indices=None, workers=1):
+    """
+    Accumulate the time statistics of the results of a run, and optionally
+    their spectra, one time step at a time.
+
+    Parameters
+    ----------
+    records : iterable
+        Records of the time steps, only consumed without worker processes.
+    get_values : callable
+        Module-level function returning the values of a record.
+    spectrum : dict
+        Running spectra returned by create_spectrum(), updated in place.
+        Default is None, which computes no spectra.
+    function : callable
+        Module-level generator function yielding the records of a subset of
+        the time steps in a worker process. Default is None.
+    kwargs : dict
+        Keyword arguments of the generator function. Default is None.
+    time_indices : list
+        Indices of the time steps to split across worker processes. Default is
+        None.
+    workers : int
+        Number of worker processes over which to split the time steps, which
+        cannot be combined with spectra. Default is 1.
+
+    Returns
+    -------
+    dict
+        Running statistics returned by create_statistics().
+    """
+    running = pv_statistics.create_statistics()
+    if workers > 1:
+        kwargs = dict(kwargs, function=function, get_values=get_values)
+        for result in pv_parallel.run_time_steps(accumulate_statistics, kwargs, time_indices, workers):
+            running = pv_statistics.merge_statistics(running, result)
+        return running
+
+    for record in records:
+        values = get_values(record)
+        pv_statistics.update_statistics(running, values)
+        if spectrum is not None:
+            pv_spectra.update_spectrum(spectrum, record["time"], values)
+
+    return running
+
+
+def accumulate_statistics(function, get_values, time_indices=None, workers=1, **kwargs):
+    """
+    Accumulate the time statistics of the records of a subset of the time
+    steps, in a worker process of compute_statistics().
+    """
+    running = pv_statistics.create_statistics()
+    for record in function(time_indices=time_indices, **kwargs):
+        pv_statistics.update_statistics(running, get_values(record))
+
+    return running
@@ -0,0 +1,224 @@
+# External imports
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Internal Imports
+import postprocessing.paraview.case as pv_case
+import postprocessing.paraview.slicing as pv_slicing
+
+
+def split_indices(indices, n_chunks):
+    """
+    Split a list of indices into interleaved chunks, so that each chunk holds
+    time steps from the whole range and the work is balanced when the cost of
+    the time steps changes over the run.
+
+    Parameters
+    ----------
+    indices : list
+        Indices to split.
+    n_chunks : int
+        Number of chunks.
+
+    Returns
+    -------
+    list
+        Non-empty lists of indices.
+    """
+    indices = list(indices)
+    chunks = [indices[k::n_chunks] for k in range(n_chunks)]
+
+    return [chunk for chunk in chunks if len(chunk) > 0]
+
+
+def run_time_steps(function, kwargs, time_indices, workers):
+    """
+    Run a post-processing function over time steps in parallel worker
+    processes. Each worker calls the function with a subset of the time
+    indices and a single worker, so it opens its own reader and writes its own
+    output files.
+
+    Worker processes are started with the "spawn" method so that each one
+    initializes Paraview from scratch.
+
+    Parameters
+    ----------
+    function : callable
+        Module-level post-processing function accepting time_indices and
+        workers keyword arguments.
+    kwargs : dict
+        Keyword arguments passed to the function.
+    time_indices : list
+        Indices of the time steps to process.
+    workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    list
+        Value returned by the function in each worker.
+    """
+    chunks = split_indices(time_indices, workers)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as executor:
+        futures = [executor.submit(function, **kwargs, time_indices=chunk, workers=1) for chunk in chunks]
+
+        # Re-raise the first worker error, after all workers have finished
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+
+        return [future.result() for future in futures]
+
+
+def run_span_chunks(function, case_kwargs, times, x, normal, workers, **kwargs):
+    """
+    Run a per-time-step distribution function in parallel worker processes,
+    with the stations split into contiguous spanwise chunks. Each worker opens
+    its own reader, clips the surface to the slab around its chunk of stations
+    so that it only holds the part of the surface it needs, and computes every
+    time step for its stations.
+
+    Parameters
+    ----------
+    function : callable
+        Module-level function called as function(slice_pipeline, time, x,
+        normal, **kwargs) and returning an array with one row per station.
+    case_kwargs : dict
+        Keyword arguments passed to open_case() in each worker.
+    times : list
+        Time values to process.
+    x : ndarray
+        Coordinates of the stations.
+    normal : ndarray
+        Unit normal of the slice planes.
+    workers : int
+        Number of worker processes.
+    kwargs :
+        Additional keyword arguments passed to the function.
+
+    Returns
+    -------
+    ndarray
+        Merged results with shape (n_times, n_stations, n_quantities).
+    """
+    chunks = [chunk for chunk in np.array_split(np.arange(np.size(x, 0)), workers) if np.size(chunk) > 0]
+
+    # Pad the slabs by half a station spacing so the stations at the chunk
+    # edges are cut from complete faces
+    s = x @ normal
+    margin = 0.5 * np.min(np.abs(np.diff(s))) if np.size(s) > 1 else 0.0
+    margin = margin if margin > 0.0 else 1e-6 * max(1.0, np.max(np.abs(s)))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as executor:
+        futures = [
+            executor.submit(_span_chunk_worker, function, case_kwargs, times, x[chunk, :], normal, margin, kwargs)
+            for chunk in chunks
+        ]
+        results = [future.result() for future in futures]
+
+    return np.concatenate(results, axis=1)
+
+
+def start_processor_workers(processor_directories, workers):
+    """
+    Start the worker processes reading the processor directories of a
+    decomposed case. The processor directories are split into contiguous
+    chunks, and each chunk is always handled by the same worker process, so
+    that the worker can keep its readers open from one task to the next.
+
+    Parameters
+    ----------
+    processor_directories : list
+        Processor directory names, sorted by processor number.
+    workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    dict
+        Processor workers, with the "chunks" of processor directories, the
+        single process "executors" handling them, and the "futures" of the
+        tasks submitted to them.
+    """
+    chunks = [chunk.tolist() for chunk in np.array_split(np.array(processor_directories), workers) if len(chunk) > 0]
+
+    context = multiprocessing.get_context("spawn")
+    executors = [ProcessPoolExecutor(max_workers=1, mp_context=context) for _ in chunks]
+
+    return {"chunks": chunks, "executors": executors, "futures": []}
+
+
+def submit_processor_task(processor_workers, function, **kwargs):
+    """
+    Submit a task to every processor worker, which calls the function with its
+    chunk of processor directories. The results are fetched from the returned
+    futures, so the parent can handle one task while the next one runs.
+
+    Parameters
+    ----------
+    processor_workers : dict
+        Processor workers, as returned by start_processor_workers().
+    function : callable
+        Module-level function accepting a processor_directories keyword
+        argument.
+    **kwargs
+        Additional keyword arguments passed to the function.
+
+    Returns
+    -------
+    list
+        Futures of the function for each chunk, in processor order.
+    """
+    futures = [
+        executor.submit(function, processor_directories=chunk, **kwargs)
+        for chunk, executor in zip(processor_workers["chunks"], processor_workers["executors"])
+    ]
+
+    # Keep the tasks that have not finished, to cancel them when stopping
+    processor_workers["futures"] = [future for future in processor_workers["futures"] if not future.done()] + futures
+
+    return futures
+
+
+def stop_processor_workers(processor_workers):
+    """
+    Stop the processor workers, cancelling the tasks that have not started.
+
+    Parameters
+    ----------
+    processor_workers : dict
+        Processor workers, as returned by start_processor_workers().
+    """
+    # Cancel the pending tasks, since shutdown() only does so from Python 3.9
+    for future in processor_workers["futures"]:
+        future.cancel()
+    processor_workers["futures"] = []
+
+    for executor in processor_workers["executors"]:
+        executor.shutdown(wait=True)
+
+
+def _span_chunk_worker(function, case_kwargs, times, x, normal, margin, kwargs):
+    """
+    Compute every time step for a chunk of stations on a clipped slab of the
+    surface.
+    """
+    source, _ = pv_case.open_case(**case_kwargs)
+
+    # Clip the surface to the slab of this chunk
+    s = x @ normal
+    slab_pipeline = pv_slicing.create_slab_pipeline(source, normal, np.min(s) - margin, np.max(s) + margin)
+    slice_pipeline = pv_slicing.create_slice_pipeline(slab_pipeline[-1], normal)
+
+    results = np.array([function(slice_pipeline, time, x, normal, **kwargs) for time in times])
+
+    # Cleanup Paraview Objects
+    pv_slicing.delete_slice_pipeline(slice_pipeline)
+    pv_slicing.delete_slice_pipeline(slab_pipeline)
+
+    return results
@@ -0,0 +1,182 @@
+# External imports
+import numpy as np
+import scipy
+from scipy.interpolate import Akima1DInterpolator
+
+# Internal Imports
+import postprocessing.paraview.utils as pv_utils
+
+
+def reduce_geometry(points, lines, arrays, origin, normal, offsets, lift_direction, drag_direction):
+    """
+    Reduce the sections of a multi-plane cut to the twist, chord, and
+    thickness of every station. This runs wherever the sections are, either
+    on the client after they are fetched or on the server inside a
+    Programmable Filter.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates of the cut, with shape (n_points, 3).
+    lines : ndarray
+        Point indices of each line of the cut, with shape (n_lines, 2).
+    arrays : dict
+        Point arrays of the cut, unused.
+    origin : ndarray
+        Origin of the slice planes.
+    normal : ndarray
+        Unit normal of the slice planes.
+    offsets : ndarray
+        Offset of each station from the origin along the normal.
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+
+    Returns
+    -------
+    ndarray
+        Twist, chord, and thickness of each station, with shape
+        (n_stations, 3).
+    """
+    groups = pv_utils.split_sections(points, lines, np.asarray(origin), np.asarray(normal), np.asarray(offsets))
+
+    geometry = np.zeros((len(groups), 3))
+    for j, group in enumerate(groups):
+        geometry[j, :] = compute_section_geometry(points, lines[group], lift_direction, drag_direction)
+
+    return geometry
+
+
+def compute_section_geometry(points, lines, lift_direction, drag_direction):
+    """
+    Compute the twist, chord, and thickness of a single section.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates, with shape (n_points, 3).
+    lines : ndarray
+        Point indices of each line of the section, with shape (n_lines, 2).
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+
+    Returns
+    -------
+    ndarray
+        Twist, chord, and thickness of the section.
+    """
+    # Order, rotate, and sort the section points as done for fetched sections
+    coords2D, _ = pv_utils.sort_section({"points": points, "lines": lines}, lift_direction, drag_direction)
+
+    # Compute sectional properties
+    chord, twist, thickness = compute_section_properties(coords2D)
+
+    return np.array([twist, chord, thickness])
+
+
+def compute_section_properties(coords2D):
+    """
+    Compute the chord and twist of an airfoil section given a set of ordered
+    points.
+
+    Parameters
+    ----------
+    coords2D : ndarray
+        Sorted 2D airfoil coordinates rotated to an X-Y plane, with the flow
+        direction as +X and lift direction as +Y.
+
+    Returns
+    -------
+    float
+        Section chord length, in current working units.
+    float
+        Section twist, in degrees.
+    float
+        Section maximum thickness, in current working units.
+    """
+    # Find the trailing edge
+    te_pts, te_idx = pv_utils.find_te(coords2D)
+    x_te = np.mean(te_pts, axis=0)
+
+    # Find coordinate furthest from trailing edge and two neighbors
+    max_dist = 0.0
+    i_max_dist = -1
+    for k in range(1, np.size(coords2D, 0)):
+        dist = np.linalg.norm(coords2D[k, :] - x_te)
+        if dist > max_dist:
+            max_dist = dist
+            i_max_dist = k
+
+    x_le_pt_down = coords2D[i_max_dist - 1, :]
+    x_le_pt = coords2D[i_max_dist, :]
+    x_le_pt_up = coords2D[i_max_dist + 1, :]
+
+    # Compute center and radius of leading edge circle
+    def circle_from_3_points(x1, x2, x3):
+        z1 = complex(x1[0], x1[1])
+        z2 = complex(x2[0], x2[1])
+        z3 = complex(x3[0], x3[1])
+
+        if (z1 == z2) or (z2 == z3) or (z3 == z1):
+            raise ValueError(f"Duplicate points: {z1}, {z2}, {z3}")
+
+        w = (z3 - z1) / (z2 - z1)
+
+        # Check for colinear points
+        if abs(w.imag) <= 1e-5:
+            raise ValueError(f"Points are collinear: {z1}, {z2}, {z3}")
+
+        c = (z2 - z1) * (w - abs(w) ** 2) / (2j * w.imag) + z1
+        r = abs(z1 - c).real
+
+        c = np.array([c.real, c.imag])
+        return c, r
+
+    c, r = circle_from_3_points(x_le_pt_down, x_le_pt, x_le_pt_up)
+
+    # Find true leading edge
+    def minFunc(theta, c, r, xTE):
+        x = np.array([r * np.cos(theta[0]) + c[0], r * np.sin(theta[0]) + c[1]])
+        return -np.linalg.norm(x - x_te)
+
+    res = scipy.optimize.minimize(minFunc, x0=[np.pi / 2.0], args=(c, r, x_te), bounds=[(0.0, 2.0 * np.pi)], tol=1e-12)
+    x_le = np.array([r * np.cos(res.x[0]) + c[0], r * np.sin(res.x[0]) + c[1]])
+
+    # Compute chord
+    chord = np.linalg.norm(x_te - x_le)
+
+    # Compute twist
+    twist = np.rad2deg(np.arctan2((x_le[1] - x_te[1]), -(x_le[0] - x_te[0])))
+
+    # Rotate airfoil
+    R = np.array(
+        [
+            [np.cos(np.deg2rad(twist)), -np.sin(np.deg2rad(twist))],
+            [np.sin(np.deg2rad(twist)), np.cos(np.deg2rad(twist))],
+        ]
+    )
+    coords_disp = (R @ (coords2D - x_le).T).T
+
+    # Isolate coordinates
+    coords_top = np.flip(coords_disp[0:i_max_dist, :], axis=0)
+    coords_bot = coords_disp[i_max_dist + 1 :, :][0 : te_idx[1] - i_max_dist]
+
+    # Parameterize spline through upper surface
+    spline_top = Akima1DInterpolator(coords_top[:, 0], coords_top[:, 1])
+    spline_bot = Akima1DInterpolator(coords_bot[:, 0], coords_bot[:, 1])
+
+    # Iterate along chord and compute thickness
+    x_sample = np.linspace(chord * 0.01, chord * 0.99, 100)
+    thickness = 0.0
+    for x_loc in x_sample:
+        y_top = spline_top(x_loc)
+        y_bot = spline_bot(x_loc)
+
+        thick_loc = y_top - y_bot
+        if thick_loc > thickness:
+            thickness = thick_loc
+
+    return chord, twist, thickness
@@ -0,0 +1,351 @@
+# External imports
+import os
+import re
+import json
+import hashlib
+import numpy as np
+
+# Internal Imports
+import postprocessing
+import postprocessing.paraview.store as pv_store
+
+
+# Name of the metadata file of a consolidated results directory
+RESULTS_METADATA_FILE = "results.json"
+
+
+def get_results_directory(output_directory, name):
+    """
+    Get the path of the consolidated results of an output name.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the outputs.
+
+    Returns
+    -------
+    str
+        Path to the consolidated results directory.
+    """
+    return os.path.join(output_directory, name + "_results")
+
+
+def get_source_files(output_directory, name):
+    """
+    Find the files written by a force or geometry distribution run, either the
+    chunks of its results store or its per-time-step CSV files.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the outputs.
+
+    Returns
+    -------
+    list
+        Paths to the source files, relative to the output directory.
+    dict
+        Time index of each CSV file, empty for a results store.
+    """
+    store_directory = pv_store.get_store_directory(output_directory, name)
+    if os.path.isdir(store_directory):
+        files = [pv_store.STORE_METADATA_FILE] + pv_store.get_chunk_files(store_directory)
+        return [os.path.join(name + "_store", entry) for entry in files], {}
+
+    pattern = re.compile(re.escape(name) + r"_(\d+)\.csv$")
+    time_indices = {}
+    for entry in os.listdir(output_directory):
+        match = pattern.match(entry)
+        if match is not None:
+            time_indices[entry] = int(match.group(1))
+
+    return sorted(time_indices, key=time_indices.get), time_indices
+
+
+def open_results(output_directory="./", name="force_distribution", times=None, mmap_mode="r"):
+    """
+    Open the results of a force or geometry distribution run as time x
+    station x quantity arrays backed by memory mapping, so that slicing a few
+    time steps or stations only reads those from disk.
+
+    The first time a run is opened, its CSV files or results store are
+    consolidated into a <name>_results directory, one time step at a time.
+    The consolidated arrays are reused as long as the source files are
+    unchanged.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory of the run. Default is "./".
+    name : str
+        Name pattern of the outputs. Default is "force_distribution".
+    times : list
+        Time values of all time steps of the case, used for CSV outputs, which
+        do not record them. Default is None, which uses the time indices.
+    mmap_mode : str
+        Memory mapping mode passed to numpy.load(). Default is "r".
+
+    Returns
+    -------
+    dict
+        Results with the "fields" names, the "time_indices" and "times" of the
+        computed time steps, the station coordinates "stations", and the
+        "values" array of shape time x station x quantity.
+    """
+    source_files, csv_indices = get_source_files(output_directory, name)
+    if len(source_files) == 0:
+        raise RuntimeError("No {} outputs found in {}.".format(name, output_directory))
+
+    # Hash the modification times and sizes of the source files
+    files = {}
+    for path in source_files:
+        stat = os.stat(os.path.join(output_directory, path))
+        files[path] = [stat.st_mtime_ns, stat.st_size]
+    sources = {"version": postprocessing.__version__, "files": files}
+    signature = hashlib.sha256(json.dumps(sources, sort_keys=True).encode()).hexdigest()
+
+    # Consolidate the sources if they changed since the last time
+    results_directory = get_results_directory(output_directory, name)
+    metadata_file = os.path.join(results_directory, RESULTS_METADATA_FILE)
+    metadata = None
+    if os.path.isfile(metadata_file):
+        with open(metadata_file, "r") as f:
+            metadata = json.load(f)
+    if metadata is None or metadata["signature"] != signature:
+        if csv_indices:
+            metadata = consolidate_csv(output_directory, source_files, csv_indices, results_directory)
+        else:
+            metadata = consolidate_store(pv_store.get_store_directory(output_directory, name), results_directory)
+        metadata["signature"] = signature
+        with open(metadata_file, "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    # Time values of CSV outputs
+    if metadata["times"] is None:
+        metadata["times"] = metadata["time_indices"] if times is None else [times[i] for i in metadata["time_indices"]]
+
+    return {
+        "fields": metadata["fields"],
+        "time_indices": np.array(metadata["time_indices"], dtype=np.int64),
+        "times": np.array(metadata["times"], dtype=float),
+        "stations": np.load(os.path.join(results_directory, "stations.npy")),
+        "values": np.load(os.path.join(results_directory, "values.npy"), mmap_mode=mmap_mode),
+    }
+
+
+def consolidate_csv(output_directory, source_files, csv_indices, results_directory):
+    """
+    Consolidate the per-time-step CSV files of a run into a memory mapped
+    array, reading one file at a time.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    source_files : list
+        CSV files, sorted by time index.
+    csv_indices : dict
+        Time index of each CSV file.
+    results_directory : str
+        Path to the consolidated results directory.
+
+    Returns
+    -------
+    dict
+        Metadata of the consolidated results.
+    """
+    os.makedirs(results_directory, exist_ok=True)
+
+    # The first file sets the stations and the fields
+    with open(os.path.join(output_directory, source_files[0]), "r") as f:
+        fields = f.readline().strip().split(",")[3:]
+    first = np.loadtxt(os.path.join(output_directory, source_files[0]), delimiter=",", skiprows=1, ndmin=2)
+    np.save(os.path.join(results_directory, "stations.npy"), first[:, :3])
+
+    values = np.lib.format.open_memmap(
+        os.path.join(results_directory, "values.npy"),
+        mode="w+",
+        shape=(len(source_files), np.size(first, 0), len(fields)),
+    )
+    for k, source_file in enumerate(source_files):
+        data = np.loadtxt(os.path.join(output_directory, source_file), delimiter=",", skiprows=1, ndmin=2)
+        if np.shape(data) != np.shape(first):
+            raise RuntimeError("{} does not have the same stations as {}.".format(source_file, source_files[0]))
+        values[k] = data[:, 3:]
+    values.flush()
+    del values
+
+    return {"fields": fields, "time_indices": [csv_indices[entry] for entry in source_files], "times": None}
+
+
+def consolidate_store(store_directory, results_directory):
+    """
+    Consolidate the chunks of a results store into a memory mapped array,
+    reading one chunk at a time. Only the computed time steps are kept.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+    results_directory : str
+        Path to the consolidated results directory.
+
+    Returns
+    -------
+    dict
+        Metadata of the consolidated results.
+    """
+    os.makedirs(results_directory, exist_ok=True)
+
+    metadata = pv_store.load_store_metadata(store_directory)
+    stations = np.array(metadata["stations"])
+    np.save(os.path.join(results_directory, "stations.npy"), stations)
+
+    # Newer chunks overwrite the time steps of older ones
+    chunk_files = pv_store.get_chunk_files(store_directory)
+    latest = {}
+    for chunk_file in chunk_files:
+        with np.load(os.path.join(store_directory, chunk_file)) as chunk:
+            latest.update({i: chunk_file for i in chunk["time_indices"].tolist()})
+    time_indices = sorted(latest)
+    rows = {i: k for k, i in enumerate(time_indices)}
+
+    values = np.lib.format.open_memmap(
+        os.path.join(results_directory, "values.npy"),
+        mode="w+",
+        shape=(len(time_indices), np.size(stations, 0), len(metadata["fields"])),
+    )
+    for chunk_file in chunk_files:
+        with np.load(os.path.join(store_directory, chunk_file)) as chunk:
+            for i, chunk_values in zip(chunk["time_indices"].tolist(), chunk["values"]):
+                if latest[i] == chunk_file:
+                    values[rows[i]] = chunk_values
+    values.flush()
+    del values
+
+    return {
+        "fields": metadata["fields"],
+        "time_indices": time_indices,
+        "times": [metadata["times"][i] for i in time_indices],
+    }
+
+
+def select_results(results, time_range=None, stations=None, fields=None):
+    """
+    Select part of the results. A time range keeps the selection memory
+    mapped, and only the selected stations and fields are read from disk.
+
+    Parameters
+    ----------
+    results : dict
+        Results returned by open_results().
+    time_range : list
+        First and last time values to keep, inclusive. Default is None, which
+        keeps all time steps.
+    stations : int or list
+        Index or indices of the stations to keep. Default is None, which keeps
+        all stations.
+    fields : str or list
+        Name or names of the quantities to keep. Default is None, which keeps
+        all quantities.
+
+    Returns
+    -------
+    dict
+        Selected results, in the format returned by open_results().
+    """
+    # Time steps are sorted, so a time range is a contiguous slice
+    time_slice = slice(None)
+    if time_range is not None:
+        time_slice = slice(
+            np.searchsorted(results["times"], time_range[0], side="left"),
+            np.searchsorted(results["times"], time_range[1], side="right"),
+        )
+
+    station_indices = slice(None) if stations is None else np.atleast_1d(stations)
+
+    field_indices = slice(None)
+    field_names = results["fields"]
+    if fields is not None:
+        field_names = np.atleast_1d(fields).tolist()
+        for field in field_names:
+            if field not in results["fields"]:
+                raise ValueError("Field {} not found, options are {}.".format(field, ", ".join(results["fields"])))
+        field_indices = [results["fields"].index(field) for field in field_names]
+
+    # Index one axis at a time so that only basic slices keep the memory map
+    values = results["values"][time_slice]
+    if stations is not None:
+        values = values[:, station_indices, :]
+    if fields is not None:
+        values = values[:, :, field_indices]
+
+    return {
+        "fields": field_names,
+        "time_indices": results["time_indices"][time_slice],
+        "times": results["times"][time_slice],
+        "stations": results["stations"][station_indices],
+        "values": values,
+    }
+
+
+def plot_history(results, field, stations=None, library="matplotlib", style_name="doumont-light"):
+    """
+    Plot the history of a quantity at a few stations, using the styles of the
+    postprocessing.matplotlib or postprocessing.plotly modules.
+
+    Parameters
+    ----------
+    results : dict
+        Results returned by open_results() or select_results().
+    field : str
+        Name of the quantity to plot.
+    stations : list
+        Indices of the stations to plot. Default is None, which plots the
+        first station.
+    library : str
+        Plotting library, either "matplotlib" or "plotly". Default is
+        "matplotlib".
+    style_name : str
+        Name of the style. Default is "doumont-light".
+
+    Returns
+    -------
+    Matplotlib figure or Plotly figure
+        Figure with one line per station.
+    """
+    if stations is None:
+        stations = [0]
+
+    selection = select_results(results, stations=stations, fields=field)
+    labels = ["Station {}".format(j) for j in np.atleast_1d(stations)]
+
+    # Plotting libraries are only imported when plotting
+    if library == "matplotlib":
+        import matplotlib.pyplot as plt
+        import postprocessing.matplotlib as pp_mpl
+
+        with plt.style.context(pp_mpl.get_style(style_name)):
+            fig, ax = plt.subplots()
+            for j, label in enumerate(labels):
+                ax.plot(selection["times"], selection["values"][:, j, 0], label=label)
+            ax.set_xlabel("Time")
+            ax.set_ylabel(field)
+            ax.legend()
+        return fig
+    elif library == "plotly":
+        import plotly.graph_objects as go
+        import postprocessing.plotly as pp_plotly
+
+        fig = go.Figure(layout=dict(template=pp_plotly.get_style(style_name)))
+        for j, label in enumerate(labels):
+            fig.add_trace(go.Scatter(x=selection["times"], y=selection["values"][:, j, 0], name=label))
+        fig.update_layout(xaxis_title="Time", yaxis_title=field)
+        return fig
+    else:
+        raise ValueError("Plotting library {} not recognized, options are matplotlib and plotly.".format(library))
@@ -0,0 +1,339 @@
+# External imports
+import os
+import numpy as np
+
+# Internal Imports
+import postprocessing.utils as utils
+import postprocessing.paraview.slicing as pv_slicing
+import postprocessing.paraview.case as pv_case
+import postprocessing.paraview.mpi as pv_mpi
+import postprocessing.paraview.store as pv_store
+import postprocessing.paraview.outputs as pv_outputs
+import postprocessing.paraview.distributions as pv_distributions
+import postprocessing.paraview.slices as pv_slices
+
+# Command line entry points, kept importable from this module
+from postprocessing.paraview.commands import (  # noqa: F401
+    sections_cmd,
+    sections_parser,
+)
+
+
+# Outputs that can be computed from the sections
+OUTPUTS = ["force", "geometry", "cp"]
+
+# Quantities of each output, per station, with a single force direction and no
+# moment
+FIELDS = {"force": ["Force"], "geometry": ["Twist", "Chord", "Thickness"], "cp": ["X", "Y", "CP"]}
+
+
+def sections(
+    input_file=None,
+    output_directory="./",
+    name="sections",
+    patches="group/wall",
+    outputs=["force", "geometry", "cp"],
+    span_direction="Z+",
+    force_direction="Y+",
+    lift_direction="Y+",
+    drag_direction="X+",
+    x_start=[0, 0, 0],
+    x_end=[0, 0, 1],
+    n_span=100,
+    rho0=None,
+    u0=None,
+    p0=None,
+    slicing="multi",
+    workers=1,
+    incremental="False",
+    output_format="csv",
+    case_type="reconstructed",
+    time_indices=None,
+    moment_points=None,
+):
+    """
+    Function to compute the force distribution, geometry distribution, and
+    pressure coefficient slices of a case using Paraview, opening the case once
+    and cutting and fetching each section once per time step for all the
+    requested outputs.
+
+    The outputs are written in the same format as the force_distribution(),
+    geometry_distribution(), and slices_cp() functions, in files named
+    <name>_force_<time index>.csv, <name>_geometry_<time index>.csv, and
+    <name>_cp_<time index>_<station index>.csv.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to file to load with Paraview.
+    output_directory : str
+        Path to directory where the output files will be written. Default is
+        "./".
+    name : str
+        Name pattern to write out files in the output directory. Default is
+        "sections".
+    patches : str or list
+        Patch name(s) over which to compute the sections. Default is
+        "group/wall".
+    outputs : list
+        Outputs to compute, any of "force", "geometry", and "cp". Default is
+        ["force", "geometry", "cp"].
+    span_direction : str or list
+        Vector direction for span direction either as a string (eg. X+) or list
+        (eg. [0 0 1]). Should be of magnitude 1. Default is "Z+".
+    force_direction : str or list
+        Vector direction for force direction either as a string (eg. X+) or
+        list (eg. [0 1 0]). Should be of magnitude 1. Several directions can
+        be given as a list (eg. ["Y+", "X+"]), and are all integrated from the
+        same sections, with one output column per direction as written by
+        force_distribution(). Default is "Y+".
+    lift_direction : str or list
+        Vector direction for lift direction either as a string (eg. X+) or list
+        (eg. [0 1 0]). Should be of magnitude 1. Default is "Y+".
+    drag_direction : str or list
+        Vector direction for drag direction either as a string (eg. X+) or list
+        (eg. [1 0 0]). Should be of magnitude 1. Default is "X+".
+    x_start : list
+        Coordinates to start slices from. Default is [0, 0, 0].
+    x_end : list
+        Coordinates to end slices at. Default is [0, 0, 1].
+    n_span : int
+        Number of spanwise samples. Default is 100.
+    rho0 : float
+        Freestream density, required for the "cp" output.
+    u0 : float
+        Freestream velocity magnitude, required for the "cp" output.
+    p0 : float
+        Freestream pressure, required for the "cp" output.
+    slicing : str
+        Slicing mode. With "multi", all stations are cut in a single filter
+        execution and fetched in one transfer per time step. With "station", a
+        single slice is moved between stations. Default is "multi".
+    workers : int
+        Number of worker processes over which to split the time steps. Each
+        worker opens its own reader. Default is 1.
+    incremental : str
+        Flag to only process the time steps whose outputs are missing or were
+        written from different inputs, as recorded in the run manifest of the
+        output directory. Default is "False".
+    output_format : str
+        Output format. With "csv", one file is written per time step. With
+        "store", the results of all time steps are written in compressed
+        chunks of a results store directory named <name>_store, which can be
+        loaded with postprocessing.paraview.store.load_store(). Default is
+        "csv".
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly, in parallel when running with MPI.
+        Default is "reconstructed".
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
+    moment_points : list
+        Reference points of the sectional moments of the "force" output,
+        either as a list of points (eg. [[0.25, 0, 0]]) or as a flat list of
+        coordinates. The moments are taken about the span direction through
+        each point, and written after the forces as by force_distribution().
+        Default is None, which computes no moment.
+    """
+    # Check if output directory exists
+    if not os.path.isdir(output_directory):
+        raise RuntimeError("Output directory {} does not exist.".format(output_directory))
+
+    # Check requested outputs
+    outputs = np.atleast_1d(outputs).tolist()
+    for output in outputs:
+        if output not in OUTPUTS:
+            raise ValueError("Output {} not recognized, options are {}.".format(output, ", ".join(OUTPUTS)))
+
+    # Check output format
+    if output_format not in ["csv", "store"]:
+        raise ValueError("Output format {} not recognized, options are csv and store.".format(output_format))
+
+    # Check that freestream values were provided
+    if "cp" in outputs:
+        if rho0 is None:
+            raise ValueError("No freestream density (rho0) provided.")
+        if u0 is None:
+            raise ValueError("No freestream velocity (u0) provided.")
+        if p0 is None:
+            raise ValueError("No freestream pressure (p0) provided.")
+
+    # Generate direction vectors
+    span_direction = utils.check_input_vector(span_direction, "span direction", check_norm=True)
+    force_direction = utils.check_input_vectors(force_direction, "force direction", check_norm=True)
+    if moment_points is not None:
+        moment_points = utils.check_input_vectors(moment_points, "moment point", check_norm=False)
+    lift_direction = utils.check_input_vector(lift_direction, "lift direction", check_norm=True)
+    drag_direction = utils.check_input_vector(drag_direction, "drag direction", check_norm=True)
+
+    # Generate sample points
+    x = pv_distributions.get_stations(x_start, x_end, n_span)
+
+    # Name the force and moment columns as force_distribution() does
+    fields = dict(FIELDS, force=pv_distributions.get_force_fields(force_direction, moment_points))
+
+    # Only read and fetch the arrays the outputs need
+    point_arrays = []
+    if "force" in outputs:
+        point_arrays.append("forcePerS")
+    if "cp" in outputs:
+        point_arrays.append("p")
+
+    # Import case
+    paraviewfoam, times = pv_case.open_case(input_file, patches, cell_arrays=point_arrays, case_type=case_type)
+
+    # Worker processes and MPI ranks are exclusive
+    if workers > 1 and pv_mpi.get_size() > 1:
+        raise RuntimeError("Worker processes cannot be combined with MPI execution, set workers to 1.")
+
+    # Distribute time steps over worker processes
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    # Output settings of the run, with a results store per output
+    run = pv_outputs.create_run(
+        output_directory,
+        name,
+        output_format,
+        incremental,
+        lambda i: get_output_files(name, outputs, i, n_span),
+        stores=outputs,
+    )
+
+    # Create the results stores
+    pv_outputs.create_stores(run, fields, x, times)
+
+    # Skip time steps whose outputs are up to date
+    if incremental == "True":
+        parameters = dict(
+            patches=patches,
+            outputs=outputs,
+            span_direction=span_direction,
+            force_direction=np.squeeze(force_direction),
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+            x=x,
+            rho0=rho0,
+            u0=u0,
+            p0=p0,
+        )
+        if moment_points is not None:
+            parameters["moment_points"] = moment_points
+        time_indices = pv_outputs.select_time_steps(run, input_file, times, time_indices, point_arrays, parameters)
+
+    if workers > 1:
+        kwargs = dict(
+            input_file=input_file,
+            output_directory=output_directory,
+            name=name,
+            patches=patches,
+            outputs=outputs,
+            span_direction=span_direction,
+            force_direction=force_direction,
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+            x_start=x_start,
+            x_end=x_end,
+            n_span=n_span,
+            rho0=rho0,
+            u0=u0,
+            p0=p0,
+            slicing=slicing,
+            output_format=output_format,
+            case_type=case_type,
+            moment_points=moment_points,
+        )
+        pv_outputs.run_time_workers(run, sections, kwargs, time_indices, workers)
+        return
+
+    # Build the slicing pipeline once for all stations and time steps
+    slice_pipeline = pv_slicing.create_slice_pipeline(paraviewfoam, span_direction)
+
+    # Values of the time step for the results stores, or its CSV files
+    def iter_results():
+        for i in time_indices:
+            # Cut and fetch all stations once for all outputs
+            slices = pv_slicing.fetch_sections(
+                slice_pipeline, times[i], x, span_direction, point_arrays=point_arrays, slicing=slicing
+            )
+
+            # Sections are only gathered and written on the root process
+            if not pv_mpi.is_root():
+                continue
+
+            # Compute the requested outputs from the same sections
+            values = {}
+            if "force" in outputs:
+                values["force"] = np.reshape(
+                    pv_distributions.compute_force_sections(slices, force_direction, moment_points, span_direction),
+                    (n_span, -1),
+                )
+
+            if "geometry" in outputs:
+                values["geometry"] = pv_distributions.compute_geometry_sections(slices, lift_direction, drag_direction)
+
+            if "cp" in outputs:
+                values["cp"] = [
+                    np.column_stack((coords2D, cp))
+                    for coords2D, cp in pv_slices.compute_cp_sections(
+                        slices, lift_direction, drag_direction, rho0, u0, p0
+                    )
+                ]
+
+            if output_format == "store":
+                if "cp" in outputs:
+                    values["cp"] = pv_store.stack_sections(values["cp"])
+                yield i, values
+                continue
+
+            files = []
+            for output in ["force", "geometry"]:
+                if output in outputs:
+                    files.append(
+                        (
+                            name + "_" + output + "_" + str(i) + ".csv",
+                            ["X", "Y", "Z"] + fields[output],
+                            np.column_stack((x, values[output])),
+                        )
+                    )
+            if "cp" in outputs:
+                for j, results in enumerate(values["cp"]):
+                    files.append((name + "_cp_" + str(i) + "_" + str(j) + ".csv", fields["cp"], results))
+            yield i, files
+
+    pv_outputs.write_time_steps(run, iter_results())
+
+    # Cleanup Paraview Objects
+    pv_slicing.delete_slice_pipeline(slice_pipeline)
+
+
+def get_output_files(name, outputs, time_index, n_span):
+    """
+    List the files written for a time step.
+
+    Parameters
+    ----------
+    name : str
+        Name pattern of the output files.
+    outputs : list
+        Requested outputs.
+    time_index : int
+        Time index.
+    n_span : int
+        Number of stations.
+
+    Returns
+    -------
+    list
+        Names of the output files.
+    """
+    output_files = []
+    if "force" in outputs:
+        output_files.append(name + "_force_" + str(time_index) + ".csv")
+    if "geometry" in outputs:
+        output_files.append(name + "_geometry_" + str(time_index) + ".csv")
+    if "cp" in outputs:
+        output_files += [name + "_cp_" + str(time_index) + "_" + str(j) + ".csv" for j in range(n_span)]
+
+    return output_files
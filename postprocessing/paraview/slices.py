@@ -1,121 +1,63 @@
 # External imports
 import os
-import csv
-import argparse
 import numpy as np
 
-# Paraview imports
-import paraview.simple as paraview
-from vtk.util import numpy_support as vtk_np
-
 # Internal Imports
 import postprocessing.utils as utils
 import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.slicing as pv_slicing
+import postprocessing.paraview.case as pv_case
+import postprocessing.paraview.mpi as pv_mpi
+import postprocessing.paraview.store as pv_store
+import postprocessing.paraview.statistics as pv_statistics
+import postprocessing.paraview.watch as pv_watch
+import postprocessing.paraview.surface as pv_surface
+import postprocessing.paraview.cutting as pv_cutting
+import postprocessing.paraview.outputs as pv_outputs
+import postprocessing.paraview.distributions as pv_distributions
 
-
-def slices_cp_cmd():
-    """
-    Wrapper around the slices_cp() function to call it from the
-    command line with arguments.
-    """
-    # Parse arguments
-    parser = slices_cp_parser()
-
-    # Call function
-    slices_cp(**vars(parser.parse_args()))
+# Command line entry points, kept importable from this module
+from postprocessing.paraview.commands import (  # noqa: F401
+    slices_cp_cmd,
+    slices_cp_parser,
+)
 
 
-def slices_cp_parser():
+def watch_slices_cp(args, daemon=None, poll_interval=5.0, settle_time=2.0, watch_timeout=None):
     """
-    Parser for options for the slices_cp() function to call it from
-    the command line with arguments.
+    Watch a case for the time directories completed by a running solver, and
+    compute the pressure coefficient slices of each one as it appears.
 
-    Returns
-    -------
-    parser
-        Parser with specified arguments.
+    Parameters
+    ----------
+    args : dict
+        Keyword arguments of slices_cp().
+    daemon : str
+        Address of a running pv_daemon to run the jobs in. Default is None,
+        which runs the jobs in this process.
+    poll_interval : float
+        Time in seconds between polls of the case. Default is 5.
+    settle_time : float
+        Time in seconds for which the files of a time directory must be
+        unchanged before it is processed. Default is 2.
+    watch_timeout : float
+        Time in seconds without any new time directory after which watching
+        stops. Default is None, which watches until interrupted.
     """
-    parser = argparse.ArgumentParser(allow_abbrev=False)
-    parser.add_argument(
-        "-i",
-        "--input_file",
-        help="Relative path to input file.",
-        type=str,
-        default="",
-    )
-    parser.add_argument(
-        "-o",
-        "--output_directory",
-        help="Relative path to output directory. Default is ./",
-        type=str,
-        default="./",
-    )
-    parser.add_argument(
-        "-n",
-        "--name",
-        help="Name pattern to write out files in the output directory. Default is slice.",
-        type=str,
-        default="slice",
-    )
-    parser.add_argument(
-        "-p",
-        "--patches",
-        help="Patches to include in the calculation. Default is group/wall.",
-        type=str,
-        nargs="+",
-        default="group/wall",
-    )
-    parser.add_argument(
-        "-s",
-        "--span_direction",
-        help="Span direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Z+.",
-        type=str,
-        nargs="+",
-        default=["Z+"],
-    )
-    parser.add_argument(
-        "-l",
-        "--lift_direction",
-        help="Lift direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is Y+.",
-        type=str,
-        nargs="+",
-        default=["Y+"],
-    )
-    parser.add_argument(
-        "-d",
-        "--drag_direction",
-        help="Drag direction. String in (X+, X-, Y+, Y-, Z+, Z-) or list of floats specifying vector. Default is X+.",
-        type=str,
-        nargs="+",
-        default=["X+"],
-    )
-    parser.add_argument(
-        "-x",
-        "--x",
-        help="Coordinates to sample. Default is [[0, 0, 0]].",
-        type=str,
-        nargs="+",
-        action="append",
-    )
-    parser.add_argument(
-        "-r0",
-        "--rho0",
-        help="Freestream density.",
-        type=float,
-    )
-    parser.add_argument(
-        "-u0",
-        "--u0",
-        help="Freestream velocity magnitude.",
-        type=float,
-    )
-    parser.add_argument(
-        "-p0",
-        "--p0",
-        help="Freestream pressure.",
-        type=float,
+    if pv_mpi.get_size() > 1:
+        raise RuntimeError("Watch mode cannot be combined with MPI execution.")
+
+    # Keep the reader open between polls
+    pv_case.enable_reader_cache()
+    pv_watch.watch_case(
+        "slices_cp",
+        args,
+        ["p"],
+        daemon,
+        poll_interval=poll_interval,
+        settle_time=settle_time,
+        watch_timeout=watch_timeout,
     )
-    return parser
 
 
 def slices_cp(
@@ -130,6 +72,16 @@ def slices_cp(
     rho0=None,
     u0=None,
     p0=None,
+    slicing="multi",
+    workers=1,
+    incremental="False",
+    output_format="csv",
+    case_type="reconstructed",
+    statistics="False",
+    transient_time=None,
+    engine="paraview",
+    time_values=None,
+    time_indices=None,
 ):
     """
     Function to compute slices using Paraview.
@@ -165,6 +117,54 @@ def slices_cp(
         Freestream velocity magnitude.
     p0 : float
         Freestream pressure.
+    slicing : str
+        Slicing mode. With "multi", all slices are cut in a single filter
+        execution and fetched in one transfer per time step. With "station", a
+        single slice is moved between locations. Default is "multi".
+    workers : int
+        Number of worker processes over which to split the time steps. Each
+        worker opens its own reader. Default is 1.
+    incremental : str
+        Flag to only process the time steps whose outputs are missing or were
+        written from different inputs, as recorded in the run manifest of the
+        output directory. Default is "False".
+    output_format : str
+        Output format. With "csv", one file is written per time step. With
+        "store", the results of all time steps are written in compressed
+        chunks of a results store directory named <name>_store, which can be
+        loaded with postprocessing.paraview.store.load_store(). Default is
+        "csv".
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to read the
+        processor directories directly, in parallel when running with MPI.
+        Default is "reconstructed".
+    statistics : str
+        Flag to only write the time statistics of every slice point to
+        <name>_statistics_<slice index>.csv instead of one file per time step
+        and slice. The mean, standard deviation, minimum, and maximum are
+        updated one time step at a time, so the memory used does not depend on
+        the number of time steps. The slices must have the same points at
+        every time step, as on a static mesh. Default is "False".
+    transient_time : float
+        Time before which time steps are skipped, for example to exclude an
+        initial transient from the statistics. Default is None, which
+        processes all time steps.
+    engine : str
+        Engine computing the sections. With "paraview", the surface is sliced
+        with Paraview at every time step. With "numpy", the faces of a surface
+        cache written by pv_cache are cut with numpy, without Paraview, which
+        requires the surface cache as the input file. The sections are then
+        only cut and sorted at the first time step, and the pressure of the
+        following time steps is interpolated at the sorted points with the
+        recorded weights, until the points change. Only the numpy engine
+        reuses the sorted sections. Default is "paraview".
+    time_values : list
+        Time values of the time steps to process, such as the time directories
+        completed since the last poll of watch mode. Default is None, which
+        processes all time steps.
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
     """
     # Check if output directory exists
     if not os.path.isdir(output_directory):
@@ -174,6 +174,16 @@ def slices_cp(
     if x is None:
         raise ValueError("No slice locations (x) provided.")
 
+    # Check output format
+    if output_format not in ["csv", "store"]:
+        raise ValueError("Output format {} not recognized, options are csv and store.".format(output_format))
+
+    # Check statistics mode
+    pv_statistics.check_statistics(statistics, output_format, incremental)
+
+    # Check engine
+    pv_distributions.check_engine(engine, input_file, workers, "time")
+
     # Check that freestream values were provided
     if rho0 is None:
         raise ValueError("No freestream density (rho0) provided.")
@@ -188,83 +198,462 @@ def slices_cp(
     drag_direction = utils.check_input_vector(drag_direction, "drag direction", check_norm=True)
 
     # Generate sample points
+    x = get_slice_locations(x)
+
+    # Import case, or only read the time values of the surface cache cut by the numpy engine
+    if engine == "numpy":
+        paraviewfoam = None
+        times = pv_surface.load_cache_metadata(os.path.join(os.getcwd(), input_file))["times"]
+    else:
+        paraviewfoam, times = pv_case.open_case(input_file, patches, cell_arrays=["p"], case_type=case_type)
+
+    # Worker processes and MPI ranks are exclusive
+    if workers > 1 and pv_mpi.get_size() > 1:
+        raise RuntimeError("Worker processes cannot be combined with MPI execution, set workers to 1.")
+
+    # Distribute time steps over worker processes
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    # Skip the initial transient
+    if transient_time is not None:
+        time_indices = [i for i in time_indices if times[i] >= transient_time]
+
+    # Only process the requested time values
+    if time_values is not None:
+        time_indices = [i for i in time_indices if np.any(np.isclose(times[i], time_values, rtol=1e-10, atol=1e-14))]
+
+    # Output settings of the run
+    run = pv_outputs.create_run(
+        output_directory,
+        name,
+        output_format,
+        incremental,
+        lambda i: [name + "_" + str(i) + "_" + str(j) + ".csv" for j in range(np.size(x, 0))],
+    )
+
+    # Create the results store
+    fields = ["X", "Y", "CP"]
+    pv_outputs.create_stores(run, fields, x, times)
+
+    # Skip time steps whose outputs are up to date
+    if incremental == "True":
+        parameters = dict(
+            patches=patches,
+            span_direction=span_direction,
+            lift_direction=lift_direction,
+            drag_direction=drag_direction,
+            x=x,
+            rho0=rho0,
+            u0=u0,
+            p0=p0,
+        )
+        time_indices = pv_outputs.select_time_steps(run, input_file, times, time_indices, ["p"], parameters)
+
+    kwargs = dict(
+        input_file=input_file,
+        patches=patches,
+        span_direction=span_direction,
+        lift_direction=lift_direction,
+        drag_direction=drag_direction,
+        x=x,
+        rho0=rho0,
+        u0=u0,
+        p0=p0,
+        slicing=slicing,
+        case_type=case_type,
+        engine=engine,
+    )
+    records = _iter_cp_records(
+        paraviewfoam,
+        times,
+        time_indices,
+        x,
+        span_direction,
+        lift_direction,
+        drag_direction,
+        rho0,
+        u0,
+        p0,
+        slicing,
+        engine,
+        input_file,
+    )
+
+    # Only write the statistics of the time steps
+    if statistics == "True":
+        running = pv_outputs.compute_statistics(
+            records,
+            get_cp_values,
+            function=iter_slices_cp,
+            kwargs=kwargs,
+            time_indices=time_indices,
+            workers=workers,
+        )
+
+        if pv_mpi.is_root():
+            write_cp_statistics(output_directory, name, running)
+        return
+
+    if workers > 1:
+        kwargs.update(output_directory=output_directory, name=name, output_format=output_format)
+        pv_outputs.run_time_workers(run, slices_cp, kwargs, time_indices, workers)
+        return
+
+    # Values of the time step for the results store, or its CSV file per slice
+    def iter_results():
+        for record in records:
+            i = record["time_index"]
+            if output_format == "store":
+                yield i, get_cp_values(record)
+            else:
+                yield i, [
+                    (
+                        name + "_" + str(i) + "_" + str(j) + ".csv",
+                        fields,
+                        np.stack((coords2D[:, 0], coords2D[:, 1], cp), axis=1),
+                    )
+                    for j, (coords2D, cp) in enumerate(zip(record["coords"], record["cp"]))
+                ]
+
+    pv_outputs.write_time_steps(run, iter_results())
+
+
+def iter_slices_cp(
+    input_file=None,
+    patches="group/wall",
+    span_direction="Z+",
+    lift_direction="Y+",
+    drag_direction="X+",
+    x=None,
+    rho0=None,
+    u0=None,
+    p0=None,
+    slicing="multi",
+    case_type="reconstructed",
+    engine="paraview",
+    time_indices=None,
+):
+    """
+    Generator computing pressure coefficient slices using Paraview, yielding
+    the results of one time step at a time instead of writing them to files.
+
+    When running with MPI, the records are only yielded on the root process,
+    and the generator must be consumed to the end on every process.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to file to load with Paraview.
+    patches : str or list
+        Patch name(s) over which to compute the slice(s). Default
+        is "group/wall".
+    span_direction : str or list
+        Vector direction for span direction either as a string (eg. X) or list
+        (eg. [0 0 1]). Should be of magnitude 1. Default is "Z+".
+    lift_direction : str or list
+        Vector direction for lift direction either as a string (eg. X+) or list
+        (eg. [0 1 0]). Should be of magnitude 1. Default is "Y+".
+    drag_direction : str or list
+        Vector direction for drag direction either as a string (eg. X+) or list
+        (eg. [1 0 0]). Should be of magnitude 1. Default is "X+".
+    x : list
+        Coordinates to sample.
+    rho0 : float
+        Freestream density.
+    u0 : float
+        Freestream velocity magnitude.
+    p0 : float
+        Freestream pressure.
+    slicing : str
+        Slicing mode, either "multi" or "station". Default is "multi".
+    case_type : str
+        Case type, either "reconstructed" or "decomposed". Default is
+        "reconstructed".
+    engine : str
+        Engine computing the sections, either "paraview" or "numpy" to cut
+        the surface cache given as input file. Default is "paraview".
+    time_indices : list
+        Indices of the time steps to process. Default is None, which processes
+        all time steps.
+
+    Yields
+    ------
+    dict
+        Record of a time step, with the "time_index", the "time" value, the
+        slice locations "x", and the sorted 2D "coords" and pressure
+        coefficient "cp" of each slice.
+    """
+    # Check that slice locations were provided
+    if x is None:
+        raise ValueError("No slice locations (x) provided.")
+
+    # Check that freestream values were provided
+    if rho0 is None:
+        raise ValueError("No freestream density (rho0) provided.")
+    if u0 is None:
+        raise ValueError("No freestream velocity (u0) provided.")
+    if p0 is None:
+        raise ValueError("No freestream pressure (p0) provided.")
+
+    # Generate direction vectors
+    span_direction = utils.check_input_vector(span_direction, "span direction", check_norm=True)
+    lift_direction = utils.check_input_vector(lift_direction, "lift direction", check_norm=True)
+    drag_direction = utils.check_input_vector(drag_direction, "drag direction", check_norm=True)
+
+    # Generate sample points
+    x = get_slice_locations(x)
+
+    # Check engine
+    pv_distributions.check_engine(engine, input_file, 1, "time")
+
+    # Import case, or only read the time values of the surface cache cut by the numpy engine
+    if engine == "numpy":
+        paraviewfoam = None
+        times = pv_surface.load_cache_metadata(os.path.join(os.getcwd(), input_file))["times"]
+    else:
+        paraviewfoam, times = pv_case.open_case(input_file, patches, cell_arrays=["p"], case_type=case_type)
+
+    if time_indices is None:
+        time_indices = range(len(times))
+
+    yield from _iter_cp_records(
+        paraviewfoam,
+        times,
+        time_indices,
+        x,
+        span_direction,
+        lift_direction,
+        drag_direction,
+        rho0,
+        u0,
+        p0,
+        slicing,
+        engine,
+        input_file,
+    )
+
+
+def _iter_cp_records(
+    paraviewfoam,
+    times,
+    time_indices,
+    x,
+    span_direction,
+    lift_direction,
+    drag_direction,
+    rho0,
+    u0,
+    p0,
+    slicing,
+    engine="paraview",
+    input_file=None,
+):
+    """
+    Yield the pressure coefficient slices of the time steps of an open case.
+
+    Parameters
+    ----------
+    paraviewfoam : Paraview source
+        Source returned by open_case().
+    times : list
+        Time values of the case.
+    time_indices : list
+        Indices of the time steps to process.
+    x : ndarray
+        Coordinates of the slices.
+    span_direction : ndarray
+        Span direction, used as the slice normal.
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+    rho0 : float
+        Freestream density.
+    u0 : float
+        Freestream velocity magnitude.
+    p0 : float
+        Freestream pressure.
+    slicing : str
+        Slicing mode, either "multi" or "station".
+    engine : str
+        Engine computing the sections, either "paraview" or "numpy" to cut
+        the surface cache given as input file. Default is "paraview".
+    input_file : str
+        Relative path to the surface cache cut by the numpy engine. Default is
+        None.
+
+    Yields
+    ------
+    dict
+        Record of a time step.
+    """
+    # Cut the surface cache with numpy, reusing the sorted sections of the
+    # first time step until the mesh moves
+    if engine == "numpy":
+        cache_directory = os.path.join(os.getcwd(), input_file)
+        metadata = pv_surface.load_cache_metadata(cache_directory)
+        if "p" not in metadata["point_arrays"]:
+            raise RuntimeError("The numpy engine needs the point values of p, which the surface cache does not hold.")
+
+        plan = None
+        checksum = None
+        for i in time_indices:
+            surface = pv_surface.load_surface(cache_directory, i)
+
+            # Cut and sort the sections again whenever the number or coordinates of
+            # the points change
+            if plan is None or pv_surface.get_points_checksum(surface["points"]) != checksum:
+                checksum = pv_surface.get_points_checksum(surface["points"])
+                index = pv_cutting.create_face_index(
+                    surface["points"], surface["connectivity"], surface["offsets"], span_direction
+                )
+                sections = pv_cutting.cut_sections(surface, x, span_direction, index)
+                plan = pv_cutting.create_cp_plan(
+                    sections, lift_direction, drag_direction, np.size(surface["points"], 0)
+                )
+
+            yield {
+                "time_index": i,
+                "time": times[i],
+                "x": x,
+                "coords": plan["coords"],
+                "cp": pv_cutting.apply_cp_plan(plan, surface["point_arrays"]["p"], rho0, u0, p0),
+            }
+        return
+
+    # Build the slicing pipeline once for all slices and time steps
+    slice_pipeline = pv_slicing.create_slice_pipeline(paraviewfoam, span_direction)
+    try:
+        for i in time_indices:
+            # Cut and fetch all slices
+            sections = pv_slicing.fetch_sections(
+                slice_pipeline, times[i], x, span_direction, point_arrays=["p"], slicing=slicing
+            )
+
+            # Sections are only gathered on the root process
+            if not pv_mpi.is_root():
+                continue
+
+            cp_sections = compute_cp_sections(sections, lift_direction, drag_direction, rho0, u0, p0)
+            yield {
+                "time_index": i,
+                "time": times[i],
+                "x": x,
+                "coords": [coords2D for coords2D, _ in cp_sections],
+                "cp": [cp for _, cp in cp_sections],
+            }
+    finally:
+        # Cleanup Paraview Objects
+        pv_slicing.delete_slice_pipeline(slice_pipeline)
+
+
+def get_cp_values(record):
+    """
+    Stack the coordinates and pressure coefficients of the slices of a
+    record, padded with NaN to the number of points of the longest slice.
+
+    Parameters
+    ----------
+    record : dict
+        Record yielded by iter_slices_cp().
+
+    Returns
+    -------
+    ndarray
+        X, Y, and CP of each point, with shape (n_slices, n_points, 3).
+    """
+    return pv_store.stack_sections(
+        [np.column_stack((coords2D, cp)) for coords2D, cp in zip(record["coords"], record["cp"])]
+    )
+
+
+def write_cp_statistics(output_directory, name, running):
+    """
+    Write the summary of the time statistics of pressure coefficient slices,
+    with one CSV file per slice and one row per point.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the outputs.
+    running : dict
+        Running statistics returned by create_statistics().
+    """
+    if running["count"] is None:
+        print("Warning: No time step to compute the statistics of, no statistics were written.")
+        return
+
+    # Drop the padding of the shorter slices
+    summary = pv_statistics.summarize_statistics(running)
+    fields = pv_statistics.get_statistics_fields(["X", "Y", "CP"])
+    for j in range(np.size(summary, 0)):
+        utils.write_csv(
+            output_directory + name + "_statistics_" + str(j) + ".csv",
+            fields,
+            summary[j, running["count"][j, :, 2] > 0],
+        )
+    print("Wrote the statistics of {} time steps.".format(np.max(running["count"])))
+
+
+def get_slice_locations(x):
+    """
+    Convert slice locations to an array.
+
+    Parameters
+    ----------
+    x : list
+        Coordinates of each slice.
+
+    Returns
+    -------
+    ndarray
+        Coordinates of the slices, with shape (n_slices, 3).
+    """
     x_slice = np.zeros((len(x), 3))
     for i in range(len(x)):
         if len(x[i]) != 3:
             raise ValueError(
-                "All entries in x should be list of length 3, not {} with length {}.".format(x[i, :], len(x[i, :]))
+                "All entries in x should be list of length 3, not {} with length {}.".format(x[i], len(x[i]))
             )
 
         x_slice[i, :] = [x[i][0], x[i][1], x[i][2]]
-    x = x_slice
 
-    # Import case
-    if input_file is None:
-        raise ValueError("Input file not set.")
-    paraviewfoam = paraview.OpenFOAMReader(
-        registrationName="paraview.foam", FileName=str(os.getcwd()) + "/{}".format(input_file)
-    )
-    paraviewfoam.MeshRegions = patches
-    paraviewfoam.CellArrays = ["p"]
-
-    # Read time data
-    animationScene1 = paraview.GetAnimationScene()
-    animationScene1.UpdateAnimationUsingDataTimeSteps()
-
-    reader = paraview.GetActiveSource()
-    times = reader.TimestepValues
-
-    for i in range(len(times)):
-        paraview.UpdatePipeline(time=times[i], proxy=paraviewfoam)
-
-        # Iterate over span
-        for j in range(np.size(x_slice, 0)):
-            # Create a slice
-            slice1 = paraview.Slice(registrationName="Slice1", Input=paraviewfoam)
-
-            # Set slice location and normal
-            slice1.SliceType.Origin = [x[j, 0], x[j, 1], x[j, 2]]
-            slice1.SliceType.Normal = [span_direction[0], span_direction[1], span_direction[2]]
-
-            # Plot on Sorted Line
-            plotOnSortedLines1 = paraview.PlotOnSortedLines(registrationName="PlotOnSortedLines1", Input=slice1)
-
-            # Extract Data
-            data = paraview.servermanager.Fetch(plotOnSortedLines1).GetBlock(0)
-            coords = np.zeros((0, 3))
-            arclen = np.zeros(0)
-            pressure = np.zeros(0)
-            for k in range(data.GetNumberOfBlocks()):
-                if data.GetBlock(k).GetNumberOfBlocks() > 0:
-                    seg_coords = vtk_np.vtk_to_numpy(data.GetBlock(k).GetBlock(0).GetPoints().GetData())
-                    seg_arclen = vtk_np.vtk_to_numpy(data.GetBlock(k).GetBlock(0).GetPointData().GetArray("arc_length"))
-                    seg_pressure = vtk_np.vtk_to_numpy(data.GetBlock(k).GetBlock(0).GetPointData().GetArray("p"))
-                    coords = np.concatenate((coords, seg_coords), axis=0)
-                    arclen = np.concatenate((arclen, seg_arclen), axis=0)
-                    pressure = np.concatenate((pressure, seg_pressure), axis=0)
-
-            # Cleanup Paraview Objects
-            paraview.Delete(plotOnSortedLines1)
-            paraview.Delete(slice1)
-
-            # Rotate points to X-Y plane
-            R = np.array([drag_direction, lift_direction, np.cross(drag_direction, lift_direction)])
-            coords2D = (R @ coords.T).T[:, :2]
-
-            # Sort
-            coords2D, arclen, indices = pv_utils.sort_airfoil(coords2D, arclen)
-            pressure = pressure[indices]
-
-            # Compute pressure coefficient
-            cp = (pressure - p0) / (0.5 * rho0 * u0 * u0)
-
-            # Write CSV file
-            fields = ["X", "Y", "CP"]
-            results = np.stack((coords2D[:, 0], coords2D[:, 1], cp), axis=1)
-            with open(output_directory + name + "_" + str(i) + "_" + str(j) + ".csv", "w") as csvfile:
-                # creating a csv writer object
-                csvwriter = csv.writer(csvfile)
-                # writing the fields
-                csvwriter.writerow(fields)
-                # writing the data rows
-                csvwriter.writerows(results)
+    return x_slice
+
+
+def compute_cp_sections(sections, lift_direction, drag_direction, rho0, u0, p0):
+    """
+    Compute the pressure coefficient distribution of every fetched section.
+
+    Parameters
+    ----------
+    sections : list
+        Sections returned by fetch_sections(), with the "p" point array.
+    lift_direction : ndarray
+        Lift direction.
+    drag_direction : ndarray
+        Drag direction.
+    rho0 : float
+        Freestream density.
+    u0 : float
+        Freestream velocity magnitude.
+    p0 : float
+        Freestream pressure.
+
+    Returns
+    -------
+    list
+        Sorted 2D coordinates and pressure coefficient of each section.
+    """
+    results = []
+    for section in sections:
+        coords2D, arrays = pv_utils.sort_section(section, lift_direction, drag_direction, {"p": section["p"]})
+
+        # Compute pressure coefficient
+        cp = (arrays["p"] - p0) / (0.5 * rho0 * u0 * u0)
+        results.append((coords2D, cp))
+
+    return results
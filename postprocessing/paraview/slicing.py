@@ -0,0 +1,308 @@
+# External imports
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+from vtk.util import numpy_support as vtk_np
+
+# Internal Imports
+import postprocessing.paraview.utils as pv_utils
+
+
+def create_slice_pipeline(source, normal):
+    """
+    Create the Slice and MergeBlocks filters used to cut a surface at a set of
+    stations. The filters are created once and reused for every time step and
+    station.
+
+    Parameters
+    ----------
+    source : Paraview source
+        Surface source to slice.
+    normal : ndarray
+        Unit normal of the slice planes.
+
+    Returns
+    -------
+    list
+        Paraview filters in pipeline order, from the slice to the merge
+        blocks filter.
+    """
+    # Create a slice
+    slice1 = paraview.Slice(registrationName="Slice1", Input=source)
+    slice1.SliceType.Normal = [normal[0], normal[1], normal[2]]
+
+    # Merge blocks so that every section arrives in a single dataset
+    mergeBlocks1 = paraview.MergeBlocks(registrationName="MergeBlocks1", Input=slice1)
+
+    return [slice1, mergeBlocks1]
+
+
+def create_slab_pipeline(source, normal, s_min, s_max):
+    """
+    Create the Clip filters that keep the part of a surface between two planes
+    normal to the span direction.
+
+    Parameters
+    ----------
+    source : Paraview source
+        Surface source to clip.
+    normal : ndarray
+        Unit normal of the slab planes.
+    s_min : float
+        Lower bound of the slab, as a coordinate along the normal.
+    s_max : float
+        Upper bound of the slab, as a coordinate along the normal.
+
+    Returns
+    -------
+    list
+        Paraview filters in pipeline order.
+    """
+    # Keep the side above the lower plane
+    clip1 = paraview.Clip(registrationName="ClipLower", Input=source)
+    clip1.ClipType = "Plane"
+    clip1.ClipType.Origin = [s_min * normal[0], s_min * normal[1], s_min * normal[2]]
+    clip1.ClipType.Normal = [normal[0], normal[1], normal[2]]
+    clip1.Invert = 0
+
+    # Keep the side below the upper plane
+    clip2 = paraview.Clip(registrationName="ClipUpper", Input=clip1)
+    clip2.ClipType = "Plane"
+    clip2.ClipType.Origin = [s_max * normal[0], s_max * normal[1], s_max * normal[2]]
+    clip2.ClipType.Normal = [normal[0], normal[1], normal[2]]
+    clip2.Invert = 1
+
+    return [clip1, clip2]
+
+
+# Script run by the Programmable Filter to reduce the sections on the server
+_REDUCTION_SCRIPT = """
+import numpy as np
+from vtkmodules.util import numpy_support
+import postprocessing.paraview.utils as pv_utils
+import {module} as reduction_module
+
+points, lines, arrays = pv_utils.get_lines(self.GetInput(), {point_arrays!r})
+
+# Sections are gathered on the first process, the others produce an empty table
+if np.size(lines, 0) > 0:
+    # Merge the points duplicated at the boundaries between server ranks
+    kept, lines = pv_utils.merge_points(points, lines)
+    points = points[kept, :]
+    arrays = {{name: values[kept] for name, values in arrays.items()}}
+
+    values = reduction_module.{function}(points, lines, arrays, **{kwargs!r})
+    output = self.GetOutput()
+    for k, column in enumerate({columns!r}):
+        array = numpy_support.numpy_to_vtk(np.ascontiguousarray(values[:, k]), deep=1)
+        array.SetName(column)
+        output.AddColumn(array)
+"""
+
+
+def create_reduction_pipeline(slice_pipeline, x, normal, function, columns, point_arrays=None, **kwargs):
+    """
+    Create the filters that reduce the sections of a multi-plane cut on the
+    server, so that only the per-station results are fetched. The sections
+    are gathered on the first server process, where a Programmable Filter
+    calls the reduction function and outputs a table with one row per
+    station.
+
+    Parameters
+    ----------
+    slice_pipeline : list
+        Paraview filters created by create_slice_pipeline().
+    x : ndarray
+        Coordinates of the stations, with shape (n_stations, 3).
+    normal : ndarray
+        Unit normal of the slice planes.
+    function : function
+        Reduction function from a module importable on the server, called as
+        function(points, lines, arrays, origin, normal, offsets, **kwargs) and
+        returning an array with shape (n_stations, n_columns).
+    columns : list
+        Names of the columns returned by the reduction function.
+    point_arrays : list
+        Names of the point arrays passed to the reduction function. Default is
+        None, which passes no point array.
+    **kwargs
+        Additional arguments passed to the reduction function.
+
+    Returns
+    -------
+    list
+        Paraview filters in pipeline order.
+    """
+    if point_arrays is None:
+        point_arrays = []
+    kwargs = {key: np.asarray(value).tolist() for key, value in kwargs.items()}
+    kwargs.update(
+        origin=x[0, :].tolist(), normal=np.asarray(normal).tolist(), offsets=((x - x[0, :]) @ normal).tolist()
+    )
+
+    # Gather the sections of all server processes
+    reductionFilter1 = paraview.ReductionFilter(registrationName="ReductionFilter1", Input=slice_pipeline[-1])
+    reductionFilter1.PostGatherHelperName = "vtkAppendFilter"
+
+    # Reduce the sections to a table of per-station values
+    programmableFilter1 = paraview.ProgrammableFilter(registrationName="ProgrammableFilter1", Input=reductionFilter1)
+    programmableFilter1.OutputDataSetType = "vtkTable"
+    programmableFilter1.Script = _REDUCTION_SCRIPT.format(
+        module=function.__module__,
+        function=function.__name__,
+        point_arrays=list(point_arrays),
+        columns=list(columns),
+        kwargs=kwargs,
+    )
+
+    return [reductionFilter1, programmableFilter1]
+
+
+def fetch_reduced(slice_pipeline, reduction_pipeline, time, x, normal):
+    """
+    Cut the surface at every station in a single filter execution, reduce the
+    sections on the server, and fetch the per-station results.
+
+    Parameters
+    ----------
+    slice_pipeline : list
+        Paraview filters created by create_slice_pipeline().
+    reduction_pipeline : list
+        Paraview filters created by create_reduction_pipeline().
+    time : float
+        Time value at which to evaluate the pipeline.
+    x : ndarray
+        Coordinates of the stations, with shape (n_stations, 3).
+    normal : ndarray
+        Unit normal of the slice planes.
+
+    Returns
+    -------
+    ndarray
+        Reduced values, with shape (n_stations, n_columns) on the root process
+        and (n_stations, 0) on the other MPI ranks.
+    """
+    # Cut all stations at once using offsets from the first station
+    slice1 = slice_pipeline[0]
+    slice1.SliceType.Origin = [x[0, 0], x[0, 1], x[0, 2]]
+    slice1.SliceOffsetValues = ((x - x[0, :]) @ normal).tolist()
+
+    paraview.UpdatePipeline(time=time, proxy=reduction_pipeline[-1])
+    table = paraview.servermanager.Fetch(reduction_pipeline[-1])
+
+    if table is None or table.GetNumberOfRows() == 0:
+        return np.zeros((np.size(x, 0), 0))
+
+    return np.column_stack(
+        [vtk_np.vtk_to_numpy(table.GetColumn(k)).astype(float) for k in range(table.GetNumberOfColumns())]
+    )
+
+
+def delete_slice_pipeline(slice_pipeline):
+    """
+    Delete the filters of a slice, slab, or reduction pipeline, starting from
+    the end of the pipeline.
+
+    Parameters
+    ----------
+    slice_pipeline : list
+        Paraview filters created by create_slice_pipeline(),
+        create_slab_pipeline(), or create_reduction_pipeline().
+    """
+    for proxy in reversed(slice_pipeline):
+        paraview.Delete(proxy)
+
+
+def fetch_sections(slice_pipeline, time, x, normal, point_arrays=None, slicing="multi"):
+    """
+    Cut the surface at every station and fetch the resulting sections.
+
+    With the "multi" slicing mode, all stations are cut in a single filter
+    execution using one offset value per station along the normal, and all the
+    sections are fetched in one transfer. With the "station" slicing mode, the
+    slice origin is moved to each station in turn and each section is fetched
+    separately.
+
+    Parameters
+    ----------
+    slice_pipeline : list
+        Paraview filters created by create_slice_pipeline().
+    time : float
+        Time value at which to evaluate the pipeline.
+    x : ndarray
+        Coordinates of the stations, with shape (n_stations, 3).
+    normal : ndarray
+        Unit normal of the slice planes.
+    point_arrays : list
+        Names of the point arrays to fetch with the sections. Default is None,
+        which fetches no point array.
+    slicing : str
+        Slicing mode, either "multi" or "station". Default is "multi".
+
+    Returns
+    -------
+    list
+        One dictionary per station holding the section "points", the section
+        "lines" as point index pairs, and the requested point arrays.
+    """
+    if point_arrays is None:
+        point_arrays = []
+    slice1 = slice_pipeline[0]
+
+    if slicing == "multi":
+        # Cut all stations at once using offsets from the first station
+        offsets = (x - x[0, :]) @ normal
+        slice1.SliceType.Origin = [x[0, 0], x[0, 1], x[0, 2]]
+        slice1.SliceOffsetValues = offsets.tolist()
+
+        points, lines, arrays = _fetch_lines(slice_pipeline, time, point_arrays)
+        groups = pv_utils.split_sections(points, lines, x[0, :], normal, offsets)
+        sections = [_compact_section(points, lines[group], arrays) for group in groups]
+
+    elif slicing == "station":
+        # Move a single slice plane between stations
+        slice1.SliceOffsetValues = [0.0]
+        sections = []
+        for j in range(np.size(x, 0)):
+            slice1.SliceType.Origin = [x[j, 0], x[j, 1], x[j, 2]]
+            points, lines, arrays = _fetch_lines(slice_pipeline, time, point_arrays)
+            sections.append(_compact_section(points, lines, arrays))
+
+    else:
+        raise ValueError("Slicing mode {} not recognized, options are multi and station.".format(slicing))
+
+    return sections
+
+
+def _fetch_lines(slice_pipeline, time, point_arrays):
+    """
+    Update the slice pipeline and fetch its points, line cells and point
+    arrays as numpy arrays. When running with MPI, the sections of all ranks
+    are gathered on the root process and the other processes receive empty
+    data. Coincident points are merged.
+    """
+    paraview.UpdatePipeline(time=time, proxy=slice_pipeline[-1])
+    data = paraview.servermanager.Fetch(slice_pipeline[-1])
+    points, lines, arrays = pv_utils.get_lines(data, point_arrays)
+
+    # Merge the points duplicated at the boundaries between MPI ranks or
+    # between the processor subdomains of a decomposed case
+    kept, lines = pv_utils.merge_points(points, lines)
+    points = points[kept, :]
+    arrays = {name: values[kept] for name, values in arrays.items()}
+
+    return points, lines, arrays
+
+
+def _compact_section(points, lines, arrays):
+    """
+    Extract the points and point arrays used by a subset of lines, renumbering
+    the lines to index into the extracted points.
+    """
+    used, inverse = np.unique(lines, return_inverse=True)
+    section = {"points": points[used, :], "lines": inverse.reshape(-1, 2)}
+    for name, values in arrays.items():
+        section[name] = values[used]
+
+    return section
@@ -0,0 +1,166 @@
+# External imports
+import numpy as np
+
+
+def check_spectra(spectra, output_format="csv", incremental="False", spacing="uniform", workers=1, partition="time"):
+    """
+    Check that the spectra mode of a utility is compatible with its other
+    options. The spectra need consecutive time steps, at the same stations.
+
+    Parameters
+    ----------
+    spectra : str
+        Flag to write the power spectral densities, either "True" or "False".
+    output_format : str
+        Output format, either "csv" or "store". Default is "csv".
+    incremental : str
+        Flag to skip the time steps that are up to date. Default is "False".
+    spacing : str
+        Station spacing, either "uniform" or "adaptive". Default is
+        "uniform".
+    workers : int
+        Number of worker processes. Default is 1.
+    partition : str
+        Partition mode of the worker processes, either "time" or "span".
+        Default is "time".
+    """
+    if spectra not in ["True", "False"]:
+        raise ValueError("Spectra flag {} not recognized, options are True and False.".format(spectra))
+    if spectra == "False":
+        return
+
+    if output_format == "store":
+        raise ValueError("Spectra cannot be combined with the store output format.")
+    if incremental == "True":
+        raise ValueError("Spectra cannot be combined with incremental runs, which skip time steps.")
+    if spacing == "adaptive":
+        raise ValueError("Spectra cannot be combined with adaptive spacing, which changes the stations.")
+    if workers > 1 and partition == "time":
+        raise ValueError("Spectra need consecutive time steps and cannot be combined with the time partition.")
+
+
+def create_spectrum(segment_length=256, overlap=0.5):
+    """
+    Create an empty Welch power spectral density estimate. The time steps are
+    split into overlapping segments, and the periodograms of the segments are
+    averaged. Only the time steps of the current segment are held in memory.
+
+    Parameters
+    ----------
+    segment_length : int
+        Number of time steps per segment. Default is 256.
+    overlap : float
+        Fraction of each segment shared with the next one. Default is 0.5.
+
+    Returns
+    -------
+    dict
+        Spectrum estimate, to pass to update_spectrum() and
+        summarize_spectrum().
+    """
+    if segment_length < 2:
+        raise ValueError("Segment length should be at least 2, not {}.".format(segment_length))
+    if overlap < 0.0 or overlap >= 1.0:
+        raise ValueError("Overlap should be between 0 and 1, not {}.".format(overlap))
+
+    return {
+        "segment_length": segment_length,
+        "step": max(1, int(round(segment_length * (1.0 - overlap)))),
+        "window": 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(segment_length) / segment_length),
+        "buffer": None,
+        "n_values": 0,
+        "time": None,
+        "dt": None,
+        "psd": None,
+        "n_segments": 0,
+    }
+
+
+def update_spectrum(spectrum, time, values):
+    """
+    Add the values of a time step to a spectrum estimate. The values are kept
+    in a circular buffer of one segment, and the periodogram of the segment is
+    added to the estimate every time a segment is complete.
+
+    Parameters
+    ----------
+    spectrum : dict
+        Spectrum estimate returned by create_spectrum(). Updated in place.
+    time : float
+        Time value of the time step. Time steps must be added in order, with
+        a uniform time step.
+    values : ndarray
+        Values of the time step, with the same shape at every time step.
+    """
+    values = np.asarray(values, dtype=float)
+    n = spectrum["segment_length"]
+
+    # Allocate the buffer on the first time step
+    if spectrum["buffer"] is None:
+        spectrum["buffer"] = np.zeros((n,) + np.shape(values))
+    elif np.shape(values) != np.shape(spectrum["buffer"])[1:]:
+        raise RuntimeError(
+            "Spectra require the same stations at every time step, got shape {} instead of {}.".format(
+                np.shape(values), np.shape(spectrum["buffer"])[1:]
+            )
+        )
+
+    # Check that the time steps are uniformly spaced
+    if spectrum["time"] is not None:
+        dt = time - spectrum["time"]
+        if spectrum["dt"] is None:
+            spectrum["dt"] = dt
+        elif not np.isclose(dt, spectrum["dt"], rtol=1e-3, atol=0.0):
+            raise RuntimeError(
+                "Spectra require uniformly spaced time steps, got a time step of {} instead of {} at time {}.".format(
+                    dt, spectrum["dt"], time
+                )
+            )
+    spectrum["time"] = time
+
+    spectrum["buffer"][spectrum["n_values"] % n] = values
+    spectrum["n_values"] += 1
+
+    # Add the periodogram of every complete segment, from the oldest time step
+    if spectrum["n_values"] >= n and (spectrum["n_values"] - n) % spectrum["step"] == 0:
+        segment = np.roll(spectrum["buffer"], -(spectrum["n_values"] % n), axis=0)
+        segment -= np.mean(segment, axis=0)
+        window = np.reshape(spectrum["window"], (n,) + (1,) * np.ndim(values))
+        periodogram = np.abs(np.fft.rfft(segment * window, axis=0)) ** 2
+        spectrum["psd"] = periodogram if spectrum["psd"] is None else spectrum["psd"] + periodogram
+        spectrum["n_segments"] += 1
+
+
+def summarize_spectrum(spectrum):
+    """
+    Compute the one-sided power spectral density of a spectrum estimate,
+    averaged over its complete segments.
+
+    Parameters
+    ----------
+    spectrum : dict
+        Spectrum estimate returned by create_spectrum().
+
+    Returns
+    -------
+    ndarray
+        Frequencies.
+    ndarray
+        Power spectral densities, with shape (n_frequencies,) followed by the
+        shape of the values.
+    """
+    if spectrum["n_segments"] == 0:
+        raise RuntimeError(
+            "At least {} time steps are needed to compute a spectrum, got {}.".format(
+                spectrum["segment_length"], spectrum["n_values"]
+            )
+        )
+
+    # Density scaling of the Hann window, with the negative frequencies folded in
+    n = spectrum["segment_length"]
+    psd = spectrum["psd"] * spectrum["dt"] / (spectrum["n_segments"] * np.sum(spectrum["window"] ** 2))
+    psd[1:] *= 2.0
+    if n % 2 == 0:
+        psd[-1] /= 2.0
+
+    return np.fft.rfftfreq(n, spectrum["dt"]), psd
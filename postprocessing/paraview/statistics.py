@@ -0,0 +1,182 @@
+# External imports
+import numpy as np
+
+
+def check_statistics(statistics, output_format="csv", incremental="False", spacing="uniform"):
+    """
+    Check that the statistics mode of a utility is compatible with its other
+    options. The statistics need every time step, at the same stations.
+
+    Parameters
+    ----------
+    statistics : str
+        Flag to only write the time statistics, either "True" or "False".
+    output_format : str
+        Output format, either "csv" or "store". Default is "csv".
+    incremental : str
+        Flag to skip the time steps that are up to date. Default is "False".
+    spacing : str
+        Station spacing, either "uniform" or "adaptive". Default is
+        "uniform".
+    """
+    if statistics not in ["True", "False"]:
+        raise ValueError("Statistics flag {} not recognized, options are True and False.".format(statistics))
+    if statistics == "False":
+        return
+
+    if output_format == "store":
+        raise ValueError("Statistics cannot be combined with the store output format.")
+    if incremental == "True":
+        raise ValueError("Statistics cannot be combined with incremental runs, which skip time steps.")
+    if spacing == "adaptive":
+        raise ValueError("Statistics cannot be combined with adaptive spacing, which changes the stations.")
+
+
+def create_statistics():
+    """
+    Create empty running statistics. The arrays are allocated by the first
+    update, with the shape of its values.
+
+    Returns
+    -------
+    dict
+        Running statistics, with the number of values "count", the "mean",
+        the sum of squared deviations from the mean "m2", and the "min" and
+        "max" of every element.
+    """
+    return {"count": None, "mean": None, "m2": None, "min": None, "max": None}
+
+
+def update_statistics(statistics, values):
+    """
+    Add the values of a time step to running statistics, using Welford's
+    online update, which stays accurate when the fluctuations are small
+    compared to the mean. NaN values are skipped element by element.
+
+    Parameters
+    ----------
+    statistics : dict
+        Running statistics returned by create_statistics(). Updated in place.
+    values : ndarray
+        Values of the time step, with the same shape at every time step.
+    """
+    values = np.asarray(values, dtype=float)
+
+    # Allocate the statistics on the first time step
+    if statistics["count"] is None:
+        statistics["count"] = np.zeros(np.shape(values), dtype=np.int64)
+        statistics["mean"] = np.zeros(np.shape(values))
+        statistics["m2"] = np.zeros(np.shape(values))
+        statistics["min"] = np.full(np.shape(values), np.inf)
+        statistics["max"] = np.full(np.shape(values), -np.inf)
+    elif np.shape(values) != np.shape(statistics["mean"]):
+        raise RuntimeError(
+            "Statistics require the same stations and points at every time step, got shape {} instead of {}.".format(
+                np.shape(values), np.shape(statistics["mean"])
+            )
+        )
+
+    valid = ~np.isnan(values)
+    statistics["count"] += valid
+    delta = np.where(valid, values - statistics["mean"], 0.0)
+    statistics["mean"] += np.where(valid, delta / np.maximum(statistics["count"], 1), 0.0)
+    statistics["m2"] += np.where(valid, delta * (values - statistics["mean"]), 0.0)
+    statistics["min"] = np.fmin(statistics["min"], values)
+    statistics["max"] = np.fmax(statistics["max"], values)
+
+
+def merge_statistics(statistics, other):
+    """
+    Merge the running statistics of two sets of time steps, such as those
+    computed by different worker processes, with the pairwise update of Chan
+    et al.
+
+    Parameters
+    ----------
+    statistics : dict
+        Running statistics returned by create_statistics().
+    other : dict
+        Running statistics of other time steps.
+
+    Returns
+    -------
+    dict
+        Running statistics of both sets of time steps.
+    """
+    if other["count"] is None:
+        return statistics
+    if statistics["count"] is None:
+        return other
+    if np.shape(other["mean"]) != np.shape(statistics["mean"]):
+        raise RuntimeError(
+            "Statistics require the same stations and points at every time step, got shape {} instead of {}.".format(
+                np.shape(other["mean"]), np.shape(statistics["mean"])
+            )
+        )
+
+    count = statistics["count"] + other["count"]
+    weight = np.divide(other["count"], count, out=np.zeros(np.shape(count)), where=count > 0)
+    delta = other["mean"] - statistics["mean"]
+
+    return {
+        "count": count,
+        "mean": statistics["mean"] + delta * weight,
+        "m2": statistics["m2"] + other["m2"] + delta**2 * statistics["count"] * weight,
+        "min": np.fmin(statistics["min"], other["min"]),
+        "max": np.fmax(statistics["max"], other["max"]),
+    }
+
+
+def get_statistics_fields(fields):
+    """
+    Get the names of the summary columns of quantities.
+
+    Parameters
+    ----------
+    fields : list
+        Names of the quantities.
+
+    Returns
+    -------
+    list
+        Names of the mean, standard deviation, minimum, and maximum of each
+        quantity.
+    """
+    return [field + "_" + statistic for field in fields for statistic in ["mean", "std", "min", "max"]]
+
+
+def summarize_statistics(statistics):
+    """
+    Compute the summary of running statistics. The standard deviation is the
+    root mean square of the fluctuations about the mean. Elements without any
+    value are NaN.
+
+    Parameters
+    ----------
+    statistics : dict
+        Running statistics returned by create_statistics().
+
+    Returns
+    -------
+    ndarray
+        Mean, standard deviation, minimum, and maximum of each quantity,
+        interleaved along the last axis in the order of
+        get_statistics_fields().
+    """
+    if statistics["count"] is None:
+        raise RuntimeError("No time step was added to the statistics.")
+
+    empty = statistics["count"] == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        summary = np.stack(
+            (
+                statistics["mean"],
+                np.sqrt(statistics["m2"] / statistics["count"]),
+                statistics["min"],
+                statistics["max"],
+            ),
+            axis=-1,
+        )
+    summary[empty, :] = np.nan
+
+    return np.reshape(summary, np.shape(summary)[:-2] + (-1,))
@@ -0,0 +1,255 @@
+# External imports
+import os
+import json
+import time
+import numpy as np
+
+# Internal Imports
+import postprocessing
+
+
+# Name of the metadata file marking a results store directory
+STORE_METADATA_FILE = "store.json"
+
+# Number of time steps written together in a chunk
+CHUNK_SIZE = 64
+
+
+def get_store_directory(output_directory, name):
+    """
+    Get the path of the results store of an output name.
+
+    Parameters
+    ----------
+    output_directory : str
+        Path to the output directory.
+    name : str
+        Name pattern of the outputs.
+
+    Returns
+    -------
+    str
+        Path to the results store directory.
+    """
+    return os.path.join(output_directory, name + "_store")
+
+
+def create_store(store_directory, fields, stations, times):
+    """
+    Create a results store directory, or update the metadata of an existing
+    one. The metadata is replaced atomically, so worker processes can create
+    the same store concurrently.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+    fields : list
+        Names of the quantities stored for each station.
+    stations : ndarray
+        Coordinates of the stations.
+    times : list
+        Time values of the case.
+    """
+    os.makedirs(store_directory, exist_ok=True)
+
+    metadata = {
+        "version": postprocessing.__version__,
+        "fields": list(fields),
+        "stations": np.asarray(stations).tolist(),
+        "times": np.asarray(times).tolist(),
+    }
+    metadata_file = os.path.join(store_directory, STORE_METADATA_FILE)
+    with open(metadata_file + "." + str(os.getpid()), "w") as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(metadata_file + "." + str(os.getpid()), metadata_file)
+
+
+def load_store_metadata(store_directory):
+    """
+    Load the metadata of a results store.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+
+    Returns
+    -------
+    dict
+        Store metadata, holding the "fields", "stations", and "times" entries.
+    """
+    metadata_file = os.path.join(store_directory, STORE_METADATA_FILE)
+    if not os.path.isfile(metadata_file):
+        raise RuntimeError("{} is not a results store directory.".format(store_directory))
+
+    with open(metadata_file, "r") as f:
+        return json.load(f)
+
+
+def get_chunk_files(store_directory):
+    """
+    List the chunks of a results store, from the oldest to the newest.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+
+    Returns
+    -------
+    list
+        Names of the chunk files, relative to the store directory.
+    """
+    return sorted(
+        entry for entry in os.listdir(store_directory) if entry.startswith("chunk_") and entry.endswith(".npz")
+    )
+
+
+def write_chunk(store_directory, entries):
+    """
+    Write the results of several time steps to a new compressed chunk of a
+    results store. Chunks are never modified, and a time step written again
+    is read from the newest chunk holding it.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+    entries : list
+        Time index, values, and input signature of each time step. The values
+        of all time steps have the same number of dimensions.
+    """
+    if len(entries) == 0:
+        return
+
+    # Pad the values to a common shape
+    shape = np.max([np.shape(values) for _, values, _ in entries], axis=0)
+    values = np.full((len(entries),) + tuple(shape), np.nan)
+    for k, (_, entry_values, _) in enumerate(entries):
+        values[(k,) + tuple(slice(0, n) for n in np.shape(entry_values))] = entry_values
+
+    # Name the chunk by creation time, and only expose it once it is complete
+    chunk_file = os.path.join(store_directory, "chunk_{:020d}_{}.npz".format(time.time_ns(), os.getpid()))
+    with open(chunk_file + ".tmp", "wb") as f:
+        np.savez_compressed(
+            f,
+            time_indices=np.array([i for i, _, _ in entries], dtype=np.int64),
+            values=values,
+            signatures=np.array([signature for _, _, signature in entries]),
+        )
+    os.replace(chunk_file + ".tmp", chunk_file)
+
+
+def buffer_chunk(store_directory, buffer, time_index, values, signature=""):
+    """
+    Add the results of a time step to a chunk buffer, and write the chunk to
+    the results store once it holds CHUNK_SIZE time steps.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+    buffer : list
+        Time steps not written yet. Updated in place.
+    time_index : int
+        Time index.
+    values : ndarray
+        Values of the time step.
+    signature : str
+        Hash of the inputs of the time step. Default is "", which never
+        matches an input signature.
+    """
+    buffer.append((time_index, values, signature))
+    if len(buffer) >= CHUNK_SIZE:
+        write_chunk(store_directory, buffer)
+        buffer.clear()
+
+
+def stack_sections(sections):
+    """
+    Stack the values of sections with different numbers of points into a
+    single array, padded with NaN.
+
+    Parameters
+    ----------
+    sections : list
+        Values of each section, with one row per point and one column per
+        quantity.
+
+    Returns
+    -------
+    ndarray
+        Values of shape section x point x quantity.
+    """
+    n_points = max([np.size(section, 0) for section in sections] + [0])
+    n_fields = max([np.size(section, 1) for section in sections] + [0])
+    values = np.full((len(sections), n_points, n_fields), np.nan)
+    for j, section in enumerate(sections):
+        values[j, : np.size(section, 0), :] = section
+
+    return values
+
+
+def load_signatures(store_directory):
+    """
+    Load the input signatures of the time steps of a results store.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+
+    Returns
+    -------
+    dict
+        Input signatures, keyed by time index. Empty if the store does not
+        exist.
+    """
+    if not os.path.isdir(store_directory):
+        return {}
+
+    signatures = {}
+    for chunk_file in get_chunk_files(store_directory):
+        with np.load(os.path.join(store_directory, chunk_file)) as chunk:
+            signatures.update(zip(chunk["time_indices"].tolist(), chunk["signatures"].tolist()))
+
+    return signatures
+
+
+def load_store(store_directory):
+    """
+    Load the results of a results store as a single array, with one row per
+    time step of the case. Time steps that were not computed, and the padding
+    of sections with fewer points, are filled with NaN.
+
+    Parameters
+    ----------
+    store_directory : str
+        Path to the results store directory.
+
+    Returns
+    -------
+    dict
+        Store metadata with the "values" array, of shape time x station x
+        quantity, or time x station x point x quantity for sections.
+    """
+    results = load_store_metadata(store_directory)
+
+    chunks = []
+    for chunk_file in get_chunk_files(store_directory):
+        with np.load(os.path.join(store_directory, chunk_file)) as chunk:
+            chunks.append((chunk["time_indices"], chunk["values"]))
+
+    if len(chunks) == 0:
+        results["values"] = np.full((len(results["times"]), len(results["stations"]), len(results["fields"])), np.nan)
+        return results
+
+    # Newer chunks overwrite the time steps of older ones
+    shape = np.max([np.shape(values)[1:] for _, values in chunks], axis=0)
+    results["values"] = np.full((len(results["times"]),) + tuple(shape), np.nan)
+    for time_indices, values in chunks:
+        results["values"][time_indices] = np.nan
+        results["values"][(time_indices,) + tuple(slice(0, n) for n in np.shape(values)[1:])] = values
+
+    return results
@@ -0,0 +1,292 @@
+# External imports
+import os
+import json
+import hashlib
+import numpy as np
+
+# Internal Imports
+import postprocessing.paraview.utils as pv_utils
+
+
+# Name of the metadata file marking a surface cache directory
+CACHE_METADATA_FILE = "cache.json"
+
+
+def is_surface_cache(path):
+    """
+    Check if a path is a surface cache directory written by pv_cache.
+
+    Parameters
+    ----------
+    path : str
+        Path to check.
+
+    Returns
+    -------
+    bool
+        True if the path is a surface cache directory.
+    """
+    return os.path.isfile(os.path.join(path, CACHE_METADATA_FILE))
+
+
+def load_cache_metadata(cache_directory):
+    """
+    Load the metadata of a surface cache.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Path to the surface cache directory.
+
+    Returns
+    -------
+    dict
+        Cache metadata, holding the "times", "patches", "cell_arrays",
+        "point_arrays", and "moving_mesh" entries.
+    """
+    if not is_surface_cache(cache_directory):
+        raise RuntimeError("{} is not a surface cache directory.".format(cache_directory))
+
+    with open(os.path.join(cache_directory, CACHE_METADATA_FILE), "r") as f:
+        return json.load(f)
+
+
+def save_cache_metadata(cache_directory, metadata):
+    """
+    Save the metadata of a surface cache. The metadata is written last, so an
+    interrupted cache is never mistaken for a complete one.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Path to the surface cache directory.
+    metadata : dict
+        Cache metadata.
+    """
+    with open(os.path.join(cache_directory, CACHE_METADATA_FILE), "w") as f:
+        json.dump(metadata, f, indent=2)
+
+
+def get_array_file(name, time_index=None):
+    """
+    Get the file name of a cached array.
+
+    Parameters
+    ----------
+    name : str
+        Array name, such as "points" or "cell_forcePerS".
+    time_index : int
+        Time index of the array. Default is None, for arrays shared by all time
+        steps.
+
+    Returns
+    -------
+    str
+        File name of the array.
+    """
+    if time_index is None:
+        return name + ".npy"
+    return name + "_" + str(time_index) + ".npy"
+
+
+def save_array(cache_directory, name, values, time_index=None):
+    """
+    Save an array of a surface cache in the numpy binary format, which can be
+    memory mapped when loaded.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Path to the surface cache directory.
+    name : str
+        Array name.
+    values : ndarray
+        Array values.
+    time_index : int
+        Time index of the array. Default is None, for arrays shared by all time
+        steps.
+    """
+    np.save(os.path.join(cache_directory, get_array_file(name, time_index)), np.ascontiguousarray(values))
+
+
+def load_surface(cache_directory, time_index, mmap_mode="r"):
+    """
+    Load the surface of a time step from a surface cache. The arrays are memory
+    mapped by default, so only the parts that are used are read from disk.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Path to the surface cache directory.
+    time_index : int
+        Time index to load.
+    mmap_mode : str
+        Memory mapping mode passed to numpy.load(). Default is "r".
+
+    Returns
+    -------
+    dict
+        Surface with the "points", face "connectivity" and "offsets" arrays,
+        and the "cell_arrays" and "point_arrays" dictionaries.
+    """
+    metadata = load_cache_metadata(cache_directory)
+
+    def load(name, time_index=None):
+        return np.load(os.path.join(cache_directory, get_array_file(name, time_index)), mmap_mode=mmap_mode)
+
+    return {
+        "points": load("points", time_index if metadata["moving_mesh"] else None),
+        "connectivity": load("connectivity"),
+        "offsets": load("offsets"),
+        "cell_arrays": {name: load("cell_" + name, time_index) for name in metadata["cell_arrays"]},
+        "point_arrays": {name: load("point_" + name, time_index) for name in metadata["point_arrays"]},
+    }
+
+
+def get_points_checksum(points):
+    """
+    Compute a checksum of the number and coordinates of the points of a
+    surface, to check that the mesh does not change between time steps.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Point coordinates, of shape (n_points, 3).
+
+    Returns
+    -------
+    str
+        Hexadecimal checksum.
+    """
+    points = np.ascontiguousarray(points)
+    checksum = hashlib.blake2b(digest_size=16)
+    checksum.update(str(np.shape(points)).encode())
+    checksum.update(points.view(np.uint8))
+
+    return checksum.hexdigest()
+
+
+def get_cache_files(cache_directory, time_index):
+    """
+    List the files a time step of a surface cache depends on.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Path to the surface cache directory.
+    time_index : int
+        Time index.
+
+    Returns
+    -------
+    list
+        Names of the files, relative to the cache directory.
+    """
+    metadata = load_cache_metadata(cache_directory)
+
+    files = [CACHE_METADATA_FILE, get_array_file("connectivity"), get_array_file("offsets")]
+    files.append(get_array_file("points", time_index if metadata["moving_mesh"] else None))
+    files += [get_array_file("cell_" + name, time_index) for name in metadata["cell_arrays"]]
+    files += [get_array_file("point_" + name, time_index) for name in metadata["point_arrays"]]
+
+    return files
+
+
+def stitch_surfaces(surfaces, tolerance=1e-10):
+    """
+    Stitch the surfaces of several processor subdomains into a single surface,
+    merging the points duplicated at the boundaries between subdomains. The
+    merged points keep the order of their first occurrence, so the numbering
+    does not change between time steps of a moving mesh.
+
+    The point arrays of each subdomain are interpolated from its own faces
+    only, so they are one-sided at the boundaries between subdomains. The
+    point arrays that have a face counterpart are therefore recomputed from
+    the stitched face arrays, by averaging the faces around each point as the
+    Cell Data to Point Data filter of Paraview does.
+
+    Parameters
+    ----------
+    surfaces : list
+        Surfaces with the "points", face "connectivity" and "offsets" arrays,
+        and the "cell_arrays" and "point_arrays" dictionaries. Surfaces
+        without points are skipped.
+    tolerance : float
+        Distance below which points are merged, relative to the largest
+        coordinate magnitude. Default is 1e-10.
+
+    Returns
+    -------
+    dict
+        Stitched surface.
+    """
+    surfaces = [surface for surface in surfaces if np.size(surface["points"], 0) > 0]
+    if len(surfaces) == 0:
+        raise RuntimeError("No faces found in the requested patches.")
+
+    # Shift the point and connectivity indices of each surface
+    point_shifts = np.cumsum([0] + [np.size(surface["points"], 0) for surface in surfaces])
+    connectivity_shifts = np.cumsum([0] + [np.size(surface["connectivity"]) for surface in surfaces])
+    points = np.concatenate([surface["points"] for surface in surfaces])
+    connectivity = np.concatenate(
+        [surface["connectivity"] + shift for surface, shift in zip(surfaces, point_shifts[:-1])]
+    )
+    offsets = np.concatenate(
+        [surface["offsets"][:-1] + shift for surface, shift in zip(surfaces, connectivity_shifts[:-1])]
+        + [connectivity_shifts[-1:]]
+    )
+
+    # Merge duplicated points, numbered by first occurrence
+    kept, connectivity = pv_utils.merge_points(points, connectivity, tolerance)
+    order = np.argsort(kept)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(np.size(order))
+
+    stitched = {
+        "points": points[kept[order], :],
+        "connectivity": rank[connectivity],
+        "offsets": offsets,
+        "cell_arrays": {},
+        "point_arrays": {},
+    }
+    for name in surfaces[0]["cell_arrays"]:
+        stitched["cell_arrays"][name] = np.concatenate([surface["cell_arrays"][name] for surface in surfaces])
+    for name in surfaces[0]["point_arrays"]:
+        if name in stitched["cell_arrays"]:
+            stitched["point_arrays"][name] = average_cell_array(
+                stitched["connectivity"], stitched["offsets"], stitched["cell_arrays"][name], np.size(kept)
+            )
+        else:
+            values = np.concatenate([surface["point_arrays"][name] for surface in surfaces])
+            stitched["point_arrays"][name] = values[kept[order]]
+
+    return stitched
+
+
+def average_cell_array(connectivity, offsets, values, n_points):
+    """
+    Interpolate a face array at the points of a surface, by averaging the
+    values of the faces around each point.
+
+    Parameters
+    ----------
+    connectivity : numpy.ndarray
+        Point indices of the faces.
+    offsets : numpy.ndarray
+        Start of each face in the connectivity, followed by its size.
+    values : numpy.ndarray
+        Face values, of shape (n_faces,) or (n_faces, n_components).
+    n_points : int
+        Number of points of the surface.
+
+    Returns
+    -------
+    numpy.ndarray
+        Point values, of shape (n_points,) or (n_points, n_components).
+    """
+    faces = np.repeat(np.arange(np.size(offsets) - 1), np.diff(offsets))
+    counts = np.bincount(connectivity, minlength=n_points)
+    sums = np.zeros((n_points,) + np.shape(values)[1:])
+    np.add.at(sums, connectivity, values[faces])
+
+    return sums / np.maximum(counts, 1).reshape((-1,) + (1,) * (np.ndim(values) - 1))
@@ -197,3 +197,448 @@ def find_te(coords):
     te_idx = np.array([te_candidates[0], te_candidates[1]])
 
     return te_pts, te_idx
+
+
+def get_lines(data, point_arrays=None):
+    """
+    Convert the line cells of a sliced dataset into numpy arrays. Composite
+    datasets, such as the multiblock output of a slice over several patches,
+    are assembled from all their blocks. The VTK arrays of every block are
+    first viewed without copying, and then copied once into arrays allocated
+    for all blocks, so sections split into many blocks are not copied again
+    for every block. Cells other than two-point lines are skipped.
+
+    Parameters
+    ----------
+    data : vtkDataObject
+        Sliced dataset or composite dataset.
+    point_arrays : list
+        Names of the point arrays to extract. Default is None, which extracts
+        no point array.
+
+    Returns
+    -------
+    ndarray
+        Point coordinates, with shape (n_points, 3).
+    ndarray
+        Point indices of each line, with shape (n_lines, 2).
+    dict
+        Point arrays, keyed by name.
+    """
+    # VTK is only needed to read sliced datasets, so the numpy helpers of this
+    # module can be used without it
+    from vtk.util import numpy_support as vtk_np
+
+    if point_arrays is None:
+        point_arrays = []
+
+    # View the arrays of every block, keeping the blocks alive with the views
+    blocks = []
+    for block in _iter_blocks(data):
+        if block.GetPoints() is None or block.GetNumberOfCells() == 0:
+            continue
+
+        # Keep two-point cells, which are the line segments of the cut
+        cells = block.GetCells() if block.IsA("vtkUnstructuredGrid") else block.GetLines()
+        cell_offsets = vtk_np.vtk_to_numpy(cells.GetOffsetsArray())
+        views = {
+            "block": block,
+            "points": vtk_np.vtk_to_numpy(block.GetPoints().GetData()),
+            "connectivity": vtk_np.vtk_to_numpy(cells.GetConnectivityArray()),
+            "starts": cell_offsets[:-1][np.diff(cell_offsets) == 2],
+            "arrays": {},
+        }
+        for name in point_arrays:
+            array = block.GetPointData().GetArray(name)
+            if array is None:
+                raise RuntimeError("Point array {} not found in the slice.".format(name))
+            views["arrays"][name] = vtk_np.vtk_to_numpy(array)
+        blocks.append(views)
+
+    # Empty slice
+    if len(blocks) == 0:
+        return np.zeros((0, 3)), np.zeros((0, 2), dtype=int), {name: np.zeros(0) for name in point_arrays}
+
+    # Allocate the assembled arrays once
+    n_points = sum(np.size(views["points"], 0) for views in blocks)
+    n_lines = sum(np.size(views["starts"]) for views in blocks)
+    points = np.empty((n_points, 3))
+    lines = np.empty((n_lines, 2), dtype=int)
+    arrays = {name: np.empty((n_points,) + np.shape(blocks[0]["arrays"][name])[1:]) for name in point_arrays}
+
+    # Copy every block, offsetting its point indices
+    i = 0
+    j = 0
+    for views in blocks:
+        n = np.size(views["points"], 0)
+        m = np.size(views["starts"])
+        points[i : i + n, :] = views["points"]
+        lines[j : j + m, 0] = views["connectivity"][views["starts"]] + i
+        lines[j : j + m, 1] = views["connectivity"][views["starts"] + 1] + i
+        for name in point_arrays:
+            arrays[name][i : i + n] = views["arrays"][name]
+        i += n
+        j += m
+
+    return points, lines, arrays
+
+
+def _iter_blocks(data):
+    """
+    Iterate over the leaf datasets with points of a dataset or composite
+    dataset.
+    """
+    if data is None:
+        return
+    if not data.IsA("vtkCompositeDataSet"):
+        if data.IsA("vtkPointSet"):
+            yield data
+        return
+
+    iterator = data.NewIterator()
+    iterator.InitTraversal()
+    while not iterator.IsDoneWithTraversal():
+        block = iterator.GetCurrentDataObject()
+        if block is not None and block.IsA("vtkPointSet"):
+            yield block
+        iterator.GoToNextItem()
+
+
+def split_sections(points, lines, origin, normal, offsets):
+    """
+    Split the line cells of a multi-plane slice into the sections of each
+    plane. Each line is assigned to the plane offset closest to its first
+    point.
+
+    Parameters
+    ----------
+    points : ndarray
+        Coordinates of the slice points.
+    lines : ndarray
+        Point indices of the line cells, with shape (n_lines, 2).
+    origin : ndarray
+        Origin of the slice planes.
+    normal : ndarray
+        Unit normal of the slice planes.
+    offsets : ndarray
+        Offsets of the slice planes along the normal, measured from the
+        origin.
+
+    Returns
+    -------
+    list
+        Line indices (into lines) belonging to each offset, in the order of the
+        offsets.
+    """
+    offsets = np.asarray(offsets, dtype=float)
+    if np.size(lines, 0) == 0:
+        return [np.zeros(0, dtype=int) for _ in range(np.size(offsets))]
+
+    # Sort offsets, keeping duplicates mapped to the same plane
+    offsets_unique, offsets_inverse = np.unique(offsets, return_inverse=True)
+
+    # Find the closest plane for each line
+    s = (points[lines[:, 0], :] - origin) @ normal
+    i_plane = np.clip(np.searchsorted(offsets_unique, s), 1, max(np.size(offsets_unique) - 1, 1))
+    if np.size(offsets_unique) > 1:
+        lower = np.abs(s - offsets_unique[i_plane - 1]) < np.abs(s - offsets_unique[i_plane])
+        i_plane = np.where(lower, i_plane - 1, i_plane)
+    else:
+        i_plane = np.zeros(np.size(s), dtype=int)
+
+    # Group lines by plane
+    order = np.argsort(i_plane, kind="stable")
+    bounds = np.searchsorted(i_plane[order], np.arange(np.size(offsets_unique) + 1))
+    groups = [order[bounds[k] : bounds[k + 1]] for k in range(np.size(offsets_unique))]
+
+    return [groups[k] for k in offsets_inverse]
+
+
+def merge_points(points, lines, tolerance=1e-10):
+    """
+    Merge coincident points, such as the duplicated points of sections
+    gathered from several MPI ranks.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates.
+    lines : ndarray
+        Point indices of the line cells, with shape (n_lines, 2).
+    tolerance : float
+        Distance below which points are merged, relative to the largest
+        coordinate magnitude. Default is 1e-10.
+
+    Returns
+    -------
+    ndarray
+        Indices of the points kept, in the input point array.
+    ndarray
+        Line cells renumbered to index into the kept points.
+    """
+    if np.size(points, 0) == 0:
+        return np.zeros(0, dtype=int), lines
+
+    scale = tolerance * max(1.0, np.max(np.abs(points)))
+    keys = np.round(points / scale).astype(np.int64)
+    _, kept, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+    return kept, inverse.reshape(-1)[lines]
+
+
+def chain_lines(lines):
+    """
+    Order line segments into connected chains of point indices. Open chains
+    start from a point with a single neighbor and closed loops start from an
+    arbitrary point, without repeating the starting point.
+
+    Parameters
+    ----------
+    lines : ndarray
+        Point indices of the line segments, with shape (n_lines, 2).
+
+    Returns
+    -------
+    list
+        Arrays of ordered point indices, one per chain.
+    """
+    # Build point adjacency
+    neighbors = {}
+    for a, b in lines:
+        if a == b:
+            continue
+        neighbors.setdefault(a, []).append(b)
+        neighbors.setdefault(b, []).append(a)
+
+    # Start from open ends, then from any point left over in closed loops
+    starts = [p for p in neighbors if len(neighbors[p]) == 1] + list(neighbors)
+
+    chains = []
+    visited = set()
+    for start in starts:
+        if start in visited:
+            continue
+
+        chain = [start]
+        visited.add(start)
+        current = start
+        while True:
+            following = None
+            for p in neighbors[current]:
+                if p not in visited:
+                    following = p
+                    break
+            if following is None:
+                break
+            chain.append(following)
+            visited.add(following)
+            current = following
+
+        chains.append(np.array(chain, dtype=int))
+
+    return chains
+
+
+def order_section(points, lines, point_arrays=None):
+    """
+    Order the points of a section into connected chains and compute the arc
+    length along each chain, matching the output of Paraview's
+    PlotOnSortedLines filter.
+
+    Parameters
+    ----------
+    points : ndarray
+        Coordinates of the section points.
+    lines : ndarray
+        Point indices of the section line cells, with shape (n_lines, 2).
+    point_arrays : dict
+        Point arrays to reorder along with the coordinates. Default is None.
+
+    Returns
+    -------
+    ndarray
+        Ordered coordinates.
+    ndarray
+        Arc length along each chain, restarting from zero at each chain.
+    dict
+        Reordered point arrays.
+    """
+    if point_arrays is None:
+        point_arrays = {}
+
+    chains = chain_lines(lines)
+    if len(chains) == 0:
+        return np.zeros((0, 3)), np.zeros(0), {key: value[:0] for key, value in point_arrays.items()}
+
+    # Compute arc length along each chain
+    arclen = []
+    for chain in chains:
+        seg_len = np.linalg.norm(np.diff(points[chain, :], axis=0), axis=1)
+        arclen.append(np.concatenate(([0.0], np.cumsum(seg_len))))
+
+    indices = np.concatenate(chains)
+
+    return points[indices, :], np.concatenate(arclen), {key: value[indices] for key, value in point_arrays.items()}
+
+
+def sort_section(section, lift_direction, drag_direction, point_arrays=None):
+    """
+    Order the points of a section, rotate them to the X-Y plane, and sort them
+    counter-clockwise from the upper trailing edge.
+
+    Parameters
+    ----------
+    section : dict
+        Section with the "points" and the "lines" as point index pairs.
+    lift_direction : ndarray
+        Lift direction, rotated to +Y.
+    drag_direction : ndarray
+        Drag direction, rotated to +X.
+    point_arrays : dict
+        Point arrays to sort along with the points. Default is None.
+
+    Returns
+    -------
+    ndarray
+        Sorted 2D coordinates.
+    dict
+        Sorted point arrays.
+    """
+    # Rotation to the X-Y plane
+    R = np.array([drag_direction, lift_direction, np.cross(drag_direction, lift_direction)])
+
+    # Order the section points
+    coords, arclen, arrays = order_section(section["points"], section["lines"], point_arrays)
+
+    # Rotate points to X-Y plane
+    coords2D = (R @ coords.T).T[:, :2]
+
+    # Sort
+    coords2D, arclen, indices = sort_airfoil(coords2D, arclen)
+
+    return coords2D, {name: values[indices] for name, values in arrays.items()}
+
+
+def integrate_lines(points, lines, values):
+    """
+    Integrate a point array along line cells, interpolating the values
+    linearly over each line as done by Paraview's IntegrateVariables filter.
+
+    Parameters
+    ----------
+    points : ndarray
+        Coordinates of the points.
+    lines : ndarray
+        Point indices of the line cells, with shape (n_lines, 2).
+    values : ndarray
+        Point values, with shape (n_points,) or (n_points, n_components).
+
+    Returns
+    -------
+    float or ndarray
+        Integral of the values along the lines.
+    """
+    if np.size(lines, 0) == 0:
+        return np.zeros(np.shape(values)[1:]) if np.ndim(values) > 1 else 0.0
+
+    length = np.linalg.norm(points[lines[:, 1], :] - points[lines[:, 0], :], axis=1)
+    mean = 0.5 * (values[lines[:, 0]] + values[lines[:, 1]])
+
+    return np.tensordot(length, mean, axes=(0, 0))
+
+
+def integrate_loads(points, lines, force, directions, moment_points=None, moment_axis=None):
+    """
+    Integrate the force per unit area of a section along its line cells,
+    projected onto several directions, and the sectional moments of the force
+    about several reference points, in a single pass.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates, with shape (n_points, 3).
+    lines : ndarray
+        Line cells as point index pairs, with shape (n_lines, 2).
+    force : ndarray
+        Force per unit area at each point, with shape (n_points, 3).
+    directions : ndarray
+        Directions onto which the force is projected, with shape
+        (n_directions, 3).
+    moment_points : ndarray
+        Reference points of the moments, with shape (n_moments, 3). Default
+        is None, which computes no moment.
+    moment_axis : ndarray
+        Unit vector onto which the moments are projected, such as the span
+        direction. Default is None.
+
+    Returns
+    -------
+    ndarray
+        Integrated forces followed by the integrated moments, with shape
+        (n_directions + n_moments,).
+    """
+    values = [force @ np.reshape(directions, (-1, 3)).T]
+
+    # Moment arm from each reference point to each point
+    if moment_points is not None and np.size(moment_points) > 0:
+        arms = points[np.newaxis, :, :] - np.reshape(moment_points, (-1, 1, 3))
+        values.append((np.cross(arms, force) @ moment_axis).T)
+
+    return integrate_lines(points, lines, np.column_stack(values))
+
+
+def refine_stations(function, x, tolerance=0.01, max_stations=1000):
+    """
+    Adaptively refine stations along a line. Starting from the given stations,
+    a station is added at the middle of every interval over which one of the
+    computed quantities changes by more than the tolerance, relative to the
+    range of that quantity, until no interval needs refining or the maximum
+    number of stations is reached. When the budget is limited, the intervals
+    with the largest changes are refined first.
+
+    Parameters
+    ----------
+    function : callable
+        Function computing the quantities at an array of stations, returning
+        an array with shape (n_stations, n_quantities).
+    x : ndarray
+        Initial stations, ordered along the line, with shape (n_stations, 3).
+    tolerance : float
+        Largest change of a quantity over an interval, relative to the range
+        of the quantity. Default is 0.01.
+    max_stations : int
+        Maximum number of stations. Default is 1000.
+
+    Returns
+    -------
+    ndarray
+        Refined stations, ordered along the line.
+    ndarray
+        Quantities at the refined stations.
+    """
+    x = np.asarray(x, dtype=float)
+    values = np.reshape(function(x), (np.size(x, 0), -1))
+
+    while np.size(x, 0) < max_stations:
+        # Change of each quantity over each interval, relative to its range,
+        # ignoring quantities that only vary by round-off
+        scale = np.nanmax(values, axis=0) - np.nanmin(values, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(scale > 1e-9 * np.nanmax(np.abs(values)), scale, np.inf)
+            change = np.abs(np.diff(values, axis=0)) / scale
+        change = np.nan_to_num(np.max(change, axis=1), nan=0.0)
+
+        # Refine the intervals with the largest changes first
+        flagged = np.nonzero(change > tolerance)[0]
+        if np.size(flagged) == 0:
+            break
+        flagged = np.sort(flagged[np.argsort(-change[flagged], kind="stable")][: max_stations - np.size(x, 0)])
+
+        x_new = 0.5 * (x[flagged, :] + x[flagged + 1, :])
+        values_new = np.reshape(function(x_new), (np.size(x_new, 0), -1))
+
+        # Insert the new stations after the first station of their interval
+        x = np.insert(x, flagged + 1, x_new, axis=0)
+        values = np.insert(values, flagged + 1, values_new, axis=0)
+
+    return x, values
@@ -0,0 +1,184 @@
+# External imports
+import os
+import time
+
+# Internal Imports
+import postprocessing.paraview.manifest as pv_manifest
+import postprocessing.paraview.daemon as pv_daemon
+
+
+def create_watch(input_file, fields, case_type="reconstructed", settle_time=2.0):
+    """
+    Create the state of a watched case, which tracks the time directories
+    written by a running solver.
+
+    Parameters
+    ----------
+    input_file : str
+        Relative path to the .foam file of the case.
+    fields : list
+        Names of the fields a time directory must hold to be processed.
+    case_type : str
+        Case type, either "reconstructed" or "decomposed" to watch the
+        processor directories. Default is "reconstructed".
+    settle_time : float
+        Time in seconds for which the files of a time directory must be
+        unchanged before it is processed. Default is 2.
+
+    Returns
+    -------
+    dict
+        Watch state, to pass to poll_times().
+    """
+    return {
+        "case_directory": os.path.dirname(os.path.join(os.getcwd(), input_file)),
+        "fields": fields,
+        "case_type": case_type,
+        "settle_time": settle_time,
+        "states": {},
+        "completed": set(),
+    }
+
+
+def get_directory_state(directory):
+    """
+    List the modification times and sizes of the files in a directory and its
+    subdirectories.
+
+    Parameters
+    ----------
+    directory : str
+        Path to the directory.
+
+    Returns
+    -------
+    list
+        Path, modification time, and size of each file.
+    """
+    state = []
+    for root, _, files in os.walk(directory):
+        for file in files:
+            try:
+                stat = os.stat(os.path.join(root, file))
+            except FileNotFoundError:
+                # Removed while listing, such as a temporary file of the solver
+                continue
+            state.append((os.path.join(root, file), stat.st_mtime_ns, stat.st_size))
+
+    return sorted(state)
+
+
+def poll_times(watch):
+    """
+    Find the time directories completed since the last poll. A time directory
+    is complete when it holds the requested fields, in every processor
+    directory for a decomposed case, and none of its files changed since the
+    last poll or within the settle time.
+
+    Parameters
+    ----------
+    watch : dict
+        Watch state returned by create_watch(). Updated in place.
+
+    Returns
+    -------
+    list
+        Sorted time values of the newly completed time directories.
+    """
+    case_directory = watch["case_directory"]
+    if watch["case_type"] == "decomposed":
+        base_directories = [
+            os.path.join(case_directory, processor_directory)
+            for processor_directory in pv_manifest.get_processor_directories(case_directory)
+        ]
+    else:
+        base_directories = [case_directory]
+    if len(base_directories) == 0:
+        return []
+
+    # Only consider the time values written in every base directory
+    time_directories = [pv_manifest.get_time_directories(base_directory) for base_directory in base_directories]
+    values = set(time_directories[0]).intersection(*time_directories[1:]) - watch["completed"]
+
+    now = time.time_ns()
+    completed = []
+    for value in sorted(values):
+        directories = [
+            os.path.join(base_directory, directories[value])
+            for base_directory, directories in zip(base_directories, time_directories)
+        ]
+        has_fields = all(
+            os.path.isfile(os.path.join(directory, field)) or os.path.isfile(os.path.join(directory, field + ".gz"))
+            for directory in directories
+            for field in watch["fields"]
+        )
+        state = [entry for directory in directories for entry in get_directory_state(directory)]
+
+        # The files must be unchanged since the last poll and older than the settle time
+        previous = watch["states"].get(value)
+        watch["states"][value] = state
+        if not has_fields or (previous is not None and previous != state):
+            continue
+        if now - max(entry[1] for entry in state) < watch["settle_time"] * 1e9:
+            continue
+        completed.append(value)
+
+    for value in completed:
+        watch["completed"].add(value)
+        del watch["states"][value]
+
+    return completed
+
+
+def watch_case(name, kwargs, fields, daemon=None, poll_interval=5.0, settle_time=2.0, watch_timeout=None):
+    """
+    Run a utility on the time directories of a case as they are completed by a
+    running solver. The case is polled for new time directories, and each
+    batch of completed time directories is processed by a call to the utility,
+    so the output files of the time steps appear while the solver runs.
+
+    Parameters
+    ----------
+    name : str
+        Name of the utility, such as "force_distribution".
+    kwargs : dict
+        Keyword arguments of the utility.
+    fields : list
+        Names of the fields a time directory must hold to be processed.
+    daemon : str
+        Address of a running daemon to forward the batches to, which keeps the
+        case open between batches. Default is None, which runs the utility in
+        this process.
+    poll_interval : float
+        Time in seconds between polls of the case. Default is 5.
+    settle_time : float
+        Time in seconds for which the files of a time directory must be
+        unchanged before it is processed. Default is 2.
+    watch_timeout : float
+        Time in seconds without any new time directory after which watching
+        stops. Default is None, which watches until interrupted.
+    """
+    # Summaries of all the time steps are only written at the end of a run
+    if kwargs.get("statistics", "False") == "True" or kwargs.get("spectra", "False") == "True":
+        raise ValueError("Watch mode cannot be combined with statistics or spectra, which summarize all time steps.")
+
+    watch = create_watch(kwargs["input_file"], fields, kwargs.get("case_type", "reconstructed"), settle_time)
+    function = pv_daemon.get_job_function(name) if daemon is None else None
+
+    last = time.monotonic()
+    try:
+        while True:
+            times = poll_times(watch)
+            if len(times) > 0:
+                print("Processing {} completed time steps, from {} to {}.".format(len(times), times[0], times[-1]))
+                if daemon is not None:
+                    pv_daemon.submit_job(daemon, name, dict(kwargs, time_values=times))
+                else:
+                    function(**dict(kwargs, time_values=times))
+                last = time.monotonic()
+            elif watch_timeout is not None and time.monotonic() - last >= watch_timeout:
+                print("No time step completed in {} s, stopped watching.".format(watch_timeout))
+                return
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        print("Stopped watching after {} time steps.".format(len(watch["completed"])))
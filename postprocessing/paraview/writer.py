@@ -0,0 +1,124 @@
+# External imports
+import time
+import queue
+import threading
+
+
+def start_writer(max_pending=8):
+    """
+    Start a background thread that runs write operations in the order they
+    are submitted, so the output files of a time step are written while the
+    next time step is computed.
+
+    Parameters
+    ----------
+    max_pending : int
+        Maximum number of writes waiting in the queue. Submitting a write to a
+        full queue blocks until a write finishes, which bounds the memory held
+        by pending results. Default is 8.
+
+    Returns
+    -------
+    dict
+        Writer, to pass to submit_write() and stop_writer().
+    """
+    writer = {
+        "queue": queue.Queue(maxsize=max_pending),
+        "errors": [],
+        "n_writes": 0,
+        "write_time": 0.0,
+        "wait_time": 0.0,
+    }
+    writer["thread"] = threading.Thread(target=_run_writer, args=(writer,), daemon=True)
+    writer["thread"].start()
+
+    return writer
+
+
+def _run_writer(writer):
+    """
+    Run the writes of a writer until it is stopped. Once a write fails, the
+    following ones are skipped, so that a run manifest never records an
+    output that was not written.
+
+    Parameters
+    ----------
+    writer : dict
+        Writer returned by start_writer().
+    """
+    while True:
+        task = writer["queue"].get()
+        if task is None:
+            return
+        if len(writer["errors"]) > 0:
+            continue
+
+        function, args, kwargs = task
+        start = time.perf_counter()
+        try:
+            function(*args, **kwargs)
+        except Exception as error:
+            writer["errors"].append(error)
+        writer["write_time"] += time.perf_counter() - start
+        writer["n_writes"] += 1
+
+
+def submit_write(writer, function, *args, **kwargs):
+    """
+    Queue a write operation on a writer. The arguments must not be modified
+    after they are submitted.
+
+    Parameters
+    ----------
+    writer : dict
+        Writer returned by start_writer().
+    function : callable
+        Function performing the write.
+    *args
+        Positional arguments of the function.
+    **kwargs
+        Keyword arguments of the function.
+    """
+    if len(writer["errors"]) > 0:
+        raise RuntimeError("A background write failed.") from writer["errors"][0]
+
+    start = time.perf_counter()
+    writer["queue"].put((function, args, kwargs))
+    writer["wait_time"] += time.perf_counter() - start
+
+
+def stop_writer(writer, verbose=False, raise_errors=True):
+    """
+    Wait for the pending writes of a writer to finish and stop its thread.
+    Errors raised by the writes are raised here.
+
+    Parameters
+    ----------
+    writer : dict
+        Writer returned by start_writer().
+    verbose : bool
+        Print the time spent writing, and how much of it overlapped with the
+        computation. Default is False.
+    raise_errors : bool
+        Raise the first error of the writes. Set to False when stopping the
+        writer after the computation failed, so that the write error is only
+        printed and the error of the computation is the one raised. Default is
+        True.
+    """
+    start = time.perf_counter()
+    writer["queue"].put(None)
+    writer["thread"].join()
+    writer["wait_time"] += time.perf_counter() - start
+
+    if len(writer["errors"]) > 0:
+        if raise_errors:
+            raise RuntimeError("A background write failed.") from writer["errors"][0]
+        print("Warning: A background write failed: {}".format(writer["errors"][0]))
+        return
+
+    if verbose and writer["n_writes"] > 0:
+        print(
+            "Wrote {} outputs in {:.2f} s, {:.2f} s of which overlapped with the computation.".format(
+                writer["n_writes"], writer["write_time"], max(writer["write_time"] - writer["wait_time"], 0.0)
+            )
+        )
@@ -1,3 +1,4 @@
+import csv
 import numpy as np
 
 
@@ -84,3 +85,68 @@ def check_input_vector(var, name, check_norm=True):
                 return np.array([x / mag, y / mag, z / mag])
             else:
                 return np.array([x, y, z])
+
+
+def check_input_vectors(var, name, check_norm=True):
+    """
+    Function to check a list of input vectors, and return the corresponding
+    vectors in numpy format. Each vector is given either as a string (eg. X+),
+    as a list [1 0 0], or as three consecutive values of a flat list.
+
+    Parameters
+    ----------
+    var : str or list
+        Vector values, eg. "Y+", ["Y+", "X+"], [0, 1, 0, 1, 0, 0], or
+        [[0, 1, 0], "X+"].
+    name : str
+        Variable name.
+    check_norm: bool
+        Check the norm of the vectors to ensure they are length one.
+
+    Returns
+    -------
+    ndarray
+        Vectors with shape (n_vectors, 3).
+    """
+    if isinstance(var, str):
+        var = [var]
+    var = list(var)
+
+    vectors = []
+    k = 0
+    while k < len(var):
+        # Direction strings and nested lists are one vector each
+        if isinstance(var[k], str) and var[k].upper() in ["X+", "X-", "Y+", "Y-", "Z+", "Z-"]:
+            vectors.append(check_input_vector(var[k], name, check_norm))
+            k += 1
+        elif not isinstance(var[k], str) and np.ndim(var[k]) == 1:
+            vectors.append(check_input_vector(list(var[k]), name, check_norm))
+            k += 1
+        # Otherwise, the next three values are the components of a vector
+        else:
+            vectors.append(check_input_vector(var[k : k + 3], name, check_norm))
+            k += 3
+
+    return np.array(vectors)
+
+
+def write_csv(file_name, fields, results):
+    """
+    Function to write a results array to a CSV file with a header row.
+
+    Parameters
+    ----------
+    file_name : str
+        Path to the CSV file.
+    fields : list
+        Column names.
+    results : ndarray
+        Results with one row per line and one column per field.
+    """
+    with open(file_name, "w") as csvfile:
+        # creating a csv writer object
+        csvwriter = csv.writer(csvfile)
+        # writing the fields
+        csvwriter.writerow(fields)
+        # writing the data rows
+        csvwriter.writerows(results)
@@ -0,0 +1,49 @@
+"""
+Script run by test_paraview_mpi.py under "mpirun -np 4 pvbatch --symmetric".
+It distributes a synthetic cylindrical surface across the ranks, computes the
+force distribution with the multi-plane slicing engine, and checks on the root
+process that the gathered sections integrate to the cylinder perimeter.
+"""
+
+# External imports
+import sys
+import numpy as np
+
+# Paraview imports
+import paraview.simple as paraview
+
+# Internal imports
+import postprocessing.paraview.mpi as pv_mpi
+import postprocessing.paraview.slicing as pv_slicing
+import postprocessing.paraview.distributions as distributions
+
+
+def main():
+    resolution = 128
+    radius = 0.5
+
+    # Synthetic surface with a uniform force per unit area in the X direction
+    cylinder = paraview.Cylinder(registrationName="Cylinder1", Resolution=resolution, Radius=radius, Capping=0)
+    calculator = paraview.Calculator(registrationName="forcePerS", Input=cylinder)
+    calculator.ResultArrayName = "forcePerS"
+    calculator.Function = "iHat"
+    redistribute = paraview.RedistributeDataSet(registrationName="RedistributeDataSet1", Input=calculator)
+
+    # Stations along the cylinder axis
+    span_direction = np.array([0.0, 1.0, 0.0])
+    x = np.zeros((9, 3))
+    x[:, 1] = np.linspace(-0.4, 0.4, 9)
+
+    slice_pipeline = pv_slicing.create_slice_pipeline(redistribute, span_direction)
+    force = distributions.compute_force_distribution(slice_pipeline, 0.0, x, span_direction, np.array([1.0, 0.0, 0.0]))
+
+    if pv_mpi.is_root():
+        perimeter = resolution * 2.0 * radius * np.sin(np.pi / resolution)
+        error = np.max(np.abs(force[:, 0] - perimeter))
+        print("Ranks: {}, maximum error: {:.3e}".format(pv_mpi.get_size(), error))
+        if pv_mpi.get_size() < 2 or error > 1e-8:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
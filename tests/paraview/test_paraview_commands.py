@@ -0,0 +1,52 @@
+import sys
+import json
+import subprocess
+import unittest
+
+# Forward every command to a daemon in a fresh interpreter, and list the jobs
+# submitted and the Paraview, VTK, and utility modules imported on the way
+SCRIPT = """
+import sys
+import json
+from unittest import mock
+
+import postprocessing.paraview.commands as pv_commands
+
+jobs = []
+for command, arguments in [
+    ("force_distribution_cmd", []),
+    ("geometry_distribution_cmd", []),
+    ("slices_cp_cmd", ["-x", "0", "0", "0.5"]),
+    ("sections_cmd", []),
+]:
+    sys.argv = [command, "-i", "case.foam", "-dm", "daemon.sock"] + arguments
+    with mock.patch.object(pv_commands.pv_daemon, "submit_job") as submit_job:
+        getattr(pv_commands, command)()
+    jobs.append(submit_job.call_args[0][1])
+
+heavy = ["paraview", "vtk", "vtkmodules"]
+utilities = ["slicing", "case", "distributions", "slices", "sections"]
+imported = [
+    name
+    for name in sys.modules
+    if name.split(".")[0] in heavy or name in ["postprocessing.paraview." + utility for utility in utilities]
+]
+print(json.dumps({"jobs": jobs, "imported": imported}))
+"""
+
+
+class TestCommands(unittest.TestCase):
+    def test_daemon_without_paraview(self):
+        """
+        Tests that forwarding a job to a daemon from the command line does not
+        import Paraview, VTK, or the utility modules.
+        """
+        output = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.splitlines()[-1])
+
+        self.assertEqual(result["jobs"], ["force_distribution", "geometry_distribution", "slices_cp", "sections"])
+        self.assertEqual(result["imported"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,287 @@
+import unittest
+import numpy as np
+
+# VTK is only needed to compare with the sections cut by Paraview
+try:
+    import vtk
+    from vtk.util import numpy_support as vtk_np
+except ImportError:
+    vtk = None
+
+# Internal imports
+import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.cutting as pv_cutting
+
+
+def create_wing(n_chord=60, n_span=40):
+    """
+    Create a synthetic tapered wing surface of quadrilateral faces, closed at
+    the root and tip by triangle fans, with a smooth force per unit area.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, n_chord, endpoint=False)
+    z = np.linspace(0.0, 1.0, n_span)
+    chord = 1.0 - 0.5 * z
+    points = np.column_stack(
+        (
+            np.ravel(np.outer(chord, 0.5 + 0.5 * np.cos(theta)) + 0.3 * z[:, np.newaxis]),
+            np.ravel(np.outer(chord, 0.06 * np.sin(theta))),
+            np.repeat(z, n_chord),
+        )
+    )
+
+    faces = []
+    for j in range(n_span - 1):
+        for i in range(n_chord):
+            a = j * n_chord + i
+            b = j * n_chord + (i + 1) % n_chord
+            faces.append([a, b, b + n_chord, a + n_chord])
+    for i in range(1, n_chord - 1):
+        faces.append([0, i + 1, i])
+        faces.append([(n_span - 1) * n_chord + k for k in [0, i, i + 1]])
+
+    surface = {
+        "points": points,
+        "connectivity": np.concatenate(faces),
+        "offsets": np.concatenate(([0], np.cumsum([len(face) for face in faces]))),
+        "cell_arrays": {},
+        "point_arrays": {},
+    }
+    force = np.column_stack(
+        (np.sin(3.0 * points[:, 0]), np.cos(20.0 * points[:, 1]) + points[:, 2], points[:, 0] * points[:, 2])
+    )
+    surface["point_arrays"]["forcePerS"] = force
+
+    return surface
+
+
+def slice_wing(surface, x, normal, name="forcePerS"):
+    """
+    Slice a surface with the VTK cutter run by Paraview's Slice filter, and
+    split the result into the sections of each station.
+    """
+    data = vtk.vtkPolyData()
+    points = vtk.vtkPoints()
+    points.SetData(vtk_np.numpy_to_vtk(surface["points"], deep=1))
+    data.SetPoints(points)
+    cells = vtk.vtkCellArray()
+    cells.SetData(
+        vtk_np.numpy_to_vtkIdTypeArray(surface["offsets"].astype(np.int64), deep=1),
+        vtk_np.numpy_to_vtkIdTypeArray(surface["connectivity"].astype(np.int64), deep=1),
+    )
+    data.SetPolys(cells)
+    array = vtk_np.numpy_to_vtk(surface["point_arrays"][name], deep=1)
+    array.SetName(name)
+    data.GetPointData().AddArray(array)
+
+    plane = vtk.vtkPlane()
+    plane.SetOrigin(*x[0, :])
+    plane.SetNormal(*normal)
+    cutter = vtk.vtkCutter()
+    cutter.SetCutFunction(plane)
+    cutter.SetInputData(data)
+    offsets = (x - x[0, :]) @ normal
+    cutter.SetNumberOfContours(np.size(offsets))
+    for k, offset in enumerate(offsets):
+        cutter.SetValue(k, offset)
+    cutter.Update()
+
+    points, lines, arrays = pv_utils.get_lines(cutter.GetOutput(), [name])
+    kept, lines = pv_utils.merge_points(points, lines)
+    groups = pv_utils.split_sections(points[kept, :], lines, x[0, :], normal, offsets)
+
+    return points[kept, :], lines, arrays[name][kept], groups
+
+
+class TestCutting(unittest.TestCase):
+    def setUp(self):
+        self.surface = create_wing()
+        self.normal = np.array([0.0, 0.0, 1.0])
+        self.x = np.column_stack((np.zeros(30), np.zeros(30), np.linspace(0.011, 0.989, 30)))
+        self.directions = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]])
+        self.moment_points = np.array([[0.25, 0.0, 0.0], [0.5, 0.0, 0.0]])
+
+    def test_get_face_edges(self):
+        """
+        Tests that the edges of mixed faces close each face.
+        """
+        edges, faces = pv_cutting.get_face_edges([0, 1, 2, 3, 4, 5, 6], [0, 4, 7])
+
+        np.testing.assert_array_equal(edges, [[0, 1], [1, 2], [2, 3], [3, 0], [4, 5], [5, 6], [6, 4]])
+        np.testing.assert_array_equal(faces, [0, 0, 0, 0, 1, 1, 1])
+
+    @unittest.skipIf(vtk is None, "requires vtk")
+    def test_compute_surface_loads(self):
+        """
+        Tests that the numpy engine matches the sections cut by the Paraview
+        slice filter on a synthetic wing, for stations in any order.
+        """
+        points, lines, force, groups = slice_wing(self.surface, self.x, self.normal)
+        expected = np.array(
+            [
+                pv_utils.integrate_loads(points, lines[group], force, self.directions, self.moment_points, self.normal)
+                for group in groups
+            ]
+        )
+
+        loads = pv_cutting.compute_surface_loads(self.surface, self.x, self.normal, self.directions, self.moment_points)
+        reversed_loads = pv_cutting.compute_surface_loads(
+            self.surface, self.x[::-1, :], self.normal, self.directions, self.moment_points
+        )
+
+        self.assertEqual(np.shape(loads), (30, 4))
+        np.testing.assert_allclose(loads, expected, rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(reversed_loads[::-1, :], expected, rtol=1e-10, atol=1e-12)
+
+    def test_face_index(self):
+        """
+        Tests that the face index returns every face crossed by the planes,
+        including planes through the points, and that cutting only those
+        faces gives the same loads.
+        """
+        index = pv_cutting.create_face_index(
+            self.surface["points"], self.surface["connectivity"], self.surface["offsets"], self.normal, n_buckets=7
+        )
+        edges, faces = pv_cutting.get_face_edges(self.surface["connectivity"], self.surface["offsets"])
+        for distances in [self.x[:, 2], self.x[3:5, 2], np.unique(self.surface["points"][:, 2])[[1, 17, 38]]]:
+            cut = pv_cutting.cut_surface(self.surface["points"], edges, np.zeros(3), self.normal, distances)
+            candidates = pv_cutting.query_face_index(index, distances)
+
+            self.assertTrue(set(faces[np.ravel(cut["edges"])]).issubset(candidates))
+            self.assertLess(np.size(candidates), np.size(self.surface["offsets"]) - 1)
+
+        loads = pv_cutting.compute_surface_loads(
+            self.surface, self.x[3:5, :], self.normal, self.directions, self.moment_points, index=index
+        )
+        expected = pv_cutting.compute_surface_loads(
+            self.surface, self.x[3:5, :], self.normal, self.directions, self.moment_points
+        )
+        np.testing.assert_allclose(loads, expected, rtol=1e-12, atol=1e-14)
+
+    def test_load_operator(self):
+        """
+        Tests that the load operator built from one time step gives the loads
+        of a block of time steps, for point and face values.
+        """
+        index = pv_cutting.create_face_index(
+            self.surface["points"], self.surface["connectivity"], self.surface["offsets"], self.normal
+        )
+        n_faces = np.size(self.surface["offsets"]) - 1
+        rng = np.random.default_rng(0)
+        for arrays in ["point_arrays", "cell_arrays"]:
+            n_values = n_faces if arrays == "cell_arrays" else np.size(self.surface["points"], 0)
+            surfaces = []
+            for _ in range(3):
+                surface = dict(self.surface, point_arrays={}, cell_arrays={})
+                surface[arrays] = {"forcePerS": rng.normal(size=(n_values, 3))}
+                surfaces.append(surface)
+            operator = pv_cutting.create_load_operator(
+                surfaces[0], self.x, self.normal, self.directions, self.moment_points, index=index
+            )
+            loads = pv_cutting.apply_load_operator(operator, surfaces)
+
+            self.assertEqual(np.shape(loads), (3, 30, 4))
+            for k, surface in enumerate(surfaces):
+                expected = pv_cutting.compute_surface_loads(
+                    surface, self.x, self.normal, self.directions, self.moment_points
+                )
+                np.testing.assert_allclose(loads[k], expected, rtol=1e-10, atol=1e-12)
+
+        with self.assertRaises(RuntimeError):
+            pv_cutting.apply_load_operator(operator, [self.surface])
+
+    @unittest.skipIf(vtk is None, "requires vtk")
+    def test_cut_sections(self):
+        """
+        Tests that the sorted sections cut with numpy, and the values gathered
+        at their points, match the sections cut by the Paraview slice filter.
+        """
+        points, lines, force, groups = slice_wing(self.surface, self.x, self.normal)
+        index = pv_cutting.create_face_index(
+            self.surface["points"], self.surface["connectivity"], self.surface["offsets"], self.normal
+        )
+        sections = pv_cutting.cut_sections(self.surface, self.x, self.normal, index)
+
+        # Sort the points of each section, and their ends and weights along with them
+        sorted_sections = []
+        for section, group in zip(sections, groups):
+            coords, arclen, arrays = pv_utils.order_section(
+                section["points"], section["lines"], {"ends": section["ends"], "weights": section["weights"]}
+            )
+            coords2D, _, indices = pv_utils.sort_airfoil(coords[:, :2], arclen)
+            expected_coords, expected_arclen, expected_arrays = pv_utils.order_section(
+                points, lines[group], {"force": force[:, 0]}
+            )
+            expected_coords2D, _, expected_indices = pv_utils.sort_airfoil(expected_coords[:, :2], expected_arclen)
+
+            np.testing.assert_allclose(coords2D, expected_coords2D, rtol=1e-10, atol=1e-12)
+            sorted_sections.append(
+                {
+                    "ends": arrays["ends"][indices],
+                    "weights": arrays["weights"][indices],
+                    "expected": expected_arrays["force"][expected_indices],
+                }
+            )
+
+        operator = pv_cutting.create_gather_operator(sorted_sections, np.size(self.surface["points"], 0))
+        values = pv_cutting.gather_sections(operator, self.surface["point_arrays"]["forcePerS"][:, 0])
+
+        self.assertEqual(len(values), 30)
+        for value, section in zip(values, sorted_sections):
+            np.testing.assert_allclose(value, section["expected"], rtol=1e-10, atol=1e-12)
+
+        with self.assertRaises(RuntimeError):
+            pv_cutting.gather_sections(operator, np.zeros(3))
+
+    @unittest.skipIf(vtk is None, "requires vtk")
+    def test_cp_plan(self):
+        """
+        Tests that the pressure coefficient gathered through a plan matches
+        the one of the sections cut by the Paraview slice filter and sorted
+        as pv_slices_cp does, at several time steps of the same mesh.
+        """
+        index = pv_cutting.create_face_index(
+            self.surface["points"], self.surface["connectivity"], self.surface["offsets"], self.normal
+        )
+        lift_direction = np.array([0.0, 1.0, 0.0])
+        drag_direction = np.array([1.0, 0.0, 0.0])
+        plan = pv_cutting.create_cp_plan(
+            pv_cutting.cut_sections(self.surface, self.x, self.normal, index),
+            lift_direction,
+            drag_direction,
+            np.size(self.surface["points"], 0),
+        )
+
+        for k in range(3):
+            pressure = (1.0 + k) * np.sin(3.0 * self.surface["points"][:, 0]) + self.surface["points"][:, 1]
+            surface = dict(self.surface, point_arrays={"p": pressure})
+            points, lines, p, groups = slice_wing(surface, self.x, self.normal, "p")
+            cp = pv_cutting.apply_cp_plan(plan, pressure, 1.2, 10.0, 0.5)
+
+            self.assertEqual(len(cp), 30)
+            for coords2D, values, group in zip(plan["coords"], cp, groups):
+                expected_coords2D, arrays = pv_utils.sort_section(
+                    {"points": points, "lines": lines[group]}, lift_direction, drag_direction, {"p": p}
+                )
+                np.testing.assert_allclose(coords2D, expected_coords2D, rtol=1e-10, atol=1e-12)
+                np.testing.assert_allclose(values, (arrays["p"] - 0.5) / (0.5 * 1.2 * 100.0), rtol=1e-10, atol=1e-12)
+
+    @unittest.skipIf(vtk is None, "requires vtk")
+    def test_face_values(self):
+        """
+        Tests that constant face values integrate to the value times the
+        section perimeter.
+        """
+        n_faces = np.size(self.surface["offsets"]) - 1
+        self.surface["point_arrays"] = {}
+        self.surface["cell_arrays"]["forcePerS"] = np.tile([0.0, 2.0, 0.0], (n_faces, 1))
+        points, lines, _, groups = slice_wing(create_wing(), self.x, self.normal)
+        perimeter = [np.sum(np.linalg.norm(np.diff(points[lines[group]], axis=1), axis=2)) for group in groups]
+
+        loads = pv_cutting.compute_surface_loads(self.surface, self.x, self.normal, self.directions)
+
+        np.testing.assert_allclose(loads[:, 0], 2.0 * np.array(perimeter), rtol=1e-10)
+        np.testing.assert_allclose(loads[:, 1], 0.0, atol=1e-14)
+
+
+if __name__ == "__main__":
+    unittest.main()
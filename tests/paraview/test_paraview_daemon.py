@@ -0,0 +1,94 @@
+import io
+import os
+import stat
+import tempfile
+import contextlib
+import threading
+import unittest
+from unittest import mock
+import multiprocessing
+from multiprocessing.connection import Listener
+
+# Internal imports
+import postprocessing.paraview.daemon as pv_daemon
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self.directory.name, "pv_daemon.sock")
+        self.key_file = mock.patch.object(pv_daemon, "KEY_FILE", os.path.join(self.directory.name, "key", "pv.key"))
+        self.key_file.start()
+
+        # Serve stand-in jobs from the standard library
+        self.jobs = mock.patch.dict(pv_daemon.JOBS, {"dumps": "json:dumps", "loads": "json:loads"})
+        self.jobs.start()
+        self.listener = Listener(pv_daemon.parse_address(self.address), authkey=pv_daemon.get_authkey(create=True))
+        self.thread = threading.Thread(target=pv_daemon.serve, args=(self.listener,))
+        self.thread.start()
+
+    def tearDown(self):
+        pv_daemon.shutdown_daemon(self.address)
+        self.thread.join(timeout=10)
+        self.listener.close()
+        self.jobs.stop()
+        self.key_file.stop()
+        self.directory.cleanup()
+
+    def test_submit_job(self):
+        """
+        Tests that jobs run in the daemon return their result, and that failed
+        jobs raise an error in the caller while the daemon keeps running.
+        """
+        self.assertEqual(pv_daemon.submit_job(self.address, "dumps", {"obj": [1, 2]}), "[1, 2]")
+
+        with self.assertRaises(RuntimeError):
+            pv_daemon.submit_job(self.address, "loads", {"s": "{"})
+        with self.assertRaises(RuntimeError):
+            pv_daemon.submit_job(self.address, "unknown", {})
+
+        self.assertEqual(pv_daemon.submit_job(self.address, "loads", {"s": "[3]"}), [3])
+
+    def test_parse_address(self):
+        """
+        Tests that host:port addresses are TCP sockets and paths are Unix
+        sockets.
+        """
+        self.assertEqual(pv_daemon.parse_address("localhost:50505"), ("localhost", 50505))
+        self.assertEqual(pv_daemon.parse_address(self.address), self.address)
+
+    def test_authkey(self):
+        """
+        Tests that the key file is only readable by its owner and reused, and
+        that connections with another key are rejected.
+        """
+        key_file = pv_daemon.KEY_FILE
+        self.assertEqual(stat.S_IMODE(os.stat(key_file).st_mode), 0o600)
+        self.assertEqual(pv_daemon.get_authkey(), pv_daemon.get_authkey(create=True))
+        self.assertGreaterEqual(len(pv_daemon.get_authkey()), 64)
+
+        with self.assertRaises(multiprocessing.AuthenticationError), contextlib.redirect_stdout(io.StringIO()):
+            pv_daemon.submit_job(self.address, "dumps", {"obj": 1}, authkey="postprocessing")
+
+        # A key readable by other users is refused
+        os.chmod(key_file, 0o644)
+        with self.assertRaises(RuntimeError):
+            pv_daemon.get_authkey()
+        os.chmod(key_file, 0o600)
+
+    def test_loopback(self):
+        """
+        Tests that the daemon only listens on a Unix socket or the loopback
+        interface without an explicit key.
+        """
+        self.assertTrue(pv_daemon.is_loopback(self.address))
+        self.assertTrue(pv_daemon.is_loopback("127.0.0.1:50505"))
+        self.assertFalse(pv_daemon.is_loopback("192.0.2.1:50505"))
+        self.assertFalse(pv_daemon.is_loopback("0.0.0.0:50505"))
+
+        with self.assertRaises(ValueError):
+            pv_daemon.run_daemon("192.0.2.1:50505")
+
+
+if __name__ == "__main__":
+    unittest.main()
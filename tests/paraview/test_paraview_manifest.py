@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+
+# Internal imports
+import postprocessing.paraview.manifest as pv_manifest
+
+
+def write_file(path, content):
+    """
+    Writes a text file, creating its directory if needed.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    content : str
+        Content of the file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.case = os.path.join(self.directory.name, "case")
+        write_file(os.path.join(self.case, "case.foam"), "")
+        write_file(os.path.join(self.case, "constant", "polyMesh", "points"), "mesh")
+        for time in ["0.5", "1"]:
+            write_file(os.path.join(self.case, time, "forcePerS"), "field " + time)
+
+        self.input_file = os.path.relpath(os.path.join(self.case, "case.foam"))
+        self.parameters = {"patches": "group/wall", "x": [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]]}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_signature(self):
+        """
+        Tests that the signature of a time step changes with its field file,
+        the mesh, and the parameters, but not with other time steps.
+        """
+        signature = pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], self.parameters)
+        signature_other = pv_manifest.compute_signature(self.input_file, 1.0, ["forcePerS"], self.parameters)
+        self.assertNotEqual(signature, signature_other)
+
+        # Unrelated time step
+        write_file(os.path.join(self.case, "1", "forcePerS"), "field 1 updated")
+        self.assertEqual(signature, pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], self.parameters))
+
+        # Field and mesh files
+        write_file(os.path.join(self.case, "0.5", "forcePerS"), "field 0.5 updated")
+        signature_field = pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], self.parameters)
+        self.assertNotEqual(signature, signature_field)
+
+        write_file(os.path.join(self.case, "constant", "polyMesh", "points"), "mesh updated")
+        signature_mesh = pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], self.parameters)
+        self.assertNotEqual(signature_field, signature_mesh)
+
+        # Parameters
+        parameters = dict(self.parameters, patches=["wing"])
+        self.assertNotEqual(
+            signature_mesh, pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], parameters)
+        )
+
+    def test_processor_directories(self):
+        """
+        Tests that the processor directories of a decomposed case are found in
+        processor order and that their time steps are part of the signature.
+        """
+        for processor in [10, 2, 0]:
+            write_file(os.path.join(self.case, "processor{}".format(processor), "0.5", "forcePerS"), "field")
+        write_file(os.path.join(self.case, "processors", "0.5", "forcePerS"), "field")
+        self.assertEqual(pv_manifest.get_processor_directories(self.case), ["processor0", "processor2", "processor10"])
+
+        signature = pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], self.parameters)
+        signature_other = pv_manifest.compute_signature(self.input_file, 1.0, ["forcePerS"], self.parameters)
+        write_file(os.path.join(self.case, "processor2", "0.5", "forcePerS"), "field updated")
+        self.assertNotEqual(
+            signature, pv_manifest.compute_signature(self.input_file, 0.5, ["forcePerS"], self.parameters)
+        )
+        self.assertEqual(
+            signature_other, pv_manifest.compute_signature(self.input_file, 1.0, ["forcePerS"], self.parameters)
+        )
+
+    def test_up_to_date(self):
+        """
+        Tests that outputs are only up to date when recorded with the same
+        signature and still present in the output directory.
+        """
+        output_directory = os.path.join(self.directory.name, "output")
+        os.makedirs(output_directory)
+        write_file(os.path.join(output_directory, "force_0.csv"), "")
+
+        manifest = pv_manifest.load_manifest(output_directory, "force")
+        self.assertFalse(pv_manifest.is_up_to_date(manifest, output_directory, ["force_0.csv"], "a"))
+
+        pv_manifest.record_outputs(manifest, output_directory, "force", ["force_0.csv"], "a")
+        manifest = pv_manifest.load_manifest(output_directory, "force")
+        self.assertTrue(pv_manifest.is_up_to_date(manifest, output_directory, ["force_0.csv"], "a"))
+        self.assertFalse(pv_manifest.is_up_to_date(manifest, output_directory, ["force_0.csv"], "b"))
+
+        os.remove(os.path.join(output_directory, "force_0.csv"))
+        self.assertFalse(pv_manifest.is_up_to_date(manifest, output_directory, ["force_0.csv"], "a"))
+
+    def test_journal(self):
+        """
+        Tests that the outputs recorded in the journal are merged into the
+        manifest on load, skipping a line cut short by an interrupted run.
+        """
+        output_directory = os.path.join(self.directory.name, "output")
+        os.makedirs(output_directory)
+
+        manifest = pv_manifest.load_manifest(output_directory, "force")
+        for i in range(3):
+            pv_manifest.record_outputs(manifest, output_directory, "force", ["force_{}.csv".format(i)], str(i))
+        with open(os.path.join(output_directory, "force_manifest.journal"), "a") as f:
+            f.write('{"force_3.csv": "3')
+
+        manifest = pv_manifest.load_manifest(output_directory, "force")
+        self.assertEqual(manifest, {"force_0.csv": "0", "force_1.csv": "1", "force_2.csv": "2"})
+        self.assertEqual(sorted(os.listdir(output_directory)), ["force_manifest.json"])
+
+        pv_manifest.record_outputs(manifest, output_directory, "force", ["force_0.csv"], "a")
+        self.assertEqual(pv_manifest.load_manifest(output_directory, "force")["force_0.csv"], "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
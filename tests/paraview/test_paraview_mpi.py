@@ -0,0 +1,26 @@
+import os
+import shutil
+import subprocess
+import unittest
+
+
+# Script paths
+script_path = os.path.join(os.path.dirname(__file__), "mpi_force_distribution.py")
+
+
+class TestParaviewMPI(unittest.TestCase):
+    @unittest.skipUnless(shutil.which("mpirun") and shutil.which("pvbatch"), "requires mpirun and pvbatch")
+    def test_force_distribution(self):
+        """
+        Tests that sections distributed over four MPI ranks are gathered and
+        integrated correctly on the root process.
+        """
+        result = subprocess.run(
+            ["mpirun", "-np", "4", "pvbatch", "--symmetric", script_path], capture_output=True, text=True
+        )
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
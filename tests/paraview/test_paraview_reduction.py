@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+
+# Internal imports
+import postprocessing.paraview.utils as pv_utils
+import postprocessing.paraview.reduction as pv_reduction
+
+
+def wing_sections(offsets, chords, twists, n_points=101):
+    """
+    Generates the line cells of NACA 0012 sections stacked along the Z axis,
+    shuffled as they would be returned by a multi-plane slice.
+
+    Parameters
+    ----------
+    offsets : list
+        Z coordinates of the sections.
+    chords : list
+        Chord of each section.
+    twists : list
+        Twist of each section, in degrees.
+    n_points : int
+        Number of points per surface of a section.
+
+    Returns
+    -------
+    ndarray
+        Point coordinates.
+    ndarray
+        Line cells as point index pairs.
+    """
+    beta = np.linspace(0.0, np.pi, n_points)
+    x_c = 0.5 * (1.0 - np.cos(beta))
+    y_t = 0.6 * (0.2969 * np.sqrt(x_c) - 0.126 * x_c - 0.3516 * x_c**2 + 0.2843 * x_c**3 - 0.1015 * x_c**4)
+    coords = np.concatenate((np.stack((x_c[::-1], y_t[::-1]), axis=1), np.stack((x_c[1:], -y_t[1:]), axis=1)))
+
+    points = []
+    lines = []
+    for k, (z, chord, twist) in enumerate(zip(offsets, chords, twists)):
+        t = np.deg2rad(twist)
+        R = np.array([[np.cos(t), np.sin(t)], [-np.sin(t), np.cos(t)]])
+        section = chord * coords @ R.T
+        points.append(np.column_stack((section, np.full(np.size(section, 0), z))))
+        i = np.arange(np.size(section, 0)) + sum(np.size(p, 0) for p in points[:-1])
+        lines.append(np.stack((i, np.roll(i, -1)), axis=1))
+    lines = np.concatenate(lines)
+
+    return np.concatenate(points), lines[np.random.default_rng(0).permutation(np.size(lines, 0))]
+
+
+class TestReduction(unittest.TestCase):
+    def test_reduce_geometry(self):
+        """
+        Tests that the sections of a multi-plane cut are reduced to the twist,
+        chord, and thickness of each station.
+        """
+        offsets = [0.0, 0.5, 1.0]
+        chords = [2.0, 1.5, 1.0]
+        twists = [5.0, 2.0, -1.0]
+        points, lines = wing_sections(offsets, chords, twists)
+
+        geometry = pv_reduction.reduce_geometry(
+            points, lines, {}, [0.0, 0.0, 0.0], [0.0, 0.0, 1.0], offsets, [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]
+        )
+
+        np.testing.assert_allclose(geometry[:, 0], twists, atol=1e-4)
+        np.testing.assert_allclose(geometry[:, 1], chords, rtol=1e-6)
+        np.testing.assert_allclose(geometry[:, 2], 0.12 * np.array(chords), rtol=1e-2)
+
+    def test_section_geometry(self):
+        """
+        Tests that a section is reduced from the same sorted coordinates as a
+        section fetched to the client.
+        """
+        points, lines = wing_sections([0.0], [2.0], [5.0])
+        lift_direction = np.array([0.0, 1.0, 0.0])
+        drag_direction = np.array([1.0, 0.0, 0.0])
+
+        coords2D, _ = pv_utils.sort_section({"points": points, "lines": lines}, lift_direction, drag_direction)
+        chord, twist, thickness = pv_reduction.compute_section_properties(coords2D)
+
+        np.testing.assert_array_equal(
+            pv_reduction.compute_section_geometry(points, lines, lift_direction, drag_direction),
+            [twist, chord, thickness],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Internal imports
+import postprocessing.utils as utils
+import postprocessing.paraview.store as pv_store
+import postprocessing.paraview.results as pv_results
+
+
+class TestResults(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_directory = self.directory.name
+        self.x = np.column_stack((np.zeros(4), np.zeros(4), np.linspace(0.0, 1.0, 4)))
+
+        # Geometry distributions of three time steps, with time step 1 missing
+        self.values = {
+            i: np.column_stack((i + self.x[:, 2], 2 * i + self.x[:, 2], 3 * i + self.x[:, 2])) for i in [0, 2, 3]
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_csv(self, i):
+        utils.write_csv(
+            os.path.join(self.output_directory, "geometry_distribution_{}.csv".format(i)),
+            ["X", "Y", "Z", "Twist", "Chord", "Thickness"],
+            np.column_stack((self.x, self.values[i])),
+        )
+
+    def test_csv(self):
+        """
+        Tests that CSV outputs are consolidated into a memory mapped array,
+        which is rebuilt when a CSV file changes.
+        """
+        for i in self.values:
+            self.write_csv(i)
+
+        results = pv_results.open_results(self.output_directory, "geometry_distribution", times=[0.0, 0.5, 1.0, 1.5])
+        self.assertIsInstance(results["values"], np.memmap)
+        self.assertEqual(results["fields"], ["Twist", "Chord", "Thickness"])
+        np.testing.assert_array_equal(results["time_indices"], [0, 2, 3])
+        np.testing.assert_array_equal(results["times"], [0.0, 1.0, 1.5])
+        np.testing.assert_allclose(results["stations"], self.x)
+        np.testing.assert_allclose(results["values"][1], self.values[2])
+
+        # Updated outputs
+        self.values[3] = -self.values[3]
+        self.write_csv(3)
+        os.utime(os.path.join(self.output_directory, "geometry_distribution_3.csv"), ns=(0, 0))
+        results = pv_results.open_results(self.output_directory, "geometry_distribution")
+        np.testing.assert_array_equal(results["times"], [0, 2, 3])
+        np.testing.assert_allclose(results["values"][2], self.values[3])
+
+    def test_store(self):
+        """
+        Tests that a results store is consolidated with only its newest values
+        of each time step, and that selections keep the time axis memory
+        mapped.
+        """
+        store_directory = pv_store.get_store_directory(self.output_directory, "geometry_distribution")
+        pv_store.create_store(store_directory, ["Twist", "Chord", "Thickness"], self.x, [0.0, 0.5, 1.0, 1.5])
+        pv_store.write_chunk(store_directory, [(i, -self.values[i], "") for i in [0, 3]])
+        pv_store.write_chunk(store_directory, [(i, self.values[i], "") for i in self.values])
+
+        results = pv_results.open_results(self.output_directory, "geometry_distribution")
+        np.testing.assert_array_equal(results["time_indices"], [0, 2, 3])
+        np.testing.assert_array_equal(results["times"], [0.0, 1.0, 1.5])
+        np.testing.assert_allclose(results["values"][2], self.values[3])
+
+        selection = pv_results.select_results(results, time_range=[0.9, 2.0])
+        self.assertIsInstance(selection["values"], np.memmap)
+        np.testing.assert_array_equal(selection["time_indices"], [2, 3])
+
+        selection = pv_results.select_results(results, time_range=[0.9, 2.0], stations=[1, 3], fields="Chord")
+        self.assertEqual(selection["fields"], ["Chord"])
+        np.testing.assert_allclose(selection["stations"], self.x[[1, 3]])
+        np.testing.assert_allclose(selection["values"][:, :, 0], [self.values[2][[1, 3], 1], self.values[3][[1, 3], 1]])
+
+    def test_plot_history(self):
+        """
+        Tests that the history of a quantity is plotted with one line per
+        station.
+        """
+        for i in self.values:
+            self.write_csv(i)
+
+        results = pv_results.open_results(self.output_directory, "geometry_distribution")
+        fig = pv_results.plot_history(results, "Chord", stations=[0, 3])
+        self.assertEqual(len(fig.axes[0].lines), 2)
+        np.testing.assert_allclose(fig.axes[0].lines[1].get_ydata(), [1.0, 5.0, 7.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
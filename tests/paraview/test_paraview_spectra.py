@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import scipy.signal
+
+# Internal imports
+import postprocessing.paraview.spectra as pv_spectra
+
+
+class TestParaviewSpectra(unittest.TestCase):
+    def setUp(self):
+        # Sectional loads of three stations oscillating at different frequencies
+        self.times = 0.5 + 0.01 * np.arange(1000)
+        frequencies = np.array([5.0, 12.0, 31.0])
+        noise = np.random.default_rng(0).normal(size=(1000, 3))
+        self.values = 2.0 + np.sin(2.0 * np.pi * self.times[:, np.newaxis] * frequencies) + 0.1 * noise
+
+    def test_update_spectrum(self):
+        """
+        Tests that the streamed spectrum matches the Welch estimate of all time
+        steps held at once, and peaks at the frequency of each station.
+        """
+        spectrum = pv_spectra.create_spectrum(segment_length=128, overlap=0.5)
+        for time, values in zip(self.times, self.values):
+            pv_spectra.update_spectrum(spectrum, time, values[:, np.newaxis])
+        frequencies, psd = pv_spectra.summarize_spectrum(spectrum)
+
+        expected_frequencies, expected_psd = scipy.signal.welch(self.values, fs=100.0, nperseg=128, axis=0)
+
+        self.assertEqual(np.shape(spectrum["buffer"]), (128, 3, 1))
+        self.assertEqual(np.shape(psd), (65, 3, 1))
+        np.testing.assert_allclose(frequencies, expected_frequencies)
+        np.testing.assert_allclose(psd[:, :, 0], expected_psd, rtol=1e-10, atol=1e-14)
+        np.testing.assert_allclose(frequencies[np.argmax(psd[:, :, 0], axis=0)], [5.0, 12.0, 31.0], atol=100.0 / 128)
+
+    def test_uniform_time_steps(self):
+        """
+        Tests that a missing time step and too few time steps are reported.
+        """
+        spectrum = pv_spectra.create_spectrum(segment_length=16)
+        pv_spectra.update_spectrum(spectrum, 0.0, [1.0])
+        pv_spectra.update_spectrum(spectrum, 0.1, [1.0])
+        with self.assertRaises(RuntimeError):
+            pv_spectra.summarize_spectrum(spectrum)
+        with self.assertRaises(RuntimeError):
+            pv_spectra.update_spectrum(spectrum, 0.3, [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
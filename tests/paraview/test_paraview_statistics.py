@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+
+# Internal imports
+import postprocessing.paraview.statistics as pv_statistics
+
+
+class TestParaviewStatistics(unittest.TestCase):
+    def setUp(self):
+        # Small fluctuations about a large mean, as for loads of a steady flow
+        self.values = 1e6 + np.random.default_rng(0).normal(size=(200, 5, 2))
+
+    def test_update_statistics(self):
+        """
+        Tests that the online update matches the statistics of all time steps
+        held at once, with the summary columns interleaved per quantity.
+        """
+        statistics = pv_statistics.create_statistics()
+        for values in self.values:
+            pv_statistics.update_statistics(statistics, values)
+        summary = pv_statistics.summarize_statistics(statistics)
+
+        self.assertEqual(np.shape(summary), (5, 8))
+        self.assertEqual(pv_statistics.get_statistics_fields(["A", "B"])[4:6], ["B_mean", "B_std"])
+        np.testing.assert_allclose(summary[:, 0::4], np.mean(self.values, axis=0), rtol=1e-12)
+        np.testing.assert_allclose(summary[:, 1::4], np.std(self.values, axis=0), rtol=1e-8)
+        np.testing.assert_array_equal(summary[:, 2::4], np.min(self.values, axis=0))
+        np.testing.assert_array_equal(summary[:, 3::4], np.max(self.values, axis=0))
+
+        with self.assertRaises(RuntimeError):
+            pv_statistics.update_statistics(statistics, np.zeros((4, 2)))
+
+    def test_merge_statistics(self):
+        """
+        Tests that merging the statistics of interleaved subsets of the time
+        steps, as computed by worker processes, matches a single pass, and
+        that NaN values are skipped.
+        """
+        self.values[:50, 0, 0] = np.nan
+        subsets = []
+        for k in range(3):
+            statistics = pv_statistics.create_statistics()
+            for values in self.values[k::3]:
+                pv_statistics.update_statistics(statistics, values)
+            subsets.append(statistics)
+
+        statistics = pv_statistics.create_statistics()
+        for subset in subsets:
+            statistics = pv_statistics.merge_statistics(statistics, subset)
+        summary = pv_statistics.summarize_statistics(statistics)
+
+        self.assertEqual(statistics["count"][0, 0], 150)
+        np.testing.assert_allclose(summary[:, 0::4], np.nanmean(self.values, axis=0), rtol=1e-12)
+        np.testing.assert_allclose(summary[:, 1::4], np.nanstd(self.values, axis=0), rtol=1e-8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+import numpy as np
+
+# Internal imports
+import postprocessing.paraview.store as pv_store
+
+
+class TestStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = pv_store.get_store_directory(self.directory.name, "force_distribution")
+        self.stations = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        pv_store.create_store(self.store, ["Force"], self.stations, [0.5, 1.0, 1.5])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_store(self):
+        """
+        Tests that the chunks of a store are assembled into a single time x
+        station x quantity array, with the newest chunk holding a time step
+        taking precedence and missing time steps filled with NaN.
+        """
+        pv_store.write_chunk(self.store, [(0, np.array([[1.0], [2.0]]), "a"), (2, np.array([[3.0], [4.0]]), "b")])
+        pv_store.write_chunk(self.store, [(2, np.array([[5.0], [6.0]]), "c")])
+
+        results = pv_store.load_store(self.store)
+        self.assertEqual(results["fields"], ["Force"])
+        self.assertEqual(results["times"], [0.5, 1.0, 1.5])
+        np.testing.assert_array_equal(results["stations"], self.stations)
+        np.testing.assert_array_equal(results["values"][:, :, 0], [[1.0, 2.0], [np.nan, np.nan], [5.0, 6.0]])
+        self.assertEqual(pv_store.load_signatures(self.store), {0: "a", 2: "c"})
+
+    def test_buffer_chunk(self):
+        """
+        Tests that buffered time steps are written in chunks of CHUNK_SIZE.
+        """
+        buffer = []
+        for i in range(pv_store.CHUNK_SIZE + 1):
+            pv_store.buffer_chunk(self.store, buffer, i % 3, np.ones((2, 1)) * i)
+        self.assertEqual(len(pv_store.get_chunk_files(self.store)), 1)
+        self.assertEqual(len(buffer), 1)
+
+        pv_store.write_chunk(self.store, buffer)
+        self.assertEqual(len(pv_store.get_chunk_files(self.store)), 2)
+        self.assertEqual(pv_store.load_store(self.store)["values"][pv_store.CHUNK_SIZE % 3, 0, 0], pv_store.CHUNK_SIZE)
+
+    def test_sections(self):
+        """
+        Tests that sections with different numbers of points are padded with
+        NaN.
+        """
+        values = pv_store.stack_sections([np.ones((3, 3)), 2 * np.ones((2, 3))])
+        self.assertEqual(values.shape, (2, 3, 3))
+        self.assertTrue(np.all(np.isnan(values[1, 2, :])))
+
+        pv_store.write_chunk(self.store, [(1, values, "")])
+        pv_store.write_chunk(self.store, [(0, values[:, :2, :], "")])
+        results = pv_store.load_store(self.store)
+        self.assertEqual(results["values"].shape, (3, 2, 3, 3))
+        np.testing.assert_array_equal(results["values"][1], values)
+        self.assertTrue(np.all(np.isnan(results["values"][0, :, 2, :])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Internal imports
+import postprocessing.paraview.surface as pv_surface
+import postprocessing.paraview.manifest as pv_manifest
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = os.path.join(self.directory.name, "surface_cache")
+        os.makedirs(self.cache)
+
+        # Two triangles sharing an edge, with a pressure per face and time step
+        self.points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]])
+        pv_surface.save_array(self.cache, "points", self.points)
+        pv_surface.save_array(self.cache, "connectivity", np.array([0, 1, 2, 1, 3, 2]))
+        pv_surface.save_array(self.cache, "offsets", np.array([0, 3, 6]))
+        for i in range(2):
+            pv_surface.save_array(self.cache, "cell_p", np.array([1.0, 2.0]) * (i + 1), i)
+        self.metadata = {
+            "times": [0.5, 1.0],
+            "patches": "group/wall",
+            "cell_arrays": ["p"],
+            "point_arrays": [],
+            "moving_mesh": False,
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_surface(self):
+        """
+        Tests that a cache is only recognized once its metadata is written, and
+        that the arrays of each time step are loaded back memory mapped.
+        """
+        self.assertFalse(pv_surface.is_surface_cache(self.cache))
+        pv_surface.save_cache_metadata(self.cache, self.metadata)
+        self.assertTrue(pv_surface.is_surface_cache(self.cache))
+
+        surface = pv_surface.load_surface(self.cache, 1)
+        self.assertIsInstance(surface["points"], np.memmap)
+        np.testing.assert_array_equal(surface["points"], self.points)
+        np.testing.assert_array_equal(surface["offsets"], [0, 3, 6])
+        np.testing.assert_array_equal(surface["cell_arrays"]["p"], [2.0, 4.0])
+
+    def test_signature(self):
+        """
+        Tests that the signature of a cached time step only depends on the
+        arrays of that time step.
+        """
+        pv_surface.save_cache_metadata(self.cache, self.metadata)
+        input_file = os.path.relpath(self.cache)
+        signature = pv_manifest.compute_signature(input_file, 0.5, ["p"], {})
+        signature_other = pv_manifest.compute_signature(input_file, 1.0, ["p"], {})
+
+        os.utime(os.path.join(self.cache, "cell_p_1.npy"), ns=(0, 0))
+        self.assertEqual(signature, pv_manifest.compute_signature(input_file, 0.5, ["p"], {}))
+        self.assertNotEqual(signature_other, pv_manifest.compute_signature(input_file, 1.0, ["p"], {}))
+
+
+class TestStitchSurfaces(unittest.TestCase):
+    def test_stitch_surfaces(self):
+        """
+        Tests that the surfaces of two processors sharing an edge are stitched
+        with the shared points merged and numbered by first occurrence.
+        """
+        first = {
+            "points": np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]),
+            "connectivity": np.array([0, 1, 2, 3]),
+            "offsets": np.array([0, 4]),
+            "cell_arrays": {"p": np.array([1.0]), "U": np.array([[1.0, 0.0, 0.0]])},
+            "point_arrays": {
+                "p": np.array([1.0, 1.0, 1.0, 1.0]),
+                "U": np.tile([1.0, 0.0, 0.0], (4, 1)),
+                "k": np.ones(4),
+            },
+        }
+        second = {
+            "points": np.array([[2.0, 1.0, 0.0], [1.0, 1.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]),
+            "connectivity": np.array([2, 3, 0, 1]),
+            "offsets": np.array([0, 4]),
+            "cell_arrays": {"p": np.array([2.0]), "U": np.array([[0.0, 2.0, 0.0]])},
+            "point_arrays": {
+                "p": np.array([2.0, 2.0, 2.0, 2.0]),
+                "U": np.tile([0.0, 2.0, 0.0], (4, 1)),
+                "k": np.arange(4.0),
+            },
+        }
+        empty = {
+            "points": np.zeros((0, 3)),
+            "connectivity": np.zeros(0, dtype=np.int64),
+            "offsets": np.zeros(1, dtype=np.int64),
+            "cell_arrays": {},
+            "point_arrays": {},
+        }
+
+        surface = pv_surface.stitch_surfaces([first, empty, second])
+        np.testing.assert_array_equal(surface["points"], np.concatenate([first["points"], second["points"][[0, 3]]]))
+        np.testing.assert_array_equal(surface["connectivity"], [0, 1, 2, 3, 1, 5, 4, 2])
+        np.testing.assert_array_equal(surface["offsets"], [0, 4, 8])
+        np.testing.assert_array_equal(surface["cell_arrays"]["p"], [1.0, 2.0])
+        np.testing.assert_array_equal(surface["point_arrays"]["p"], [1.0, 1.5, 1.5, 1.0, 2.0, 2.0])
+        np.testing.assert_array_equal(
+            surface["point_arrays"]["U"][[0, 1, 5]], [[1.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0, 2, 0]]
+        )
+
+        # Arrays without face values keep the value of their first occurrence
+        np.testing.assert_array_equal(surface["point_arrays"]["k"], [1.0, 1.0, 1.0, 1.0, 0.0, 3.0])
+
+        with self.assertRaises(RuntimeError):
+            pv_surface.stitch_surfaces([empty])
+
+
+class TestPointsChecksum(unittest.TestCase):
+    def test_points_checksum(self):
+        """
+        Tests that the checksum only matches the same points, in the same
+        number.
+        """
+        points = np.random.default_rng(0).normal(size=(10, 3))
+        checksum = pv_surface.get_points_checksum(points)
+
+        self.assertEqual(checksum, pv_surface.get_points_checksum(points.copy(order="F")))
+        moved = points.copy()
+        moved[3, 1] += 1e-12
+        self.assertNotEqual(checksum, pv_surface.get_points_checksum(moved))
+        self.assertNotEqual(checksum, pv_surface.get_points_checksum(points[:9]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+import unittest
+import numpy as np
+
+# VTK is only needed to compare with the sections cut by Paraview
+try:
+    import vtk
+    from vtk.util import numpy_support as vtk_np
+except ImportError:
+    vtk = None
+
+# Internal imports
+import postprocessing.utils as utils
+import postprocessing.paraview.utils as pv_utils
+
+
+def circle_sections(offsets, n_points=32, radius=0.5):
+    """
+    Generates the line cells of circular sections stacked along the Z axis,
+    shuffled as they would be returned by a multi-plane slice.
+
+    Parameters
+    ----------
+    offsets : list
+        Z coordinates of the sections.
+    n_points : int
+        Number of points per section.
+    radius : float
+        Radius of the sections.
+
+    Returns
+    -------
+    ndarray
+        Point coordinates.
+    ndarray
+        Line cells as point index pairs.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, n_points, endpoint=False)
+    points = []
+    lines = []
+    for k, z in enumerate(offsets):
+        points.append(np.stack((radius * np.cos(theta), radius * np.sin(theta), np.full(n_points, z)), axis=1))
+        i = np.arange(n_points) + k * n_points
+        lines.append(np.stack((i, np.roll(i, -1)), axis=1))
+    lines = np.concatenate(lines)
+
+    return np.concatenate(points), lines[np.random.default_rng(0).permutation(np.size(lines, 0))]
+
+
+class TestSections(unittest.TestCase):
+    def test_split_sections(self):
+        """
+        Tests that lines are assigned to the plane they were cut from, with
+        repeated offsets sharing the same section.
+        """
+        offsets = [0.0, 0.3, 0.1, 0.3]
+        points, lines = circle_sections(np.unique(offsets))
+        groups = pv_utils.split_sections(points, lines, np.zeros(3), np.array([0.0, 0.0, 1.0]), offsets)
+
+        self.assertEqual(len(groups), len(offsets))
+        for group, z in zip(groups, offsets):
+            self.assertEqual(np.size(group), 32)
+            np.testing.assert_allclose(points[lines[group], 2], z)
+
+    def test_order_section(self):
+        """
+        Tests that a closed section is ordered into a single chain with the
+        correct arc length.
+        """
+        points, lines = circle_sections([0.0])
+        coords, arclen, arrays = pv_utils.order_section(points, lines, {"z": points[:, 2]})
+
+        self.assertEqual(np.size(coords, 0), 32)
+        self.assertTrue(np.all(np.diff(arclen) > 0.0))
+        np.testing.assert_allclose(np.linalg.norm(np.diff(coords, axis=0), axis=1), np.diff(arclen))
+        np.testing.assert_allclose(arrays["z"], 0.0)
+
+    def test_integrate_lines(self):
+        """
+        Tests line integration of scalar and vector point arrays against the
+        perimeter of the section.
+        """
+        points, lines = circle_sections([0.0], n_points=256)
+        perimeter = 256 * 2.0 * 0.5 * np.sin(np.pi / 256)
+
+        self.assertAlmostEqual(pv_utils.integrate_lines(points, lines, np.ones(256)), perimeter)
+        np.testing.assert_allclose(pv_utils.integrate_lines(points, lines, np.ones((256, 3))), perimeter)
+
+    def test_integrate_loads(self):
+        """
+        Tests that the forces along several directions and the moments about
+        several points of a uniform load are integrated in a single pass.
+        """
+        points, lines = circle_sections([0.0], n_points=256)
+        perimeter = 256 * 2.0 * 0.5 * np.sin(np.pi / 256)
+        force = np.tile([0.0, 1.0, 0.0], (256, 1))
+
+        directions = utils.check_input_vectors(["Y+", "X+", "0", "0.6", "0.8"], "force direction")
+        moment_points = utils.check_input_vectors([[0.0, 0.0, 0.0], [-1.0, 0.0, 0.0]], "moment point", False)
+        loads = pv_utils.integrate_loads(points, lines, force, directions, moment_points, np.array([0.0, 0.0, 1.0]))
+
+        np.testing.assert_allclose(loads, [perimeter, 0.0, 0.6 * perimeter, 0.0, perimeter], atol=1e-12)
+
+    def test_merge_points(self):
+        """
+        Tests that a section split between two ranks, with duplicated points
+        at the boundary, is merged back into a single chain.
+        """
+        points, lines = circle_sections([0.0], n_points=16)
+        lines = np.sort(lines, axis=1)
+        half = lines[:, 0] < 8
+
+        # Duplicate the points of the second half of the lines
+        points = np.concatenate((points, points))
+        lines = np.concatenate((lines[half], lines[~half] + 16))
+
+        kept, lines = pv_utils.merge_points(points, lines)
+        coords, _, _ = pv_utils.order_section(points[kept, :], lines)
+
+        self.assertEqual(np.size(kept), 16)
+        self.assertEqual(len(pv_utils.chain_lines(lines)), 1)
+        self.assertEqual(np.size(coords, 0), 16)
+
+
+@unittest.skipIf(vtk is None, "requires vtk")
+class TestLines(unittest.TestCase):
+    def test_get_lines(self):
+        """
+        Tests that the line cells and point arrays of a dataset are converted
+        to numpy arrays, skipping other cells.
+        """
+        points = vtk.vtkPoints()
+        for point in [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]:
+            points.InsertNextPoint(point)
+        data = vtk.vtkUnstructuredGrid()
+        data.SetPoints(points)
+        data.InsertNextCell(vtk.VTK_LINE, 2, [0, 1])
+        data.InsertNextCell(vtk.VTK_VERTEX, 1, [2])
+        data.InsertNextCell(vtk.VTK_LINE, 2, [1, 2])
+        pressure = vtk.vtkDoubleArray()
+        pressure.SetName("p")
+        for value in [1.0, 2.0, 3.0]:
+            pressure.InsertNextValue(value)
+        data.GetPointData().AddArray(pressure)
+
+        points, lines, arrays = pv_utils.get_lines(data, ["p"])
+        np.testing.assert_array_equal(lines, [[0, 1], [1, 2]])
+        np.testing.assert_array_equal(arrays["p"], [1.0, 2.0, 3.0])
+        self.assertEqual(np.size(points, 0), 3)
+
+        with self.assertRaises(RuntimeError):
+            pv_utils.get_lines(data, ["U"])
+
+    def test_get_lines_blocks(self):
+        """
+        Tests that a section split into many blocks is assembled into the
+        same chain as the unsplit section, with its point arrays.
+        """
+        points, lines = circle_sections([0.0], n_points=64)
+        lines = lines[np.argsort(np.min(lines, axis=1))]
+        data = vtk.vtkMultiBlockDataSet()
+        for k, block_lines in enumerate(np.array_split(lines, 16)):
+            used, inverse = np.unique(block_lines, return_inverse=True)
+            block = vtk.vtkPolyData()
+            block.SetPoints(vtk.vtkPoints())
+            block.GetPoints().SetData(vtk_np.numpy_to_vtk(points[used, :], deep=True))
+            cells = vtk.vtkCellArray()
+            for line in inverse.reshape(-1, 2):
+                cells.InsertNextCell(2, line.tolist())
+            block.SetLines(cells)
+            force = vtk_np.numpy_to_vtk(points[used, :] * 2.0, deep=True)
+            force.SetName("forcePerS")
+            block.GetPointData().AddArray(force)
+            data.SetBlock(k, block)
+
+        points, lines, arrays = pv_utils.get_lines(data, ["forcePerS"])
+        kept, lines = pv_utils.merge_points(points, lines)
+
+        self.assertEqual(np.size(kept), 64)
+        self.assertEqual(len(pv_utils.chain_lines(lines)), 1)
+        np.testing.assert_allclose(arrays["forcePerS"], 2.0 * points)
+
+
+class TestStations(unittest.TestCase):
+    def test_refine_stations(self):
+        """
+        Tests that adaptive refinement of a load with a steep tip drop matches
+        the integral of a dense uniform distribution with far fewer stations.
+        """
+
+        def load(x):
+            z = x[:, 2]
+            return np.sqrt(np.clip(1.0 - z**8, 0.0, None))[:, np.newaxis]
+
+        def integrate(z, values):
+            return np.sum(0.5 * (values[1:] + values[:-1]) * np.diff(z))
+
+        x0 = np.stack((np.zeros(11), np.zeros(11), np.linspace(0.0, 1.0, 11)), axis=1)
+        x, values = pv_utils.refine_stations(load, x0, tolerance=0.02)
+
+        x_dense = np.stack((np.zeros(4001), np.zeros(4001), np.linspace(0.0, 1.0, 4001)), axis=1)
+        dense = integrate(x_dense[:, 2], load(x_dense)[:, 0])
+
+        self.assertLess(np.size(x, 0), 400)
+        self.assertTrue(np.all(np.diff(x[:, 2]) > 0))
+        np.testing.assert_allclose(values, load(x))
+        self.assertAlmostEqual(integrate(x[:, 2], values[:, 0]), dense, places=3)
+
+        # The station budget is never exceeded
+        x, values = pv_utils.refine_stations(load, x0, tolerance=0.001, max_stations=50)
+        self.assertEqual(np.size(x, 0), 50)
+        self.assertEqual(np.size(values, 0), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
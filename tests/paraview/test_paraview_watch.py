@@ -0,0 +1,105 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Internal imports
+import postprocessing.paraview.watch as pv_watch
+
+
+def write_time_directory(case_directory, time_directory, fields, age=0.0):
+    """
+    Write a stand-in time directory, with field files last modified age
+    seconds ago.
+    """
+    os.makedirs(os.path.join(case_directory, time_directory), exist_ok=True)
+    for field in fields:
+        path = os.path.join(case_directory, time_directory, field)
+        with open(path, "w") as f:
+            f.write("{} {}\n".format(field, time_directory))
+        os.utime(path, (time.time() - age, time.time() - age))
+
+
+class TestWatch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_file = os.path.join(self.directory.name, "case.foam")
+        open(self.input_file, "w").close()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_poll_times(self):
+        """
+        Tests that only the time directories holding the fields, in every
+        processor directory, and whose files settled are reported, once each.
+        """
+        watch = pv_watch.create_watch(self.input_file, ["forcePerS"], settle_time=1.0)
+        write_time_directory(self.directory.name, "0", ["U"], age=10.0)
+        write_time_directory(self.directory.name, "0.1", ["U", "forcePerS"], age=10.0)
+        write_time_directory(self.directory.name, "0.2", ["U", "forcePerS"])
+        self.assertEqual(pv_watch.poll_times(watch), [0.1])
+
+        # A time directory still written to is held back until it is unchanged between polls
+        write_time_directory(self.directory.name, "0.2", ["U", "forcePerS"], age=10.0)
+        self.assertEqual(pv_watch.poll_times(watch), [])
+        self.assertEqual(pv_watch.poll_times(watch), [0.2])
+        self.assertEqual(pv_watch.poll_times(watch), [])
+
+        # A decomposed case needs the time directory in every processor directory
+        watch = pv_watch.create_watch(self.input_file, ["forcePerS"], "decomposed", settle_time=1.0)
+        write_time_directory(os.path.join(self.directory.name, "processor0"), "0.3", ["forcePerS"], age=10.0)
+        os.makedirs(os.path.join(self.directory.name, "processor1"))
+        self.assertEqual(pv_watch.poll_times(watch), [])
+        write_time_directory(os.path.join(self.directory.name, "processor1"), "0.3", ["forcePerS"], age=10.0)
+        self.assertEqual(pv_watch.poll_times(watch), [0.3])
+
+    def test_watch_case(self):
+        """
+        Tests that every time directory written by a stand-in solver is
+        processed once, in order, after its fields are fully written.
+        """
+        values = [0.1, 0.2, 0.3, 0.4, 0.5]
+
+        def solver():
+            for value in values:
+                # Write the field in two parts, as a solver flushing a large file
+                path = os.path.join(self.directory.name, "{:g}".format(value), "forcePerS")
+                os.makedirs(os.path.dirname(path))
+                with open(path, "w") as f:
+                    f.write("start\n")
+                    f.flush()
+                    time.sleep(0.1)
+                    f.write("end\n")
+
+        batches = []
+
+        def job(input_file=None, time_values=None):
+            for value in time_values:
+                with open(os.path.join(self.directory.name, "{:g}".format(value), "forcePerS"), "r") as f:
+                    self.assertEqual(f.read(), "start\nend\n")
+            batches.append(time_values)
+
+        thread = threading.Thread(target=solver)
+        thread.start()
+        with mock.patch.object(pv_watch.pv_daemon, "get_job_function", return_value=job):
+            pv_watch.watch_case(
+                "job",
+                {"input_file": self.input_file},
+                ["forcePerS"],
+                poll_interval=0.02,
+                settle_time=0.3,
+                watch_timeout=1.0,
+            )
+        thread.join()
+
+        self.assertEqual(sum(batches, []), values)
+
+        with self.assertRaises(ValueError):
+            pv_watch.watch_case("job", {"input_file": self.input_file, "statistics": "True"}, ["forcePerS"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import io
+import time
+import threading
+import unittest
+import contextlib
+
+# Internal imports
+import postprocessing.paraview.writer as pv_writer
+
+
+class TestWriter(unittest.TestCase):
+    def test_order(self):
+        """
+        Tests that the writes run in the order they are submitted, and that
+        they are all finished once the writer is stopped.
+        """
+        written = []
+
+        def write(value, delay=0.0):
+            time.sleep(delay)
+            written.append(value)
+
+        writer = pv_writer.start_writer(max_pending=2)
+        for i in range(10):
+            pv_writer.submit_write(writer, write, i, delay=0.001)
+            self.assertLessEqual(writer["queue"].qsize(), 2)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            pv_writer.stop_writer(writer, verbose=True)
+        self.assertEqual(written, list(range(10)))
+        self.assertIn("Wrote 10 outputs", output.getvalue())
+
+    def test_error(self):
+        """
+        Tests that a failed write skips the following ones and is raised when
+        the writer is stopped.
+        """
+        written = []
+        submitted = threading.Event()
+
+        def write(value):
+            submitted.wait()
+            if value == 1:
+                raise OSError("Disk full")
+            written.append(value)
+
+        writer = pv_writer.start_writer()
+        for i in range(3):
+            pv_writer.submit_write(writer, write, i)
+        submitted.set()
+
+        with self.assertRaises(RuntimeError) as context:
+            pv_writer.stop_writer(writer)
+        self.assertIsInstance(context.exception.__cause__, OSError)
+        self.assertEqual(written, [0])
+
+        # Writes submitted after the failure is known are refused
+        with self.assertRaises(RuntimeError):
+            pv_writer.submit_write(writer, write, 3)
+
+    def test_failed_computation(self):
+        """
+        Tests that the writes queued before the computation fails are
+        finished, and that the error of the computation is raised ahead of a
+        write error, which is printed.
+        """
+        written = []
+
+        def write(value):
+            if value == 2:
+                raise OSError("Disk full")
+            written.append(value)
+
+        output = io.StringIO()
+        with self.assertRaises(ValueError), contextlib.redirect_stdout(output):
+            writer = pv_writer.start_writer()
+            completed = False
+            try:
+                for i in range(5):
+                    if i == 3:
+                        raise ValueError("Section not found")
+                    pv_writer.submit_write(writer, write, i)
+                completed = True
+            finally:
+                pv_writer.stop_writer(writer, raise_errors=completed)
+
+        self.assertEqual(written, [0, 1])
+        self.assertFalse(writer["thread"].is_alive())
+        self.assertIn("Warning: A background write failed: Disk full", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()